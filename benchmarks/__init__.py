@@ -0,0 +1 @@
+"""Performans ölçüm betikleri. Depo kökünden ``python -m benchmarks.<betik>`` ile çalıştırılır."""
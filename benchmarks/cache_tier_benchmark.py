@@ -0,0 +1,150 @@
+"""SQLite cache tier throughput: pooled WAL store vs connect-per-call.
+
+Usage::
+
+    python -m benchmarks.cache_tier_benchmark --threads 8 --seconds 5
+
+Both stores sit behind a ``TieredCache`` whose memory tier is disabled
+(``max_bytes=0``), so every get/set reaches SQLite. Each store is measured
+twice: called directly from N threads, and through a threaded werkzeug
+server running a small Flask app, with N client processes issuing requests
+(half writes, half reads; separate processes keep the clients from
+competing with the server for the GIL).
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+import requests
+from flask import Flask, jsonify
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from tiered_cache import SQLiteStore, TieredCache
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class ConnectPerCallStore:
+    """The previous cache.db access pattern: new connection and commit per call."""
+
+    def __init__(self, path):
+        self.path = path
+        self.commits = 0
+        self._execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL, created_at REAL)')
+
+    def _execute(self, sql, params=()):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+            self.commits += 1
+        finally:
+            conn.close()
+
+    def get(self, key, now):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            return conn.execute('SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?', (key, now)).fetchone()
+        finally:
+            conn.close()
+
+    def set(self, key, text, expires_at, created_at):
+        self._execute('INSERT OR REPLACE INTO cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)',
+                      (key, text, expires_at, created_at))
+
+
+def _operation(cache, rng, keys):
+    key = rng.choice(keys)
+    if rng.random() < 0.5:
+        cache.set(key, {"key": key, "payload": "x" * 512}, ttl=300)
+    else:
+        cache.get(key)
+
+
+def run_direct(cache, threads, seconds, keys):
+    deadline = time.monotonic() + seconds
+    counts = []
+
+    def worker():
+        rng = random.Random()
+        n = 0
+        while time.monotonic() < deadline:
+            _operation(cache, rng, keys)
+            n += 1
+        counts.append(n)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return sum(counts) / seconds
+
+
+def _http_client(base, seconds, keys):
+    rng = random.Random()
+    session = requests.Session()
+    deadline = time.monotonic() + seconds
+    n = 0
+    while time.monotonic() < deadline:
+        key = rng.choice(keys)
+        if rng.random() < 0.5:
+            session.put(base + key)
+        else:
+            session.get(base + key)
+        n += 1
+    return n
+
+
+def run_http(cache, threads, seconds, keys):
+    app = Flask(__name__)
+
+    @app.route('/item/<key>', methods=['PUT'])
+    def put_item(key):
+        cache.set(key, {"key": key, "payload": "x" * 512}, ttl=300)
+        return jsonify({"ok": True})
+
+    @app.route('/item/<key>')
+    def get_item(key):
+        return jsonify(cache.get(key))
+
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietRequestHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    base = f'http://127.0.0.1:{server.server_port}/item/'
+    with multiprocessing.Pool(threads) as pool:
+        counts = pool.starmap(_http_client, [(base, seconds, keys)] * threads)
+    server.shutdown()
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--keys', type=int, default=1000)
+    args = parser.parse_args()
+    keys = [f'key-{i}' for i in range(args.keys)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, make_store in [
+            ('connect-per-call', ConnectPerCallStore),
+            ('pooled WAL + group commit', SQLiteStore),
+        ]:
+            for mode, run in [('direct', run_direct), ('flask', run_http)]:
+                store = make_store(os.path.join(tmp, f'{label[:6]}-{mode}.db'))
+                cache = TieredCache(max_bytes=0, store=store)
+                ops = run(cache, args.threads, args.seconds, keys)
+                print(f'{label:<28} {mode:<7} {ops:9.0f} ops/s  ({store.commits} commits)')
+
+
+if __name__ == '__main__':
+    main()
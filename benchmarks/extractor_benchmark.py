@@ -0,0 +1,144 @@
+"""Tek geçişli çıkarıcıyı eski scrape mantığıyla karşılaştırır.
+
+Kullanım::
+
+    python -m benchmarks.extractor_benchmark --repeat 20
+
+App Store yapısında ve genel bir site yapısında iki sentetik sayfa üretir,
+her sayfayı her iki çıkarıcıyla işler, sonuçların aynı olduğunu doğrular ve
+sayfa başına CPU süresini (ayrıştırma dahil) raporlar.
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from bs4 import BeautifulSoup
+
+import extractor
+from benchmarks import legacy_extractor
+
+APP_STORE_URL = 'https://itunes.apple.com/tr/app/ornek-uygulama/id123456789?mt=12'
+GENERIC_URL = 'https://example.com/apps/ornek-uygulama'
+
+FILLER = 'Çok yönlü bir araç; dosyaları düzenler, ağ bağlantısını izler ve iş akışını hızlandırır. '
+
+
+def _filler_blocks(count):
+    blocks = []
+    for i in range(count):
+        blocks.append(
+            f'<div class="l-row"><div class="l-column small-12"><div class="we-clamp">'
+            f'<span class="badge">Öğe {i}</span><a class="link" href="/tr/story/{i}">Hikâye {i}</a>'
+            f'<ul><li>{FILLER[:40]}</li><li>Puan {i % 5}.{i % 10}</li></ul></div></div></div>'
+        )
+    return ''.join(blocks)
+
+
+def build_app_store_page(screenshots=10, filler_blocks=400):
+    """App Store ürün sayfasına benzeyen bir HTML belgesi üretir."""
+    pictures = []
+    for i in range(screenshots):
+        base = f'https://is1-ssl.mzstatic.com/image/thumb/PurpleSource{i}/v4/ab/cd/Mac_Screenshot_{i}'
+        pictures.append(
+            '<picture class="we-artwork we-artwork--screenshot-platform-mac">'
+            f'<source srcset="{base}.png/643x0w.webp 643w, {base}.png/1286x0w.webp 1286w" type="image/webp">'
+            f'<source srcset="{base}.png/643x0w.png 643w, {base}.png/1286x0w.png 1286w" type="image/png">'
+            f'<img src="{base}.png/643x0w.png" alt=""></picture>'
+        )
+    description = ''.join(f'<p>{FILLER * 3} Paragraf {i}.</p>' for i in range(6))
+    return f'''<!DOCTYPE html><html lang="tr"><head>
+<title>Örnek Uygulama - App Store</title>
+<meta name="description" content="Örnek Uygulama App Store'da. {FILLER}">
+<meta property="og:title" content="Örnek Uygulama">
+<meta property="og:description" content="{FILLER}">
+<meta property="og:image" content="https://is1-ssl.mzstatic.com/image/thumb/AppIcon/1200x630wa.png">
+<link rel="icon" href="/favicon.ico"></head><body>
+<div class="we-localnav">{_filler_blocks(filler_blocks // 4)}</div>
+<section class="l-content-width section section--bordered" data-test="product-description">
+<div class="we-truncate we-truncate--multi-line">{description}</div></section>
+<section class="l-content-width section section--bordered whats-new">
+<div class="l-row whats-new__content"><div class="l-column small-12 whats-new__content">
+<div class="we-truncate we-truncate--multi-line"><p>PATCH HIGHTLIGHTS</p>
+<p>• Hata düzeltmeleri ve performans iyileştirmeleri.</p><p>• Yeni kısayollar eklendi.</p></div></div>
+<time data-test-we-datetime datetime="2024-05-01">1 May 2024</time>
+<p class="l-column small-6 medium-12 whats-new__latest__version">Sürüm 5.4.1</p></div></section>
+<section class="l-content-width section section--bordered">{''.join(pictures)}</section>
+<div class="l-content-width">{_filler_blocks(filler_blocks)}</div>
+<section class="l-content-width section section--bordered section--information"><dl class="information-list">
+<div class="information-list__item"><dt class="information-list__item__term">Satıcı</dt>
+<dd class="information-list__item__definition">Örnek Yazılım A.Ş.</dd></div>
+<div class="information-list__item"><dt class="information-list__item__term">Boyut</dt>
+<dd class="information-list__item__definition" aria-label="48,2 megabyte">48,2 MB</dd></div>
+<div class="information-list__item"><dt class="information-list__item__term">Kategori</dt>
+<dd class="information-list__item__definition"><a class="link" href="https://itunes.apple.com/tr/genre/mac-productivity/id12014">Productivity</a></dd></div>
+<div class="information-list__item"><dt class="information-list__item__term">Uyumluluk</dt>
+<dd class="information-list__item__definition"><dl class="information-list__item__definition__item">
+<dt class="information-list__item__definition__item__term">Mac</dt>
+<dd class="information-list__item__definition__item__definition">macOS 12.0 veya üstü gerekir.</dd></dl></dd></div>
+</dl></section></body></html>'''
+
+
+def build_generic_page(screenshots=8, filler_blocks=400):
+    """App Store yapısı olmayan, geri dönüş (fallback) yollarını çalıştıran bir sayfa üretir."""
+    images = ''.join(f'<img data-src="/media/shot-{i}.png" src="data:image/gif;base64,R0lGOD">' for i in range(screenshots))
+    return f'''<!DOCTYPE html><html><head><title>Örnek Uygulama İndir</title>
+<link rel="shortcut icon" href="/static/icon.png"></head><body>
+<header class="site-header"><div class="logo"><img src="/static/logo.svg"></div></header>
+<main>{_filler_blocks(filler_blocks)}
+<div class="app-summary"><h2>Örnek Uygulama</h2><p>{FILLER * 2}</p></div>
+<div class="gallery">{images}</div>
+<div class="meta"><div>Version</div><div>3.2.0</div><div>File size</div><div>120 MB</div></div>
+<h3>Yenilikler</h3><div>Karanlık mod ve yeni dışa aktarma seçenekleri eklendi.</div>
+<div>Sistem gereksinimleri</div><div>Windows 10 veya macOS 12, 4 GB RAM</div>
+</main></body></html>'''
+
+
+def _normalized(result):
+    # Eski kod mzstatic görsellerini set ile tekilleştirdiği için sıra tutarsızdır
+    return dict(result, internalImages=sorted(result['internalImages']))
+
+
+def _time_per_page(func, repeat):
+    with contextlib.redirect_stdout(io.StringIO()):  # Eski koddaki print çıktıları ölçümü bozmasın
+        func()
+        start = time.process_time()
+        for _ in range(repeat):
+            func()
+        return (time.process_time() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--filler-blocks', type=int, default=400, help='Sayfa büyüklüğünü belirleyen dolgu blok sayısı')
+    args = parser.parse_args()
+
+    parsers = ['html.parser']
+    if extractor.resolve_parser('lxml') == 'lxml':
+        parsers.append('lxml')
+
+    pages = [
+        ('app-store', APP_STORE_URL, build_app_store_page(filler_blocks=args.filler_blocks)),
+        ('generic', GENERIC_URL, build_generic_page(filler_blocks=args.filler_blocks)),
+    ]
+    for label, url, html in pages:
+        content = html.encode('utf-8')
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = legacy_extractor.extract_app_data(content, url)
+        actual = extractor.extract_app_data(content, url, parser='html.parser')
+        if _normalized(expected) != _normalized(actual):
+            raise SystemExit(f'{label}: çıkarıcı sonuçları farklı\n eski: {expected}\n yeni: {actual}')
+
+        print(f'{label}: {len(content) / 1024:.0f} KB')
+        parse_ms = _time_per_page(lambda: BeautifulSoup(content, 'html.parser'), args.repeat)
+        legacy_ms = _time_per_page(lambda: legacy_extractor.extract_app_data(content, url), args.repeat)
+        print(f'  {"yalnızca ayrıştırma (html.parser)":<34} {parse_ms:8.1f} ms')
+        print(f'  {"eski çıkarıcı":<34} {legacy_ms:8.1f} ms')
+        for name in parsers:
+            ms = _time_per_page(lambda: extractor.extract_app_data(content, url, parser=name), args.repeat)
+            print(f'  {"tek geçiş (" + name + ")":<34} {ms:8.1f} ms  ({legacy_ms / ms:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,772 @@
+"""server.py'deki tek geçişli çıkarıcıdan önceki scrape mantığının kopyası.
+
+Yalnızca karşılaştırma ölçümleri için tutulur; her alan için belgeyi
+yeniden tarayan ``find``/``find_all`` çağrılarını olduğu gibi korur. Özgün
+koddan iki fark vardır: sayfa indirilmez, içerik doğrudan verilir ve
+``extract_mzstatic_images`` tanımlanmadan önce çağrıldığı için oluşan
+``UnboundLocalError`` hatası tanımın yukarı taşınmasıyla giderilmiştir.
+"""
+import re
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+
+def find_by_keyword(soup, keywords, tag_name='div'):
+    """Belirli anahtar kelimeleri içeren metinleri arar."""
+    for keyword in keywords:
+        try:
+            element = soup.find(lambda tag: tag.name == tag_name and keyword in tag.get_text(strip=True).lower())
+            if element:
+                parent_text = element.get_text(separator=' ', strip=True)
+                match = re.search(fr'{re.escape(keyword)}[\s:]*([\d.v\sA-Z]+[a-zA-Z]?)?', parent_text, re.IGNORECASE)
+                if match and match.group(1):
+                    return match.group(1).strip()
+        except Exception:
+            continue
+    return None
+
+
+def get_highest_res_from_srcset(srcset):
+    """srcset içindeki en yüksek çözünürlüklü görseli bulur."""
+    if not srcset:
+        return None
+    
+    highest_res = 0
+    best_url = ''
+    
+    candidates = srcset.split(',')
+    for candidate in candidates:
+        parts = candidate.strip().split()
+        if len(parts) != 2:
+            continue
+            
+        url = parts[0]
+        descriptor = parts[1]
+        
+        if descriptor.endswith('w'):
+            res = int(descriptor[:-1])
+            if res > highest_res:
+                highest_res = res
+                best_url = url
+    
+    # Eğer hiç 'w' tanımlayıcı bulunamazsa, ilk URL'yi al
+    if not best_url and candidates:
+        best_url = candidates[0].strip().split()[0]
+        
+    return best_url
+
+
+def extract_app_data(content, url):
+    """Eski ``scrape_app_data`` gövdesi; indirme yerine hazır sayfa içeriği alır."""
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # --- Temel Bilgiler ---
+    title = soup.find('title').get_text(strip=True) if soup.find('title') else None
+    description_meta = soup.find('meta', attrs={'name': 'description'})
+    og_description = soup.find('meta', property='og:description')
+    og_title = soup.find('meta', property='og:title')
+    og_image = soup.find('meta', property='og:image')
+    icon_link = soup.find('link', rel='icon') or soup.find('link', rel='shortcut icon')
+
+    app_name = og_title['content'] if og_title and og_title.get('content') else title
+    
+    # --- Gelişmiş Açıklama Çekme ---
+    app_description = None
+    
+    # App Store için özel açıklama çekme
+    if 'itunes.apple.com' in url:
+        print("App Store açıklaması aranıyor...")
+        
+        # 1. Önce section elementini ara (en detaylı açıklama)
+        description_section = soup.find('section', attrs={'data-test': 'product-description'})
+        if description_section:
+            # section içindeki tüm paragrafları al
+            paragraphs = description_section.find_all('p')
+            if paragraphs:
+                description_texts = []
+                for p in paragraphs:
+                    text = p.get_text(strip=True)
+                    if text and len(text) > 10:  # Çok kısa metinleri filtrele
+                        description_texts.append(text)
+                if description_texts:
+                    app_description = '\n\n'.join(description_texts)
+                    print(f"Section açıklaması bulundu: {len(app_description)} karakter")
+        
+        # 1.5. Eğer section bulunamadıysa, div class="l-column" ara (App Store yeni yapısı)
+        if not app_description:
+            l_columns = soup.find_all('div', class_='l-column')
+            for column in l_columns:
+                paragraphs = column.find_all('p')
+                if paragraphs:
+                    description_texts = []
+                    for p in paragraphs:
+                        text = p.get_text(strip=True)
+                        if text and len(text) > 20:  # Daha uzun metinleri al
+                            description_texts.append(text)
+                    if description_texts and len('\n\n'.join(description_texts)) > 100:
+                        app_description = '\n\n'.join(description_texts)
+                        print(f"L-column açıklaması bulundu: {len(app_description)} karakter")
+                        break
+        
+        # 2. Eğer section bulunamadıysa, div class="we-truncate" ara
+        if not app_description:
+            truncate_div = soup.find('div', class_='we-truncate')
+            if truncate_div:
+                # we-truncate içindeki tüm paragrafları al
+                paragraphs = truncate_div.find_all('p')
+                if paragraphs:
+                    description_texts = []
+                    for p in paragraphs:
+                        text = p.get_text(strip=True)
+                        if text and len(text) > 10:
+                            description_texts.append(text)
+                    if description_texts:
+                        app_description = '\n\n'.join(description_texts)
+                        print(f"Truncate açıklaması bulundu: {len(app_description)} karakter")
+        
+        # 3. Eğer hala bulunamadıysa, genel paragraf arama
+        if not app_description:
+            # Uzun paragrafları ara
+            all_paragraphs = soup.find_all('p')
+            long_paragraphs = []
+            for p in all_paragraphs:
+                text = p.get_text(strip=True)
+                if text and len(text) > 50:  # En az 50 karakter
+                    long_paragraphs.append(text)
+            
+            if long_paragraphs:
+                # En uzun paragrafı seç
+                app_description = max(long_paragraphs, key=len)
+                print(f"Genel paragraf açıklaması bulundu: {len(app_description)} karakter")
+        
+        # 4. App Store için özel meta description ara
+        if not app_description:
+            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            if meta_desc and meta_desc.get('content'):
+                app_description = meta_desc['content']
+                print(f"Meta description açıklaması bulundu: {len(app_description)} karakter")
+    
+    # Diğer siteler için gelişmiş açıklama çekme
+    if not app_description:
+        print("Genel site açıklaması aranıyor...")
+        
+        # 1. Uzun paragrafları ara
+        all_paragraphs = soup.find_all('p')
+        long_paragraphs = []
+        for p in all_paragraphs:
+            text = p.get_text(strip=True)
+            if text and len(text) > 100:  # En az 100 karakter
+                long_paragraphs.append(text)
+        
+        if long_paragraphs:
+            # En uzun paragrafı seç
+            app_description = max(long_paragraphs, key=len)
+            print(f"Uzun paragraf açıklaması bulundu: {len(app_description)} karakter")
+        
+        # 2. Eğer hala bulunamadıysa, div class'larını ara
+        if not app_description:
+            description_divs = soup.find_all('div', class_=lambda x: x and any(keyword in x.lower() for keyword in ['description', 'content', 'about', 'summary']))
+            for div in description_divs:
+                text = div.get_text(strip=True)
+                if text and len(text) > 50:
+                    app_description = text
+                    print(f"Div açıklaması bulundu: {len(app_description)} karakter")
+                    break
+        
+        # 3. Son fallback - meta tag'ler
+        if not app_description:
+            app_description = (og_description['content'] if og_description and og_description.get('content')
+                               else description_meta['content'] if description_meta and description_meta.get('content') else None)
+            if app_description:
+                print(f"Meta tag açıklaması bulundu: {len(app_description)} karakter")
+    
+    # Açıklamayı temizle ve optimize et
+    if app_description:
+        # Sadece fazla boşlukları temizle, satır sonlarını koru
+        import re
+        app_description = re.sub(r'\s+', ' ', app_description)  # Çoklu boşlukları tek boşluğa çevir
+        app_description = app_description.strip()  # Başta ve sonda boşlukları temizle
+        
+        # Çok kısa açıklamaları filtrele
+        if len(app_description) < 20:
+            app_description = None
+            print("Açıklama çok kısa, atlandı")
+        else:
+            # Maksimum uzunluk sınırı (çok uzun açıklamaları kırp)
+            if len(app_description) > 10000:  # 2000'den 10000'e çıkarıldı
+                app_description = app_description[:10000] + "..."
+                print("Açıklama 10000 karakter ile sınırlandırıldı")
+    
+    print(f"App Name: {app_name}")
+    print(f"App Description Length: {len(app_description) if app_description else 0} karakter")
+    if app_description:
+        print(f"Description Preview: {app_description[:200]}...")
+    
+    image_url = og_image['content'] if og_image and og_image.get('content') else None
+    if not image_url and icon_link and icon_link.get('href'):
+        image_url = urljoin(url, icon_link['href'])
+
+    # --- Sürüm ve Dosya Boyutu ---
+    app_version = None
+    
+    # App Store için spesifik sürüm tespiti
+    # whats-new__latest__version class'ından al
+    version_element = soup.find('p', class_='l-column small-6 medium-12 whats-new__latest__version')
+    if version_element:
+        app_version = version_element.get_text(strip=True)
+        print(f"App Store sürüm bulundu: {app_version}")
+    else:
+        # Fallback - genel sürüm arama
+        version_keywords = ['version', 'sürüm', 'current version', 'v.', 'ver.']
+        app_version = find_by_keyword(soup, version_keywords, 'div') or find_by_keyword(soup, version_keywords, 'span')
+        print(f"Genel sürüm arama sonucu: {app_version}")
+    
+    # App Store için spesifik boyut tespiti
+    app_file_size = None
+    size_element = soup.find('dd', class_='information-list__item__definition', attrs={'aria-label': True})
+    if size_element:
+        aria_label = size_element.get('aria-label', '').lower()
+        if 'megabyte' in aria_label or 'gigabyte' in aria_label:
+            app_file_size = size_element.get_text(strip=True)
+    
+    # Eğer App Store formatında bulunamadıysa, genel arama yap
+    if not app_file_size:
+        # Fallback - genel boyut arama
+        size_keywords = ['size', 'boyut', 'file size', 'mb', 'gb', 'kb', 'megabyte', 'gigabyte']
+        app_file_size = find_by_keyword(soup, size_keywords, 'div') or find_by_keyword(soup, size_keywords, 'span')
+    
+    # Sürüm formatını düzelt - sadece versiyon numarası
+    if app_version:
+        import re
+        # "Sürüm" kelimesini kaldır
+        app_version = re.sub(r'^sürüm\s*', '', app_version, flags=re.IGNORECASE).strip()
+        version_match = re.search(r'(\d+(?:\.\d+)*)', app_version)
+        if version_match:
+            app_version = version_match.group(1)  # Sadece versiyon numarası
+            print(f"Sürüm formatlandı: {app_version}")
+        else:
+            app_version = app_version  # Orijinal değeri koru
+            print(f"Sürüm varsayılan format: {app_version}")
+    else:
+        app_version = '1.0'  # Varsayılan sürüm (sadece numara)
+
+    # --- Kategori Tespiti ---
+    app_category = 'Kategorisiz'
+    
+    # App Store için spesifik kategori tespiti
+    print("Kategori aranıyor...")
+    
+    # 1. Önce kategori linkini ara
+    category_link = soup.find('a', class_='link', href=lambda x: x and 'itunes.apple.com/tr/genre/' in x)
+    if category_link:
+        app_category = category_link.get_text(strip=True)
+        print(f"Kategori linkinden bulundu: {app_category}")
+    else:
+        # 2. Fallback - dd elementini ara
+        category_elements = soup.find_all('dd', class_='information-list__item__definition')
+        for category_element in category_elements:
+            category_link = category_element.find('a', class_='link')
+            if category_link and 'itunes.apple.com/tr/genre/' in category_link.get('href', ''):
+                app_category = category_link.get_text(strip=True)
+                print(f"DD elementinden kategori linki bulundu: {app_category}")
+                break
+            else:
+                # Eğer link yoksa, dd elementinin içindeki metni al
+                text = category_element.get_text(strip=True)
+                if text and len(text) > 3 and text != 'Kategorisiz':
+                    app_category = text
+                    print(f"DD elementinden metin bulundu: {app_category}")
+                    break
+    
+    # 3. Kategori eşleştirmesi yap (App Store kategorilerini bizim kategorilerimize çevir)
+    category_mapping = {
+        'Üretkenlik': 'Verimlilik',
+        'Productivity': 'Verimlilik',
+        'Business': 'İş',
+        'Developer Tools': 'Geliştirici Araçları',
+        'Education': 'Eğitim',
+        'Entertainment': 'Eğlence',
+        'Finance': 'Finans',
+        'Graphics & Design': 'Grafik ve Tasarım',
+        'Health & Fitness': 'Sağlık ve Fitness',
+        'Lifestyle': 'Yaşam Tarzı',
+        'Medical': 'Tıp',
+        'Music': 'Müzik',
+        'News': 'Haberler',
+        'Photo & Video': 'Fotoğraf ve Video',
+        'Reference': 'Referans',
+        'Shopping': 'Alışveriş',
+        'Social Networking': 'Sosyal Ağ',
+        'Sports': 'Spor',
+        'Travel': 'Seyahat',
+        'Utilities': 'Yardımcı Programlar',
+        'Weather': 'Hava Durumu'
+    }
+    
+    if app_category in category_mapping:
+        app_category = category_mapping[app_category]
+        print(f"Kategori eşleştirildi: {app_category}")
+    
+    # 4. Eğer hala bulunamadıysa, genel arama yap
+    if app_category == 'Kategorisiz':
+        # Fallback - genel kategori arama
+        # "Kategori" kelimesinden sonraki metni bul
+        def find_category_after_keyword(soup, keyword):
+            # Regex ile daha esnek arama
+            import re
+            
+            # Pattern 1: "Kategori" kelimesi ve sonrasındaki metin
+            patterns = [
+                # <div>Kategori</div><div>Yardımcılar</div>
+                r'<div[^>]*>.*?' + re.escape(keyword) + r'.*?</div>\s*<div[^>]*>([^<]+)</div>',
+                # <span>Kategori</span><span>Yardımcılar</span>
+                r'<span[^>]*>.*?' + re.escape(keyword) + r'.*?</span>\s*<span[^>]*>([^<]+)</span>',
+                # <label>Kategori</label><div>Yardımcılar</div>
+                r'<label[^>]*>.*?' + re.escape(keyword) + r'.*?</label>\s*<div[^>]*>([^<]+)</div>',
+                # <strong>Kategori</strong><span>Yardımcılar</span>
+                r'<strong[^>]*>.*?' + re.escape(keyword) + r'.*?</strong>\s*<span[^>]*>([^<]+)</span>',
+                # <b>Kategori</b><div>Yardımcılar</div>
+                r'<b[^>]*>.*?' + re.escape(keyword) + r'.*?</b>\s*<div[^>]*>([^<]+)</div>',
+                # Aynı satırda: Kategori: Yardımcılar
+                r'<[^>]*>.*?' + re.escape(keyword) + r'[:\s]*([^<\n]+)',
+            ]
+            
+            html_content = str(soup)
+            for pattern in patterns:
+                try:
+                    matches = re.findall(pattern, html_content, re.IGNORECASE | re.DOTALL)
+                    for match in matches:
+                        if match and match.strip() and match.strip().lower() != keyword.lower():
+                            return match.strip()
+                except:
+                    continue
+            
+            # HTML element arama (fallback)
+            elements = soup.find_all(['div', 'span', 'label', 'strong', 'b', 'p', 'td', 'th'])
+            for element in elements:
+                text = element.get_text(strip=True)
+                if keyword.lower() in text.lower():
+                    # Kardeş elementleri kontrol et
+                    for sibling in element.find_next_siblings():
+                        sibling_text = sibling.get_text(strip=True)
+                        if sibling_text and sibling_text.lower() != keyword.lower():
+                            return sibling_text
+                    
+                    # Parent'ın kardeş elementlerini kontrol et
+                    if element.parent:
+                        for sibling in element.parent.find_next_siblings():
+                            sibling_text = sibling.get_text(strip=True)
+                            if sibling_text and sibling_text.lower() != keyword.lower():
+                                return sibling_text
+                    
+                    # Aynı parent içindeki diğer elementleri kontrol et
+                    if element.parent:
+                        for child in element.parent.find_all(['div', 'span', 'a', 'p', 'td', 'th']):
+                            if child != element:
+                                child_text = child.get_text(strip=True)
+                                if child_text and child_text.lower() != keyword.lower():
+                                    return child_text
+            return None
+        
+        # Basit kategori tespiti - "Kategori" kelimesinden sonraki metin
+        def find_simple_category(soup, keyword):
+            # Tüm metni al ve "Kategori" kelimesini ara
+            all_text = soup.get_text()
+            lines = all_text.split('\n')
+            
+            for i, line in enumerate(lines):
+                if keyword.lower() in line.lower():
+                    # Bu satırda "Kategori" var, sonraki satırlara bak
+                    for j in range(i+1, min(i+3, len(lines))):  # Sonraki 2 satıra bak
+                        next_line = lines[j].strip()
+                        if next_line and next_line.lower() != keyword.lower():
+                            return next_line
+            return None
+        
+        # Türkçe "Kategori" kelimesi ile ara
+        category_text = find_simple_category(soup, 'Kategori')
+        if category_text:
+            app_category = category_text
+        else:
+            # İngilizce "Category" kelimesi ile ara
+            category_text = find_simple_category(soup, 'Category')
+            if category_text:
+                app_category = category_text
+            else:
+                # Gelişmiş arama
+                category_text = find_category_after_keyword(soup, 'Kategori')
+                if category_text:
+                    app_category = category_text
+                else:
+                    category_text = find_category_after_keyword(soup, 'Category')
+                    if category_text:
+                        app_category = category_text
+                    else:
+                        # App Store kategorileri (fallback)
+                        category_element = soup.find('a', {'data-testid': 'category-link'}) or soup.find('a', class_='category-link')
+                        if category_element:
+                            app_category = category_element.get_text(strip=True)
+                        
+                        # Google Play kategorileri (fallback)
+                        if not category_element:
+                            category_element = soup.find('a', {'href': lambda x: x and '/store/apps/category/' in x})
+                            if category_element:
+                                app_category = category_element.get_text(strip=True)
+
+    # --- Ek Görseller (Screenshots) ---
+    internal_images = []
+    
+    # App Store için spesifik picture elementlerinden görselleri al
+    print("App Store picture elementleri aranıyor...")
+    picture_elements = soup.find_all('picture', class_=lambda x: x and 'we-artwork' in x)
+    print(f"Bulunan picture elementleri: {len(picture_elements)}")
+    
+    for picture in picture_elements:
+        # source elementlerini kontrol et
+        sources = picture.find_all('source', attrs={'srcset': True})
+        for source in sources:
+            srcset = source['srcset']
+            if 'mzstatic.com' in srcset:
+                # En yüksek çözünürlüklü linki al
+                best_url = get_highest_res_from_srcset(srcset)
+                if best_url and 'mzstatic.com' in best_url:
+                    # Sıkı filtreleme - sadece gerçek uygulama screenshot'larını al
+                    def is_valid_screenshot(url):
+                        # İkon URL'lerini filtrele
+                        icon_keywords = ['AppIcon', 'icon', 'Icon', 'logo', 'Logo']
+                        if any(keyword in url for keyword in icon_keywords):
+                            return False
+                        
+                        # Sadece belirli boyutlardaki görselleri al (screenshot boyutları)
+                        size_patterns = ['1286x0w', '1280x0w', '1200x0w', '1000x0w', '800x0w', '600x0w']
+                        if not any(pattern in url for pattern in size_patterns):
+                            return False
+                        
+                        # Sadece belirli dosya adı pattern'lerini al
+                        valid_patterns = [
+                            'Hero', 'Screenshot', 'screenshot', 'App_Store_Image', 
+                            'PurpleSource', 'Mac_', 'iPhone_', 'iPad_'
+                        ]
+                        if not any(pattern in url for pattern in valid_patterns):
+                            return False
+                        
+                        return True
+                    
+                    if is_valid_screenshot(best_url):
+                        # Duplikat kontrolü - aynı görselin farklı formatlarını filtrele
+                        # URL'den dosya adını çıkar (uzantı olmadan)
+                        import re
+                        base_url = re.sub(r'\.(webp|png|jpg|jpeg)$', '', best_url)
+                        
+                        # Bu base URL zaten var mı kontrol et
+                        is_duplicate = False
+                        for existing_url in internal_images:
+                            existing_base = re.sub(r'\.(webp|png|jpg|jpeg)$', '', existing_url)
+                            if base_url == existing_base:
+                                is_duplicate = True
+                                break
+                        
+                        if not is_duplicate:
+                            internal_images.append(best_url)
+                            print(f"Geçerli screenshot eklendi: {best_url}")
+                        else:
+                            print(f"Duplikat görsel atlandı: {best_url}")
+                    else:
+                        print(f"Geçersiz görsel atlandı: {best_url}")
+    
+    # App Store için özel seçiciler - mzstatic.com linklerini öncelikle al
+    def extract_mzstatic_images(soup):
+        images = []
+        
+        # Ekran görüntüsü olan mzstatic.com linklerini bul
+        def is_screenshot_url(url):
+            # İkon URL'lerini filtrele
+            icon_keywords = ['AppIcon', 'icon', 'Icon']
+            screenshot_keywords = ['App_Store_Image', 'screenshot', 'Screenshot', 'PurpleSource']
+            
+            # İkon URL'lerini hariç tut
+            if any(keyword in url for keyword in icon_keywords):
+                return False
+            
+            # Ekran görüntüsü URL'lerini al
+            if any(keyword in url for keyword in screenshot_keywords):
+                return True
+            
+            # Genel resim URL'leri (ikonsuz)
+            if 'mzstatic.com' in url and any(ext in url for ext in ['.jpg', '.jpeg', '.png', '.webp']):
+                return True
+            
+            return False
+        
+        # Tüm mzstatic.com linklerini bul
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if is_screenshot_url(href):
+                images.append(href)
+        
+        # srcset içindeki mzstatic linklerini bul
+        for source in soup.find_all('source', attrs={'srcset': True}):
+            srcset = source['srcset']
+            if 'mzstatic.com' in srcset:
+                # En yüksek çözünürlüklü linki al
+                best_url = get_highest_res_from_srcset(srcset)
+                if best_url and is_screenshot_url(best_url):
+                    images.append(best_url)
+        
+        # img src'lerde mzstatic linklerini bul
+        for img in soup.find_all('img', src=True):
+            src = img['src']
+            if is_screenshot_url(src):
+                images.append(src)
+        
+        return list(set(images))  # Duplikatları kaldır
+    
+    # Eğer picture elementlerinden görsel bulunamadıysa, genel arama yap
+    if not internal_images:
+        print("Picture elementlerinden görsel bulunamadı, genel arama yapılıyor...")
+        internal_images = extract_mzstatic_images(soup)
+    
+    print(f"Toplam {len(internal_images)} uygulama içi görsel bulundu")
+
+    # Google Play için özel seçiciler
+    if not internal_images:
+        for img in soup.select('.screenshot img, .screenshot-image img'):
+            src = img.get('src') or img.get('data-src')
+            if src and src not in internal_images:
+                internal_images.append(urljoin(url, src))
+
+    # Genel fallback - daha kapsamlı resim arama
+    if not internal_images:
+        # Farklı seçiciler dene
+        selectors = [
+            '.screenshots img', 
+            '.screenshot img', 
+            '.app-screenshot img',
+            '.gallery img',
+            '.carousel img',
+            '.slider img',
+            '[data-screenshot] img',
+            '.preview img'
+        ]
+        
+        for selector in selectors:
+            for img in soup.select(selector):
+                src = img.get('src') or img.get('data-src') or img.get('data-lazy')
+                if src and src not in internal_images and not src.startswith('data:'):
+                    # Sadece gerçek URL'leri al
+                    if src.startswith('http') or src.startswith('//'):
+                        internal_images.append(urljoin(url, src))
+                    elif src.startswith('/'):
+                        internal_images.append(urljoin(url, src))
+            
+            if internal_images:  # Eğer resim bulunduysa dur
+                break
+
+    # Ana ikon için daha iyi arama
+    if not image_url:
+        # Farklı ikon seçicileri dene
+        icon_selectors = [
+            'link[rel="apple-touch-icon"]',
+            'link[rel="icon"]',
+            'link[rel="shortcut icon"]',
+            'meta[property="og:image"]',
+            'meta[name="twitter:image"]',
+            '.app-icon img',
+            '.logo img',
+            '.icon img'
+        ]
+        
+        for selector in icon_selectors:
+            element = soup.select_one(selector)
+            if element:
+                if element.name == 'link':
+                    icon_url = element.get('href')
+                elif element.name == 'meta':
+                    icon_url = element.get('content')
+                elif element.name == 'img':
+                    icon_url = element.get('src') or element.get('data-src')
+                
+                if icon_url and not icon_url.startswith('data:'):
+                    image_url = urljoin(url, icon_url)
+                    break
+
+    # Güncelleme notları tespiti
+    update_notes = []
+    
+    # App Store güncelleme notları için spesifik tespit
+    # Önce whats-new ile başlayan div'leri ara
+    whats_new_divs = soup.find_all('div', class_=lambda x: x and 'whats-new' in x)
+    
+    for whats_new_div in whats_new_divs:
+        # Tarih ve sürüm bilgisini al
+        time_element = whats_new_div.find('time', attrs={'data-test-we-datetime': True})
+        version_element = whats_new_div.find('p', class_=lambda x: x and 'version' in x)
+        
+        date_text = time_element.get_text(strip=True) if time_element else ''
+        version_text = version_element.get_text(strip=True) if version_element else ''
+        
+        # Güncelleme notlarını al - we-truncate ile başlayan div'leri ara
+        content_divs = whats_new_div.find_all('div', class_=lambda x: x and 'we-truncate' in x)
+        
+        for content_div in content_divs:
+            # Tüm p elementlerini al
+            paragraphs = content_div.find_all('p')
+            
+            for p in paragraphs:
+                text = p.get_text(strip=True)
+                if text and text not in ['', 'PATCH HIGHTLIGHTS']:
+                    # Başlık olmayan metinleri al
+                    if not text.isupper() or len(text) < 20:
+                        update_notes.append(text)
+            
+            # Eğer güncelleme notları bulunduysa dur
+            if update_notes:
+                # Eğer tarih ve sürüm varsa başa ekle
+                if date_text and version_text:
+                    update_notes.insert(0, f"📅 {date_text} - {version_text}")
+                elif version_text:
+                    update_notes.insert(0, f"📱 {version_text}")
+                break
+        
+        # Eğer güncelleme notları bulunduysa döngüden çık
+        if update_notes:
+            break
+
+    
+    # Eğer App Store formatında bulunamadıysa, genel arama yap
+    if not update_notes:
+        # Daha geniş arama - tüm p elementlerinde bullet point'leri ara
+        all_paragraphs = soup.find_all('p')
+        for p in all_paragraphs:
+            text = p.get_text(strip=True)
+            # Bullet point ile başlayan metinleri al
+            if text and (text.startswith('•') or text.startswith('-') or text.startswith('*')):
+                if len(text) > 10:  # Çok kısa metinleri filtrele
+                    update_notes.append(text)
+        
+        # Eğer hala bulunamadıysa, "what's new" benzeri anahtar kelimeleri ara
+        if not update_notes:
+            update_keywords = [
+                'what\'s new', 'güncelleme', 'yenilikler', 'changelog', 'release notes',
+                'update notes', 'version notes', 'patch notes', 'yeni özellikler'
+            ]
+            
+            for keyword in update_keywords:
+                # Div içinde ara
+                update_element = soup.find('div', string=lambda text: text and keyword.lower() in text.lower())
+                if update_element:
+                    # Kardeş elementleri kontrol et
+                    for sibling in update_element.find_next_siblings():
+                        sibling_text = sibling.get_text(strip=True)
+                        if sibling_text and len(sibling_text) > 10:
+                            update_notes.append(sibling_text)
+                            break
+                    break
+                
+                # H2, H3 başlıklarında ara
+                update_element = soup.find(['h2', 'h3'], string=lambda text: text and keyword.lower() in text.lower())
+                if update_element:
+                    # Sonraki elementleri kontrol et
+                    for sibling in update_element.find_next_siblings():
+                        sibling_text = sibling.get_text(strip=True)
+                        if sibling_text and len(sibling_text) > 10:
+                            update_notes.append(sibling_text)
+                            break
+                    break
+
+    # Sistem gereksinimleri tespiti
+    system_requirements = []
+    
+    # App Store için spesifik sistem gereksinimleri tespiti
+    # <dd class="information-list__item__definition"> içindeki <dl> yapısını ara
+    info_definitions = soup.find_all('dd', class_='information-list__item__definition')
+    
+    for info_def in info_definitions:
+        # İçindeki <dl> elementlerini kontrol et
+        dl_elements = info_def.find_all('dl', class_='information-list__item__definition__item')
+        
+        for dl in dl_elements:
+            # <dt> ve <dd> elementlerini al
+            dt = dl.find('dt', class_='information-list__item__definition__item__term')
+            dd = dl.find('dd', class_='information-list__item__definition__item__definition')
+            
+            if dt and dd:
+                term_text = dt.get_text(strip=True)
+                definition_text = dd.get_text(strip=True)
+                
+                # Platform terimlerini kontrol et
+                platform_terms = ['Mac', 'iPhone', 'iPad', 'iPod touch', 'Apple TV', 'Apple Watch']
+                
+                if any(platform in term_text for platform in platform_terms):
+                    # Sistem gereksinimlerini temizle ve ekle
+                    clean_requirement = definition_text.replace('&nbsp;', ' ').strip()
+                    if clean_requirement and len(clean_requirement) > 5:
+                        system_requirements.append(f"{term_text}: {clean_requirement}")
+    
+    # Eğer App Store formatında bulunamadıysa, genel arama yap
+    if not system_requirements:
+        # Sistem gereksinimleri için anahtar kelimeler
+        requirements_keywords = [
+            'system requirements', 'sistem gereksinimleri', 'minimum requirements',
+            'gerekli sistem', 'platform', 'işletim sistemi', 'operating system',
+            'compatibility', 'uyumluluk', 'requirements', 'gereksinimler'
+        ]
+        
+        # Sistem gereksinimleri metnini bul
+        for keyword in requirements_keywords:
+            # Div içinde ara
+            req_element = soup.find('div', string=lambda text: text and keyword.lower() in text.lower())
+            if req_element:
+                # Kardeş elementleri kontrol et
+                for sibling in req_element.find_next_siblings():
+                    sibling_text = sibling.get_text(strip=True)
+                    if sibling_text and len(sibling_text) > 10:
+                        system_requirements.append(sibling_text)
+                        break
+                break
+            
+            # Span içinde ara
+            req_element = soup.find('span', string=lambda text: text and keyword.lower() in text.lower())
+            if req_element:
+                for sibling in req_element.find_next_siblings():
+                    sibling_text = sibling.get_text(strip=True)
+                    if sibling_text and len(sibling_text) > 10:
+                        system_requirements.append(sibling_text)
+                        break
+                break
+            
+            # P içinde ara
+            req_element = soup.find('p', string=lambda text: text and keyword.lower() in text.lower())
+            if req_element:
+                req_text = req_element.get_text(strip=True)
+                if req_text and len(req_text) > 10:
+                    system_requirements.append(req_text)
+                    break
+        
+        # Eğer hala bulunamadıysa, genel bilgilerden çıkarım yap
+        if not system_requirements:
+            # iOS/Android/Windows/macOS gibi platform bilgilerini ara
+            platform_keywords = ['iOS', 'Android', 'Windows', 'macOS', 'Linux', 'Chrome OS']
+            for keyword in platform_keywords:
+                platform_elements = soup.find_all(string=lambda text: text and keyword in text)
+                for element in platform_elements:
+                    parent_text = element.parent.get_text(strip=True) if element.parent else ''
+                    if len(parent_text) > 5 and len(parent_text) < 200:
+                        system_requirements.append(parent_text)
+                        break
+                if system_requirements:
+                    break
+
+    return {
+        'name': app_name,
+        'description': app_description,
+        'website': url,
+        'image': image_url,
+        'version': app_version,
+        'fileSize': app_file_size,
+        'category': app_category,
+        'internalImages': internal_images[:10],
+        'systemRequirements': system_requirements[:5],  # En fazla 5 sistem gereksinimi
+        'features': update_notes[:10]  # En fazla 10 güncelleme notu
+    }
@@ -0,0 +1,348 @@
+"""server.py uç noktaları için yük testi: sentetik katalog, Flask test istemcisi ve gunicorn.
+
+Kullanım::
+
+    python -m benchmarks.load_test --sizes 1000,10000
+    python -m benchmarks.load_test --sizes 10000 --backend sqlite --mode gunicorn --workers 2 --concurrency 4
+    python -m benchmarks.load_test --save /tmp/load-baseline.json      # referans sonuçları kaydet
+    python -m benchmarks.load_test --baseline /tmp/load-baseline.json  # gerileme varsa çıkış kodu 1
+
+Her katalog boyutu için geçici bir dizinde ``benchmarks.synthetic_catalog``
+ile apps.json üretilir (``--backend sqlite`` ise migrate_catalog.py ile
+catalog.db'ye aktarılır). Senaryolar: /api/apps varsayılan liste, arama,
+kategori, isme göre sıralama ve son sayfalar; uygulama ayrıntısı;
+/api/categories; /api/featured-apps; admin değişiklikleri (ekle, güncelle,
+öne çıkar, sil).
+
+- ``test-client``: server modülü ayrı bir süreçte o dizinde içe aktarılır
+  ve istekler tek iş parçacığından sırayla gönderilir; gecikme ağ ve WSGI
+  sunucusu olmadan uygulamanın maliyetidir.
+- ``gunicorn``: gerçek sunucu ``gunicorn -w N server:app`` ile başlatılır,
+  ``--concurrency`` kadar istemci süreci eşzamanlı istek gönderir.
+
+Her senaryo için istek/sn, p50/p95/p99 ve en yüksek gecikme ile hata (2xx
+dışı yanıt) sayısı raporlanır. Okuma senaryolarının parametreleri sınırlı
+bir havuzdan seçildiği için yanıt önbelleği de devrededir; ``--cold`` her
+isteğe benzersiz bir parametre ekleyerek önbelleği atlar.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote, urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_SIZE = 12
+READ_SCENARIOS = ['apps', 'search', 'category', 'sort_name', 'deep_page', 'detail', 'categories', 'featured']
+ADMIN_STEPS = ['admin_add', 'admin_update', 'admin_featured', 'admin_delete']
+# Bu kadar milisaniyenin altındaki p95 farkları gürültü sayılır
+NOISE_FLOOR_MS = 1.0
+
+
+def catalog_context(apps):
+    """Senaryoların parametre havuzları (katalogdan bir kez çıkarılır)."""
+    from benchmarks.synthetic_catalog import SEARCH_TERMS
+    from catalog_index import slugify
+
+    rng = random.Random(1)
+    sample = rng.sample(apps, min(len(apps), 200))
+    categories = sorted({app['category'] for app in apps})
+    return {
+        'total': len(apps),
+        'search_terms': SEARCH_TERMS,
+        'categories': ['Programlar', 'Oyunlar'] + categories,
+        'slugs': [slugify(app['name']) for app in sample],
+    }
+
+
+def _get(path, params=None):
+    query = f'?{urlencode(params)}' if params else ''
+    return ('GET', path + query, None)
+
+
+def build_requests(scenario, count, context, rng, client_id=0):
+    """Senaryonun ``(etiket, yöntem, yol, gövde)`` istek listesi."""
+    pages = max(1, math.ceil(context['total'] / PAGE_SIZE))
+    requests_ = []
+    if scenario == 'admin':
+        for i in range(max(1, count // len(ADMIN_STEPS))):
+            name = f'Yük Testi Uygulaması {client_id}-{i}-{rng.getrandbits(24):06x}'
+            path = f'/api/apps/{quote(name)}'
+            requests_ += [
+                ('admin_add', 'POST', '/api/apps', {
+                    'name': name, 'category': rng.choice(context['categories']), 'version': 'Sürüm 1.0',
+                    'description': 'Yük testi sırasında eklenen geçici uygulama.'}),
+                ('admin_update', 'PUT', path, {
+                    'name': name, 'category': rng.choice(context['categories']), 'version': '1.1',
+                    'description': 'Güncellenmiş açıklama; İçerik ve özellikler değişti.'}),
+                ('admin_featured', 'PUT', f'{path}/featured', None),
+                ('admin_delete', 'DELETE', path, None),
+            ]
+        return requests_
+
+    for _ in range(count):
+        if scenario == 'apps':
+            request = _get('/api/apps', {'page': rng.randint(1, min(pages, 5))})
+        elif scenario == 'search':
+            request = _get('/api/apps', {'search': rng.choice(context['search_terms'])})
+        elif scenario == 'category':
+            request = _get('/api/apps', {'category': rng.choice(context['categories']), 'page': rng.randint(1, 3)})
+        elif scenario == 'sort_name':
+            request = _get('/api/apps', {'sort': rng.choice(('name-asc', 'name-desc')), 'page': rng.randint(1, pages)})
+        elif scenario == 'deep_page':
+            request = _get('/api/apps', {'page': rng.randint(max(1, pages - pages // 10), pages)})
+        elif scenario == 'detail':
+            request = _get(f"/api/apps/{quote(rng.choice(context['slugs']))}")
+        elif scenario == 'categories':
+            request = _get('/api/categories')
+        elif scenario == 'featured':
+            request = _get('/api/featured-apps')
+        else:
+            raise ValueError(f'Bilinmeyen senaryo: {scenario}')
+        requests_.append((scenario,) + request)
+    return requests_
+
+
+def _cold(path, counter):
+    return f"{path}{'&' if '?' in path else '?'}_={counter}"
+
+
+def _record(results, label, elapsed, ok):
+    entry = results.setdefault(label, {'latencies': [], 'errors': 0})
+    entry['latencies'].append(elapsed)
+    if not ok:
+        entry['errors'] += 1
+
+
+def _run_test_client(directory, backend, plan, cold):
+    """Alt süreçte: server'ı katalog dizininde içe aktarıp planı sırayla çalıştırır."""
+    sys.path.insert(0, ROOT)
+    os.chdir(directory)
+    os.environ['CATALOG_BACKEND'] = backend
+    import server
+
+    client = server.app.test_client()
+    started = time.perf_counter()
+    client.get('/api/apps').get_data()
+    first_request = time.perf_counter() - started
+
+    scenarios = []
+    counter = 0
+    for scenario, requests_ in plan:
+        results = {}
+        scenario_started = time.perf_counter()
+        for label, method, path, body in requests_:
+            counter += 1
+            if cold and method == 'GET':
+                path = _cold(path, counter)
+            started = time.perf_counter()
+            response = client.open(path, method=method, json=body)
+            response.get_data()
+            _record(results, label, time.perf_counter() - started, response.status_code < 400)
+        scenarios.append((scenario, results, time.perf_counter() - scenario_started))
+    return first_request, scenarios
+
+
+def _http_client(base, requests_, cold):
+    import requests
+
+    session = requests.Session()
+    results = {}
+    for counter, (label, method, path, body) in enumerate(requests_):
+        if cold and method == 'GET':
+            path = _cold(path, f'{os.getpid()}-{counter}')
+        started = time.perf_counter()
+        try:
+            response = session.request(method, base + path, json=body, timeout=60)
+            response.content
+            ok = response.status_code < 400
+        except requests.RequestException:
+            ok = False
+        _record(results, label, time.perf_counter() - started, ok)
+    return results
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(process, base, timeout=60):
+    import requests
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'gunicorn çıktı (kod {process.returncode})')
+        try:
+            requests.get(base + '/api/categories', timeout=5)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn zamanında başlamadı')
+
+
+def _merge(results_list):
+    merged = {}
+    for results in results_list:
+        for label, entry in results.items():
+            target = merged.setdefault(label, {'latencies': [], 'errors': 0})
+            target['latencies'] += entry['latencies']
+            target['errors'] += entry['errors']
+    return merged
+
+
+def _run_gunicorn(directory, backend, scenarios, count, context, args):
+    port = _free_port()
+    base = f'http://127.0.0.1:{port}'
+    env = dict(os.environ, CATALOG_BACKEND=backend, PYTHONPATH=ROOT)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-w', str(args.workers), '-b', f'127.0.0.1:{port}',
+         '--timeout', '300', '--log-level', 'warning', 'server:app'],
+        cwd=directory, env=env)
+    try:
+        _wait_until_ready(process, base)
+        clients = max(args.concurrency, args.workers)
+        with multiprocessing.Pool(clients) as pool:
+            # Her işçi kataloğu ilk istekte yükler; eşzamanlı istekler hepsini ısıtır
+            started = time.perf_counter()
+            warmup = [('warmup', 'GET', '/api/apps', None)] * 2
+            pool.starmap(_http_client, [(base, warmup, False)] * clients)
+            first_request = time.perf_counter() - started
+
+            measured = []
+            for scenario in scenarios:
+                plans = [build_requests(scenario, math.ceil(count / args.concurrency), context,
+                                        random.Random(f'{scenario}-{client}'), client)
+                         for client in range(args.concurrency)]
+                started = time.perf_counter()
+                results = pool.starmap(_http_client, [(base, plan, args.cold) for plan in plans],
+                                       chunksize=1)
+                measured.append((scenario, _merge(results), time.perf_counter() - started))
+        return first_request, measured
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def percentile(ordered, fraction):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik."""
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+def summarize(scenarios):
+    """``{etiket: {requests, rps, p50_ms, p95_ms, p99_ms, max_ms, errors}}``."""
+    summary = {}
+    for _, results, elapsed in scenarios:
+        # Admin adımları aynı senaryoda sırayla çalışır; hepsi senaryonun toplam hızını gösterir
+        rps = round(sum(len(entry['latencies']) for entry in results.values()) / elapsed, 1)
+        for label, entry in results.items():
+            ordered = sorted(entry['latencies'])
+            summary[label] = {
+                'requests': len(ordered),
+                'rps': rps,
+                'p50_ms': round(percentile(ordered, 0.50) * 1000, 2),
+                'p95_ms': round(percentile(ordered, 0.95) * 1000, 2),
+                'p99_ms': round(percentile(ordered, 0.99) * 1000, 2),
+                'max_ms': round(ordered[-1] * 1000, 2),
+                'errors': entry['errors'],
+            }
+    return summary
+
+
+def print_summary(title, first_request, summary):
+    print(f'\n{title}  (ilk istek / ısınma {first_request:.2f} sn)')
+    print(f"{'senaryo':<16} {'istek':>6} {'istek/sn':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'hata':>5}")
+    for label, row in summary.items():
+        print(f"{label:<16} {row['requests']:>6} {row['rps']:>9.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+              f"{row['p99_ms']:>8.2f} {row['max_ms']:>8.2f} {row['errors']:>5}")
+
+
+def compare(results, baseline, tolerance):
+    """Referansa göre gerileyen ölçümleri döndürür (p95 artışı ya da istek/sn düşüşü)."""
+    regressions = []
+    for run, summary in results.items():
+        for label, row in summary.items():
+            base = baseline.get(run, {}).get(label)
+            if base is None:
+                continue
+            if row['p95_ms'] > base['p95_ms'] * (1 + tolerance) and row['p95_ms'] - base['p95_ms'] > NOISE_FLOOR_MS:
+                regressions.append(f"{run} {label}: p95 {base['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms")
+            if row['rps'] < base['rps'] * (1 - tolerance):
+                regressions.append(f"{run} {label}: istek/sn {base['rps']:.1f} -> {row['rps']:.1f}")
+            if row['errors'] > base['errors']:
+                regressions.append(f"{run} {label}: hata {base['errors']} -> {row['errors']}")
+    return regressions
+
+
+def prepare_catalog(directory, size, backend, seed):
+    from benchmarks.synthetic_catalog import generate_catalog, write_catalog
+
+    apps = generate_catalog(size, seed)
+    write_catalog(apps, os.path.join(directory, 'apps.json'))
+    if backend == 'sqlite':
+        subprocess.run([sys.executable, os.path.join(ROOT, 'migrate_catalog.py')], cwd=directory, check=True,
+                       stdout=subprocess.DEVNULL)
+    return catalog_context(apps)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000', help='virgülle ayrılmış katalog boyutları (ör. 1000,10000,100000)')
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--mode', choices=('test-client', 'gunicorn', 'both'), default='test-client')
+    parser.add_argument('--requests', type=int, default=200, help='senaryo başına istek sayısı')
+    parser.add_argument('--scenarios', default=','.join(READ_SCENARIOS + ['admin']))
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn işçi sayısı')
+    parser.add_argument('--concurrency', type=int, default=4, help='gunicorn modunda eşzamanlı istemci süreci')
+    parser.add_argument('--cold', action='store_true', help='yanıt önbelleğini atla')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', help='sonuçları bu JSON dosyasına yaz')
+    parser.add_argument('--baseline', help='sonuçları bu JSON dosyasıyla karşılaştır')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='gerileme sayılmayan göreli fark')
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    modes = ['test-client', 'gunicorn'] if args.mode == 'both' else [args.mode]
+    results = {}
+    for size in (int(value) for value in args.sizes.split(',')):
+        with tempfile.TemporaryDirectory() as directory:
+            context = prepare_catalog(directory, size, args.backend, args.seed)
+            for mode in modes:
+                run = f'{size}/{args.backend}/{mode}'
+                if mode == 'test-client':
+                    plan = [(scenario, build_requests(scenario, args.requests, context, random.Random(scenario)))
+                            for scenario in scenarios]
+                    # Her katalog yeni bir süreçte yüklenir: server modülü ve önbellekleri paylaşılmaz
+                    with multiprocessing.get_context('spawn').Pool(1) as pool:
+                        first_request, measured = pool.apply(_run_test_client, (directory, args.backend, plan, args.cold))
+                else:
+                    first_request, measured = _run_gunicorn(directory, args.backend, scenarios, args.requests, context, args)
+                results[run] = summarize(measured)
+                print_summary(run, first_request, results[run])
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print('\nGERİLEME:')
+            for line in regressions:
+                print(f'  {line}')
+            sys.exit(1)
+        print('\nReferansa göre gerileme yok')
+
+
+if __name__ == '__main__':
+    main()
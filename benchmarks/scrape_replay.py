@@ -0,0 +1,255 @@
+"""Kayıtlı sayfa arşivi (corpus) üzerinde scrape hattını çevrimdışı çalıştırır.
+
+Kullanım::
+
+    python -m benchmarks.scrape_replay                      # tüm sayfalar, beklenen çıktılarla karşılaştırır
+    python -m benchmarks.scrape_replay --parser lxml --repeat 20
+    python -m benchmarks.scrape_replay --pages google-play,itunes-mac-en
+    python -m benchmarks.scrape_replay --update             # beklenen çıktıları bilinçli bir değişiklikten sonra yeniler
+    python -m benchmarks.scrape_replay --record ornek-id https://apps.apple.com/tr/app/...  # canlı sayfayı ekler
+    python -m benchmarks.scrape_replay --serve              # yalnızca yerel sunucuyu çalıştırır
+
+``benchmarks/scrape_corpus/manifest.json`` her sayfanın kimliğini, özgün
+URL'sini ve HTML dosyasını listeler; ``expected/<id>.json`` o sayfadan
+beklenen çıkarım sonucudur. Sayfalar yerel bir HTTP sunucusundan (ETag ve
+``If-None-Match`` ile 304 destekli) ``ScrapeEngine`` ile indirilir ve
+``extract_app_data`` özgün URL ile çalıştırılır; böylece App Store'a özel
+dallar ve ``website`` alanı canlı scrape ile aynı kalır.
+
+Sayfa başına indirme, ayrıştırma ve çıkarma süreleri (``--repeat``
+tekrarın ortancası; aşamalar ``metrics.stage`` işaretlerinden), tracemalloc
+ile ölçülen tepe ve kalıcı bellek ile alan alan çıktı farkları raporlanır.
+Fark varsa çıkış kodu 1'dir.
+"""
+import argparse
+import gc
+import hashlib
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import extractor
+from metrics import collect_stages
+from scraper import ScrapeEngine
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_corpus')
+MANIFEST_PATH = os.path.join(CORPUS_DIR, 'manifest.json')
+
+
+def load_manifest():
+    with open(MANIFEST_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(entries):
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def _expected_path(entry_id):
+    return os.path.join(CORPUS_DIR, 'expected', f'{entry_id}.json')
+
+
+def read_page(entry):
+    with open(os.path.join(CORPUS_DIR, entry['file']), 'rb') as f:
+        return f.read()
+
+
+def write_expected(entry_id, data):
+    with open(_expected_path(entry_id), 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+class CorpusServer:
+    """Corpus sayfalarını ``/<id>`` yolunda sunan yerel HTTP sunucusu."""
+
+    def __init__(self, entries, port=0):
+        pages = {}
+        for entry in entries:
+            content = read_page(entry)
+            pages['/' + entry['id']] = (content, '"%s"' % hashlib.sha1(content).hexdigest())
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                page = pages.get(self.path)
+                if page is None:
+                    self.send_error(404)
+                    return
+                content, etag = page
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, entry_id):
+        return f'http://127.0.0.1:{self._server.server_port}/{entry_id}'
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _normalized(data):
+    return json.loads(json.dumps(data, ensure_ascii=False))
+
+
+def _short(value, limit=80):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+
+def field_diffs(expected, actual):
+    """Alan alan farkların okunabilir listesi (liste alanlarında eksilen/eklenen öğeler)."""
+    diffs = []
+    for field in sorted(set(expected) | set(actual)):
+        if field not in actual:
+            diffs.append(f'{field}: alan yok (beklenen {_short(expected[field])})')
+            continue
+        if field not in expected:
+            diffs.append(f'{field}: beklenmeyen alan {_short(actual[field])}')
+            continue
+        old, new = expected[field], actual[field]
+        if old == new:
+            continue
+        if isinstance(old, list) and isinstance(new, list):
+            removed = [item for item in old if item not in new]
+            added = [item for item in new if item not in old]
+            if not removed and not added:
+                diffs.append(f'{field}: aynı öğeler, farklı sıra')
+                continue
+            detail = [f'-{_short(item)}' for item in removed[:3]] + [f'+{_short(item)}' for item in added[:3]]
+            diffs.append(f'{field}: {len(removed)} öğe eksik, {len(added)} öğe fazla: ' + ', '.join(detail))
+        else:
+            diffs.append(f'{field}: {_short(old)} -> {_short(new)}')
+    return diffs
+
+
+def measure(content, url, parser, repeat):
+    """Ayrıştırma/çıkarma sürelerinin ortancası (ms), tracemalloc tepe ve kalıcı belleği (KB) ve sonuç."""
+    stages = []
+    for _ in range(repeat + 1):  # İlk tur ısınma
+        with collect_stages() as timer:
+            data = extractor.extract_app_data(content, url, parser=parser)
+        stages.append(timer.stages)
+    stages = stages[1:]
+
+    tracemalloc.start()
+    try:
+        with collect_stages():
+            result = extractor.extract_app_data(content, url, parser=parser)
+        gc.collect()  # Ayrıştırma ağacı döngüseldir; kalıcı bellek toplanamayanları göstersin
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    return {
+        'parse_ms': statistics.median(stage.get('parse', 0.0) for stage in stages) * 1000,
+        'extract_ms': statistics.median(stage.get('extract', 0.0) for stage in stages) * 1000,
+        'peak_kb': peak / 1024,
+        'retained_kb': retained / 1024,
+    }, data
+
+
+def record(entry_id, url):
+    """Canlı sayfayı indirip corpus'a ekler ve beklenen çıktısını yazar."""
+    response = ScrapeEngine().fetch(url)
+    response.raise_for_status()
+    entry = {'id': entry_id, 'url': url, 'file': f'pages/{entry_id}.html'}
+    with open(os.path.join(CORPUS_DIR, entry['file']), 'wb') as f:
+        f.write(response.content)
+    entries = [existing for existing in load_manifest() if existing['id'] != entry_id] + [entry]
+    save_manifest(entries)
+    write_expected(entry_id, _normalized(extractor.extract_app_data(response.content, url)))
+    print(f'{entry_id}: {len(response.content) / 1024:.0f} KB kaydedildi')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', default=None, help="'html.parser' ya da 'lxml' (varsayılan: SCRAPE_PARSER)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--pages', help='virgülle ayrılmış sayfa kimlikleri')
+    parser.add_argument('--update', action='store_true', help='beklenen çıktıları yeniden yaz')
+    parser.add_argument('--record', nargs=2, metavar=('ID', 'URL'))
+    parser.add_argument('--serve', action='store_true', help='yerel sunucuyu çalıştır ve bekle')
+    args = parser.parse_args()
+
+    if args.record:
+        record(*args.record)
+        return
+
+    entries = load_manifest()
+    if args.pages:
+        wanted = {page.strip() for page in args.pages.split(',')}
+        entries = [entry for entry in entries if entry['id'] in wanted]
+    parser_name = extractor.resolve_parser(args.parser)
+
+    with CorpusServer(entries) as server:
+        if args.serve:
+            for entry in entries:
+                print(f"{server.url(entry['id'])}  ({entry['url']})")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                return
+
+        engine = ScrapeEngine()
+        print(f'ayrıştırıcı: {parser_name}, tekrar: {args.repeat}')
+        print(f"{'sayfa':<20} {'KB':>5} {'indirme ms':>10} {'ayrıştırma ms':>13} {'çıkarma ms':>10} "
+              f"{'tepe KB':>8} {'kalıcı KB':>9}  sonuç")
+        failures = {}
+        for entry in entries:
+            started = time.perf_counter()
+            response = engine.fetch(server.url(entry['id']))
+            fetch_ms = (time.perf_counter() - started) * 1000
+            content = response.content
+
+            row, data = measure(content, entry['url'], args.parser, args.repeat)
+            data = _normalized(data)
+            if args.update or not os.path.exists(_expected_path(entry['id'])):
+                write_expected(entry['id'], data)
+                status = 'yazıldı'
+            else:
+                with open(_expected_path(entry['id']), encoding='utf-8') as f:
+                    diffs = field_diffs(json.load(f), data)
+                if diffs:
+                    failures[entry['id']] = diffs
+                status = f'{len(diffs)} alan farklı' if diffs else 'aynı'
+            print(f"{entry['id']:<20} {len(content) / 1024:>5.0f} {fetch_ms:>10.1f} {row['parse_ms']:>13.1f} "
+                  f"{row['extract_ms']:>10.1f} {row['peak_kb']:>8.0f} {row['retained_kb']:>9.0f}  {status}")
+
+    for entry_id, diffs in failures.items():
+        print(f'\n{entry_id}:')
+        for line in diffs:
+            print(f'  {line}')
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""apps.json şemasında sentetik katalog üretir (yük testleri için).
+
+Kullanım::
+
+    python -m benchmarks.synthetic_catalog --count 10000 --output /tmp/apps-10k.json
+
+Uygulamalar gerçek kayıtlardaki alanların hepsini taşır: Türkçe ad ve
+açıklamalar (ç, ğ, ı, İ, ö, ş, ü ve bazı adlarda App Store'dan gelen
+``\\u200e`` işareti), ``CATEGORY_HIERARCHY`` alt kategorileri ile
+``Alt Kategori > Yaprak`` biçiminde iç içe kategoriler, sürüm notları,
+ekran görüntüleri, SEO alanları, öne çıkarılanlar ve yorumlar. Aynı
+``seed`` her zaman aynı kataloğu verir.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from categories import CATEGORY_HIERARCHY
+
+ADJECTIVES = [
+    'Hızlı', 'Akıllı', 'Güçlü', 'Sade', 'Özgür', 'Küçük', 'Büyük', 'Şık', 'Gizli', 'Açık',
+    'Yeşil', 'Mavi', 'Çevik', 'Güvenli', 'Işıklı', 'Öncü', 'Pratik', 'Derin', 'Canlı', 'Üstün',
+]
+NOUNS = [
+    'Not Defteri', 'Fotoğraf Düzenleyici', 'Video Dönüştürücü', 'Müzik Çalar', 'Takvim', 'Görev Yöneticisi',
+    'Şifre Kasası', 'Dosya Gezgini', 'Ekran Kaydedici', 'PDF Okuyucu', 'Çizim Stüdyosu', 'Hesap Makinesi',
+    'Sözlük', 'Hava Durumu', 'Bütçe Planlayıcı', 'Kod Editörü', 'Terminal', 'Yedekleme Aracı',
+    'Ağ İzleyici', 'Pano Geçmişi', 'Çeviri Asistanı', 'Podcast Oynatıcı', 'E-posta İstemcisi', 'Sesli Not',
+    'Günlük', 'Harita', 'Ölçü Çevirici', 'Yazı Tipi Yöneticisi', 'Disk Temizleyici', 'Satranç',
+]
+SUFFIXES = ['', '', '', ' Pro', ' Lite', ' Plus', ' Studio', ' X', ' 2', ' Mac']
+LEAVES = ['Araçlar', 'Eklentiler', 'Yardımcılar', 'Şablonlar', 'Öğrenme', 'Yaratıcı İşler', 'Günlük Kullanım']
+SENTENCES = [
+    'Günlük işlerinizi tek bir pencereden yönetmenizi sağlar.',
+    'Dosyalarınızı şifreleyerek güvenle saklar ve iCloud ile eşitler.',
+    'Apple Silicon işlemciler için optimize edilmiş, düşük güç tüketimli bir motor kullanır.',
+    'Sürükle bırak desteğiyle içerikleri diğer uygulamalara hızla aktarır.',
+    'Karanlık mod, klavye kısayolları ve menü çubuğu simgesi içerir.',
+    'Çevrimdışı çalışır; hiçbir veri cihazınızdan dışarı gönderilmez.',
+    'Öğrenciler, tasarımcılar ve yazılım geliştiriciler için özelleştirilebilir şablonlar sunar.',
+    'Şeffaf fiyatlandırma: reklam yok, abonelik yok, gizli ücret yok.',
+    'Çoklu dil desteğiyle Türkçe, İngilizce ve Almanca arayüz sunar.',
+    'Otomatik yedekleme ve sürüm geçmişi sayesinde hiçbir değişiklik kaybolmaz.',
+    'Gelişmiş arama, etiketler ve akıllı klasörlerle içerikleri düzenler.',
+    'Yüksek çözünürlüklü ekranlar için keskin, ölçeklenebilir simgeler kullanır.',
+]
+UPDATE_NOTES = [
+    'Hata düzeltmeleri ve performans iyileştirmeleri.',
+    'macOS Sequoia uyumluluğu eklendi.',
+    'Yeni dışa aktarma seçenekleri: PDF, PNG ve Markdown.',
+    'İçe aktarma sırasında oluşan çökme giderildi.',
+    'Arayüz çevirileri güncellendi; Türkçe yerelleştirme tamamlandı.',
+]
+AUTHORS = ['Ayşe', 'Mehmet', 'Çağla', 'Oğuz', 'İlker', 'Şule', 'Gökhan', 'Zeynep', 'Ümit', 'Derya']
+REVIEW_TEXTS = [
+    'Çok işime yaradı, teşekkürler!',
+    'Son sürümle birlikte açılış süresi kısaldı.',
+    'Türkçe arayüz harika olmuş.',
+    'M1 işlemcide sorunsuz çalışıyor.',
+    'Bazı kısayollar çalışmıyor ama genel olarak başarılı.',
+]
+SYSTEM_REQUIREMENTS = [
+    'Mac: macOS 12.0 veya üst sürümünü gerektirir.',
+    'Mac: macOS 13.5 veya üst sürümünü gerektirir.',
+    'Mac: Apple M1 yongası veya üstü gerektirir.',
+    'Mac: macOS 14.0 veya üst sürümünü gerektirir.',
+]
+EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+# Yük testlerinin arama sorguları: tam kelime, önek, çok kelimeli ve Türkçe karakterli
+SEARCH_TERMS = ['not', 'video', 'fotoğraf', 'şifre', 'Müzik', 'pdf', 'kod', 'ağ izleyici', 'çiz', 'günlük', 'yedek', 'İçe']
+
+
+def category_choices(hierarchy=CATEGORY_HIERARCHY):
+    """Kataloğa dağıtılacak kategori değerleri: alt kategoriler, iç içe yapraklar, ana kategoriler."""
+    subcategories = [sub for data in hierarchy.values() for sub in data['subcategories']]
+    nested = [f'{sub} > {leaf}' for sub in subcategories[::3] for leaf in LEAVES[:3]]
+    return subcategories, nested, list(hierarchy), ['Kategorisiz']
+
+
+def _category(rng, choices):
+    subcategories, nested, main_categories, uncategorized = choices
+    roll = rng.random()
+    if roll < 0.7:
+        return rng.choice(subcategories)
+    if roll < 0.88:
+        return rng.choice(nested)
+    if roll < 0.95:
+        return rng.choice(main_categories)
+    return uncategorized[0]
+
+
+def _file_size(rng):
+    size = rng.lognormvariate(4.5, 1.4)  # MB; birkaç MB ile onlarca GB arası
+    if size >= 1024:
+        return f'{size / 1024:.1f} GB'.replace('.', ',' if rng.random() < 0.5 else '.')
+    return f'{size:.1f} MB'
+
+
+def generate_app(rng, index, name, choices):
+    created = EPOCH + timedelta(seconds=rng.randrange(3 * 365 * 24 * 3600))
+    modified = created + timedelta(seconds=rng.randrange(90 * 24 * 3600))
+    version = f'{rng.randint(1, 15)}.{rng.randint(0, 9)}.{rng.randint(0, 30)}'
+    slug_base = f'{index}-{rng.getrandbits(32):08x}'
+    description = ' '.join(rng.sample(SENTENCES, rng.randint(3, 8)))
+    app = {
+        'name': name,
+        'category': _category(rng, choices),
+        'version': version,
+        'fileSize': _file_size(rng),
+        'image': f'https://is1-ssl.mzstatic.com/image/thumb/Purple{rng.randint(100, 299)}/v4/{slug_base}/AppIcon.png/512x512bb.png',
+        'downloadLink': '',
+        'website': f'https://apps.apple.com/tr/app/id{1000000000 + index}?mt=12',
+        'description': f'{name}, {description}',
+        'features': [f'📅 {modified:%d.%m.%Y} - Sürüm {version}'] + rng.sample(UPDATE_NOTES, rng.randint(1, 3)),
+        'installation': [],
+        'internalImages': [
+            f'https://is1-ssl.mzstatic.com/image/thumb/PurpleSource{rng.randint(100, 299)}/v4/{slug_base}/Mac_{i}.png/1286x0w.webp'
+            for i in range(rng.randint(1, 6))
+        ],
+        'systemRequirements': [rng.choice(SYSTEM_REQUIREMENTS)],
+        'creationDate': created.isoformat(),
+        'lastModified': modified.isoformat(),
+        'reviews': [
+            {'author': rng.choice(AUTHORS), 'text': rng.choice(REVIEW_TEXTS), 'rating': rng.randint(1, 5)}
+            for _ in range(rng.choice((0, 0, 0, 1, 2, 5)))
+        ],
+        'badgeType': rng.choice(('new', 'new', 'updated', None)),
+    }
+    if rng.random() < 0.3:
+        app['featured'] = rng.random() < 0.1
+    if rng.random() < 0.3:
+        app['downloadUrl'] = f'https://example.com/indir/{slug_base}'
+    if rng.random() < 0.15:
+        plain = name.lstrip('\u200e')
+        app['seoTitle'] = f'{plain} - Mac Uygulaması | MacFree'
+        app['seoDescription'] = f'Mac için {plain}. MacFree ile ücretsiz indirin.'
+        app['seoKeywords'] = f'mac, uygulama, ücretsiz, indir, {plain.lower()}'
+        app['seoImageAlt'] = f'{plain} ekran görüntüsü'
+    return app
+
+
+def generate_catalog(count, seed=0):
+    """``count`` uygulamalık katalog; adlar benzersizdir ve liste apps.json gibi en yeni önce sıralıdır."""
+    rng = random.Random(seed)
+    choices = category_choices()
+    used = set()
+    apps = []
+    for index in range(count):
+        name = f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}{rng.choice(SUFFIXES)}'
+        if name in used:
+            name = f'{name} {index}'
+        used.add(name)
+        if rng.random() < 0.1:
+            name = '\u200e' + name  # App Store'dan kopyalanan adlardaki yön işareti
+        apps.append(generate_app(rng, index, name, choices))
+    apps.sort(key=lambda app: app['creationDate'], reverse=True)
+    return apps
+
+
+def write_catalog(apps, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(apps, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='apps.synthetic.json')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    apps = generate_catalog(args.count, args.seed)
+    write_catalog(apps, args.output)
+    print(f'{len(apps)} uygulama {args.output} dosyasına yazıldı ({time.perf_counter() - started:.1f} sn)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+"""apps.json kataloğu için işçi (worker) başına bellek içi depo."""
+import json
+import threading
+
+from catalog_index import CategoryIndex, LookupIndex, SortedViews, SummaryIndex, normalize_app_name
+from metrics import stage
+from search_index import SearchIndex
+from storage import FileLock, Journal, atomic_write_json, file_identity
+
+# Günlükte bu kadar değişiklik birikince apps.json yeniden yazılır
+JOURNAL_COMPACT_AFTER = 200
+
+
+def _matching_positions(apps, name):
+    normalized = normalize_app_name(name)
+    return [i for i, app in enumerate(apps) if normalize_app_name(app.get('name', '')) == normalized]
+
+
+def apply_mutation(apps, mutation, positions=None):
+    """Tek bir değişikliği listeye uygular.
+
+    Listedeki sözlükler yerinde değiştirilmez; değişen uygulamaların yerine
+    kopyaları konur. Hem canlı yazmalarda hem de günlük yeniden oynatılırken
+    kullanılır, bu yüzden değişiklikler zaman damgası gibi tüm girdilerini
+    kendi içinde taşır.
+
+    ``positions``, isimle çalışan değişikliklerde (güncelleme, silme, öne
+    çıkarma) ismi eşleşen uygulamaların listedeki artan sıralarıdır; verilmezse
+    liste taranarak bulunur.
+    """
+    op = mutation['op']
+    if op in ('update', 'delete', 'featured') and positions is None:
+        positions = _matching_positions(apps, mutation['name'])
+    if op == 'add':
+        apps.insert(0, mutation['app'])
+    elif op == 'update':
+        if positions:
+            apps[positions[0]] = mutation['app']
+    elif op == 'delete':
+        for index in reversed(positions):
+            del apps[index]
+    elif op == 'featured':
+        if positions:
+            index = positions[0]
+            apps[index] = dict(apps[index], featured=mutation['featured'], lastModified=mutation['lastModified'])
+    elif op in ('rename_category', 'delete_category'):
+        old_name = mutation['old_name']
+        for i, app in enumerate(apps):
+            app_category = app.get('category')
+            if app_category and (app_category == old_name or app_category.startswith(old_name + ' > ')):
+                if op == 'rename_category':
+                    new_category = mutation['new_name'] + app_category[len(old_name):]
+                else:
+                    new_category = 'Kategorisiz'
+                apps[i] = dict(app, category=new_category, lastModified=mutation['lastModified'])
+    else:
+        raise ValueError(f'Bilinmeyen değişiklik türü: {op}')
+    return apps
+
+
+class CatalogStore:
+    """Kataloğu işçi başına bir kez yükler, dosya değiştiğinde yeniden yükler.
+
+    Handler'lar ``snapshot()`` ile salt okunur bir görüntü (tuple) alır. Bu
+    görüntüdeki sözlükler yerinde değiştirilmemelidir.
+
+    Tekil değişiklikler ``apply()`` ile ``<dosya>.journal`` günlüğüne eklenir;
+    böylece küçük bir düzenleme tüm kataloğu yeniden yazmaz. Diğer işçiler
+    günlüğün yalnızca yeni eklenen kısmını okuyup uygular. Günlük
+    ``JOURNAL_COMPACT_AFTER`` kayda ulaşınca ana dosya atomik olarak yeniden
+    yazılır ve günlük sıfırlanır.
+
+    Her uygulamaya işçi içinde geçerli bir belge numarası (doc id) verilir ve
+    ikincil indeksler (ör. ``search_index``) bu numaralarla tutulur. Görüntü
+    değiştiğinde yalnızca eklenen/çıkarılan uygulamalar indekslere işlenir.
+    """
+
+    def __init__(self, path, category_hierarchy=None, compact_after=JOURNAL_COMPACT_AFTER):
+        self.path = path
+        self.compact_after = compact_after
+        self.journal = Journal(path + '.journal')
+        self.version = 0  # Her yükleme/değişiklikte artar
+        self._lock = threading.Lock()
+        self._file_lock_path = path + '.lock'
+        self._apps = ()
+        self._loaded = False
+        self._base_identity = None
+        self._journal_inode = None
+        self._journal_offset = None
+        self._journal_records = 0
+        self._journal_valid = False
+        self._docs = {}  # doc id -> uygulama
+        self._doc_ids = {}  # id(uygulama) -> doc id
+        self._positions = {}  # doc id -> görüntüdeki sıra
+        self._next_doc_id = 0
+        self.search_index = SearchIndex()
+        self.sorted_views = SortedViews()
+        self.categories = CategoryIndex(category_hierarchy or {})
+        self.lookup = LookupIndex()
+        self.summaries = SummaryIndex()
+        self._indexes = [self.search_index, self.sorted_views, self.categories, self.lookup, self.summaries]
+
+    def _read_base(self):
+        """Ana dosyayı okur; okunamazsa None döndürür."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return []
+        # Dosyanın boş olup olmadığını kontrol et
+        if not content:
+            return []
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            return None
+
+    def _set_apps(self, apps):
+        """Yeni görüntüyü yerleştirir ve indeksleri farka göre günceller.
+
+        Görüntüdeki sözlükler yerinde değiştirilmediği için aynı nesne aynı
+        uygulama demektir; yeni nesneler eklenmiş, kaybolanlar silinmiş sayılır.
+        """
+        apps = tuple(apps)
+        current = {id(app) for app in apps}
+        stale = self._doc_ids.keys() - current
+        if stale and len(stale) == len(self._doc_ids):
+            for index in self._indexes:
+                index.clear()
+            self._docs.clear()
+            self._doc_ids.clear()
+        else:
+            for object_id in stale:
+                doc_id = self._doc_ids.pop(object_id)
+                app = self._docs.pop(doc_id)
+                for index in self._indexes:
+                    index.remove(doc_id, app)
+        positions = {}
+        for position, app in enumerate(apps):
+            doc_id = self._doc_ids.get(id(app))
+            if doc_id is None:
+                doc_id = self._next_doc_id
+                self._next_doc_id += 1
+                self._doc_ids[id(app)] = doc_id
+                self._docs[doc_id] = app
+                for index in self._indexes:
+                    index.add(doc_id, app)
+            positions[doc_id] = position
+        self._positions = positions
+        for index in self._indexes:
+            index.commit()
+        self._apps = apps
+        self.version += 1
+
+    def _is_current(self, base_identity, journal_identity):
+        journal_state = (self._journal_inode, self._journal_offset) if self._journal_offset is not None else None
+        return self._loaded and base_identity == self._base_identity and journal_identity == journal_state
+
+    def _set_journal_state(self, offset, records, valid):
+        journal_identity = self.journal.identity()
+        self._journal_inode = journal_identity[0] if journal_identity and offset is not None else None
+        self._journal_offset = offset
+        self._journal_records = records
+        self._journal_valid = valid
+
+    def _refresh(self):
+        """Dosyalar değiştiyse bellekteki görüntüyü günceller (kilit altında çağrılır)."""
+        base_identity = file_identity(self.path)
+        journal_identity = self.journal.identity()
+        if self._is_current(base_identity, journal_identity):
+            return
+
+        # Ana dosya aynı ve günlüğe yalnızca ekleme yapılmışsa sadece yeni kayıtları oku
+        if (self._loaded and self._journal_valid and base_identity == self._base_identity
+                and journal_identity and journal_identity[0] == self._journal_inode
+                and journal_identity[1] >= self._journal_offset):
+            records, offset, valid = self.journal.read(base_identity, self._journal_offset)
+            if valid:
+                apps = list(self._apps)
+                for record in records:
+                    apply_mutation(apps, record)
+                self._set_apps(apps)
+                self._journal_offset = offset
+                self._journal_records += len(records)
+                return
+
+        if base_identity is None:
+            apps = []
+        else:
+            apps = self._read_base()
+            if apps is None:
+                # Bozuk dosya: eldeki görüntüyü koru, sonraki istekte tekrar dene
+                self._loaded = True
+                return
+        records, offset, valid = self.journal.read(base_identity)
+        for record in records:
+            apply_mutation(apps, record)
+        self._set_apps(apps)
+        self._loaded = True
+        self._base_identity = base_identity
+        self._set_journal_state(offset, len(records), valid)
+
+    def snapshot(self):
+        """Kataloğun salt okunur anlık görüntüsünü döndürür."""
+        with stage('load'):
+            if self._is_current(file_identity(self.path), self.journal.identity()):
+                return self._apps
+            with self._lock:
+                self._refresh()
+                return self._apps
+
+    def current_version(self):
+        """Dosyalardaki son değişiklikleri de hesaba katarak katalog sürümünü döndürür."""
+        self.snapshot()
+        return self.version
+
+    def _write_base(self, apps):
+        """Ana dosyayı atomik olarak yazar ve günlüğü yeni sürüm için sıfırlar."""
+        atomic_write_json(self.path, apps)
+        self._base_identity = file_identity(self.path)
+        offset = self.journal.reset(self._base_identity)
+        self._set_journal_state(offset, 0, True)
+
+    def apply(self, mutation):
+        """Tek bir değişikliği uygular ve günlüğe ekler; yeni görüntüyü döndürür."""
+        with self._lock, FileLock(self._file_lock_path):
+            # Başka bir işçinin yazdıklarını da görerek uygula
+            self._refresh()
+            positions = None
+            if 'name' in mutation:
+                # Hedef sıralar isim indeksinden gelir; liste taranmaz
+                positions = sorted(self._positions[doc_id] for doc_id in self.lookup.name_doc_ids(mutation['name']))
+            apps = apply_mutation(list(self._apps), mutation, positions)
+            if self._base_identity is None:
+                # Henüz ana dosya yok: günlük yerine doğrudan yaz
+                self._write_base(apps)
+            else:
+                if not self._journal_valid:
+                    self._set_journal_state(self.journal.reset(self._base_identity), 0, True)
+                self._journal_offset = self.journal.append(mutation, self._journal_offset)
+                self._journal_records += 1
+                if self._journal_records >= self.compact_after:
+                    self._write_base(apps)
+            self._set_apps(apps)
+            self._loaded = True
+            return self._apps
+
+    def save(self, apps):
+        """Listenin tamamını atomik olarak yazar (günlüğü de sıkıştırır)."""
+        with self._lock, FileLock(self._file_lock_path):
+            self._write_base(list(apps))
+            self._set_apps(apps)
+            self._loaded = True
+
+    def query(self, search=None, category=None, sort='default'):
+        """Arama, kategori filtresi ve sıralamayı indekslerle uygular.
+
+        Dilimlenebilir bir sonuç döndürür. Arama varken varsayılan sıralama
+        alaka düzeyidir (BM25); ``name-asc``/``name-desc`` istenirse eşleşmeler
+        hazır isim sırasıyla döner.
+        """
+        with self._lock:
+            with stage('load'):
+                self._refresh()
+            with stage('filter'):
+                members = self.categories.members(category) if category else None
+            if not search:
+                with stage('sort'):
+                    return self.sorted_views.view(sort, subset=members)
+            with stage('search'):
+                ranked = [doc_id for doc_id, _ in self.search_index.search(search)]
+                if members is not None:
+                    ranked = [doc_id for doc_id in ranked if doc_id in members]
+            with stage('sort'):
+                if sort in ('name-asc', 'name-desc'):
+                    return self.sorted_views.view(sort, subset=set(ranked))
+                return [self._docs[doc_id] for doc_id in ranked]
+
+    def project(self, apps, fields=None):
+        """Uygulamaları kısa kayıtlarına ya da ``fields`` ile seçilen alanlara indirger.
+
+        ``fields`` verilmezse hazır kısa kayıtlar (``COMPACT_FIELDS``) üretilir.
+        Sonuçlar tek tek üretildiği için akıtılan yanıtlarda da kullanılabilir.
+        """
+        if fields is None:
+            return (self.summaries.get(app) for app in apps)
+        return (self.summaries.project(app, fields) for app in apps)
+
+    def iter_fragments(self, apps, kind='full'):
+        """Uygulamaların hazır JSON baytlarını tek tek üretir."""
+        fragment = self.summaries.fragment
+        return (fragment(app, kind) for app in apps)
+
+    def fragments(self, apps, kind='full'):
+        """Uygulamaların hazır JSON baytları; yanıtlar bunlar birleştirilerek kurulur."""
+        return list(self.iter_fragments(apps, kind))
+
+    def find(self, name=None, app_id=None, slug=None):
+        """Uygulamayı isim, id ya da seoSlug ile indeksten bulur; yoksa None döner."""
+        with self._lock:
+            self._refresh()
+            if name is not None:
+                return self.lookup.by_name(name)
+            if app_id is not None:
+                return self.lookup.by_id(app_id)
+            return self.lookup.by_slug(slug)
+
+    def has_name(self, name):
+        """Birebir ``name`` isimli uygulama var mı; normalize ismi aynı olan tüm uygulamalara bakılır."""
+        with self._lock:
+            self._refresh()
+            return any(self._docs[doc_id].get('name') == name for doc_id in self.lookup.name_doc_ids(name))
+
+    def featured(self):
+        """Öne çıkarılan uygulamalar, en son değiştirilen önce."""
+        featured_apps = [app for app in self.snapshot() if app.get('featured', False)]
+        featured_apps.sort(key=lambda x: x.get('lastModified', '1970-01-01T00:00:00+00:00'), reverse=True)
+        return featured_apps
+
+    def count_in_category(self, name):
+        """Kategorisi ``name`` ya da onun bir alt kategorisi olan uygulama sayısı."""
+        return sum(
+            1 for app in self.snapshot()
+            if app.get('category') and (app['category'] == name or app['category'].startswith(name + ' > '))
+        )
+
+    def category_summary(self):
+        """Kullanılan kategorileri ve ağaçtaki her düğümün uygulama sayısını döndürür."""
+        with self._lock:
+            self._refresh()
+            return self.categories.existing(), self.categories.counts()
@@ -0,0 +1,405 @@
+"""CatalogStore için ikincil indeksler: hazır sıralı görünümler, kategori ağacı ve arama tabloları."""
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+from fast_json import encode
+
+# Bir seferde bundan fazla ekleme varsa tek tek yerleştirmek yerine yeniden sırala
+_BULK_THRESHOLD = 32
+
+# Liste (grid) görünümünün ihtiyaç duyduğu alanlar; sayfalı /api/apps yanıtlarının varsayılanı
+COMPACT_FIELDS = ('name', 'slug', 'image', 'category', 'version', 'badgeType', 'fileSize',
+                  'creationDate', 'lastModified', 'featured', 'summary')
+SUMMARY_LENGTH = 160
+
+
+def normalize_app_name(name):
+    """Görünmez yön karakterlerini temizleyerek ismi karşılaştırmaya hazırlar."""
+    return name.strip().replace('\u200e', '').replace('\u200f', '')
+
+
+def slugify(text):
+    """admin.js'teki ``generateSlug`` ile aynı kurallarla URL kısaltması üretir."""
+    slug = re.sub(r'[^a-z0-9\s-]', '', text.lower())
+    slug = re.sub(r'\s+', '-', slug)
+    slug = re.sub(r'-+', '-', slug)
+    return slug.strip('-')
+
+
+def _parse_timestamp(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, ValueError):
+        return 0.0
+
+
+def recency_timestamp(app):
+    """Uygulamanın creationDate ve lastModified değerlerinden yenisini döndürür."""
+    last_modified = _parse_timestamp(app.get('lastModified') or '1970-01-01T00:00:00+00:00')
+    creation_date_str = app.get('creationDate')
+    if creation_date_str:
+        return max(_parse_timestamp(creation_date_str), last_modified)
+    return last_modified
+
+
+class SortedView:
+    """Hazır sıralanmış, salt okunur uygulama görünümü.
+
+    Dilimleme yalnızca istenen aralığı kopyalar; böylece bir sayfa almak
+    tüm listeyi sıralamak yerine O(sayfa boyutu) maliyetindedir.
+    """
+
+    def __init__(self, entries, reverse=False):
+        self._entries = entries
+        self._reverse = reverse
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        entries = reversed(self._entries) if self._reverse else self._entries
+        return (entry[-1] for entry in entries)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            if index < 0:
+                index += len(self._entries)
+            if self._reverse:
+                index = len(self._entries) - 1 - index
+            return self._entries[index][-1]
+        start, stop, step = index.indices(len(self._entries))
+        if step != 1:
+            return list(self)[index]
+        if self._reverse:
+            size = len(self._entries)
+            entries = self._entries[max(size - stop, 0):max(size - start, 0)]
+            entries.reverse()
+        else:
+            entries = self._entries[start:stop]
+        return [entry[-1] for entry in entries]
+
+    # İmleçli (keyset) sayfalama: anahtar, girdinin ilk iki alanıdır; doc id
+    # işçiye özgü olduğundan imlece konmaz.
+
+    def key_at(self, index):
+        """Görünümde ``index`` konumundaki uygulamanın sıralama anahtarı."""
+        if index < 0:
+            index += len(self._entries)
+        if self._reverse:
+            index = len(self._entries) - 1 - index
+        return list(self._entries[index][:2])
+
+    def index_after(self, key):
+        """Görünüm sırasında ``key`` anahtarından sonra gelen ilk konum (O(log n))."""
+        key = tuple(key)
+        if self._reverse:
+            return len(self._entries) - bisect_left(self._entries, key + (-1,))
+        return bisect_right(self._entries, key + (float('inf'),))
+
+    def index_before(self, key):
+        """Görünüm sırasında ``key`` anahtarından önce gelen uygulama sayısı (O(log n))."""
+        key = tuple(key)
+        if self._reverse:
+            return len(self._entries) - bisect_right(self._entries, key + (float('inf'),))
+        return bisect_left(self._entries, key + (-1,))
+
+
+class SortedViews:
+    """Varsayılan (en yeni önce) ve isme göre sıralı görünümleri güncel tutar.
+
+    Sıralama anahtarları uygulama eklenirken bir kez hesaplanır; tarih
+    ayrıştırma isteklerde tekrarlanmaz. Girdiler ``(anahtar, eşitlik_bozucu,
+    doc_id, uygulama)`` demetleridir. Listeler kopyala-yaz (copy-on-write)
+    yöntemiyle güncellenir, böylece daha önce verilmiş görünümler sonraki
+    değişikliklerden etkilenmez.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._by_recency = []
+        self._by_name = []
+        self._entries = {}  # doc_id -> (recency girdisi, isim girdisi)
+        self._pending_add = []
+        self._pending_remove = set()
+
+    def add(self, doc_id, app):
+        name = app.get('name') or ''
+        entries = ((-recency_timestamp(app), name, doc_id, app), (name, '', doc_id, app))
+        self._entries[doc_id] = entries
+        self._pending_add.append(entries)
+
+    def remove(self, doc_id, app=None):
+        if self._entries.pop(doc_id, None) is not None:
+            self._pending_remove.add(doc_id)
+
+    def commit(self):
+        """Bekleyen ekleme/silmeleri yeni listelere uygular."""
+        if not self._pending_add and not self._pending_remove:
+            return
+        self._by_recency = self._merge(self._by_recency, 0)
+        self._by_name = self._merge(self._by_name, 1)
+        self._pending_add = []
+        self._pending_remove = set()
+
+    def _merge(self, entries, position):
+        removed = self._pending_remove
+        entries = [entry for entry in entries if entry[2] not in removed] if removed else list(entries)
+        added = [pair[position] for pair in self._pending_add if pair[position][2] in self._entries]
+        if len(added) > _BULK_THRESHOLD:
+            entries.extend(added)
+            entries.sort()
+        else:
+            for entry in added:
+                insort(entries, entry)
+        return entries
+
+    def view(self, sort, subset=None):
+        """``sort`` için hazır görünümü döndürür; bilinmeyen değerler varsayılana düşer.
+
+        ``subset`` (doc id kümesi) verilirse yalnızca o uygulamalar döner.
+        Küçük kümeler önceden hesaplanmış anahtarlarıyla sıralanır, büyük
+        kümeler için sıralı liste bir kez taranır.
+        """
+        by_name = sort in ('name-asc', 'name-desc')
+        entries = self._by_name if by_name else self._by_recency
+        if subset is not None:
+            if len(subset) * 8 < len(entries):
+                position = 1 if by_name else 0
+                entries = sorted(self._entries[doc_id][position] for doc_id in subset if doc_id in self._entries)
+            else:
+                entries = [entry for entry in entries if entry[2] in subset]
+        return SortedView(entries, reverse=(sort == 'name-desc'))
+
+
+def main_category_map(hierarchy):
+    """Alt kategori -> ana kategori eşlemesi."""
+    return {
+        subcategory: main_category
+        for main_category, data in hierarchy.items()
+        for subcategory in data['subcategories']
+    }
+
+
+def category_nodes(category, main_categories):
+    """Kategorinin ağaçta bulunduğu tüm düğümler (``CategoryIndex`` açıklamasına bakın)."""
+    parts = category.split(' > ')
+    nodes = [' > '.join(parts[:i + 1]) for i in range(len(parts))]
+    main_category = main_categories.get(parts[0])
+    if main_category:
+        nodes.append(main_category)
+    return nodes
+
+
+class CategoryIndex:
+    """Kategori ağacındaki her düğümü o düğümdeki uygulamaların doc id kümesine eşler.
+
+    ``'A > B > C'`` kategorisindeki bir uygulama ``A``, ``A > B`` ve
+    ``A > B > C`` düğümlerine; ilk parçası bir ana kategorinin alt kategorisi
+    ise (ör. ``Verimlilik``) o ana kategoriye (``Programlar``) de eklenir.
+    """
+
+    def __init__(self, hierarchy):
+        self._main_categories = main_category_map(hierarchy)
+        self.clear()
+
+    def clear(self):
+        self._nodes = {}  # düğüm -> doc id kümesi
+        self._exact = {}  # tam kategori metni -> uygulama sayısı
+        self._doc_categories = {}  # doc id -> (kategori, düğümler)
+
+    def add(self, doc_id, app):
+        category = app.get('category')
+        if not category:
+            return
+        nodes = category_nodes(category, self._main_categories)
+        for node in nodes:
+            self._nodes.setdefault(node, set()).add(doc_id)
+        self._exact[category] = self._exact.get(category, 0) + 1
+        self._doc_categories[doc_id] = (category, nodes)
+
+    def remove(self, doc_id, app=None):
+        category, nodes = self._doc_categories.pop(doc_id, (None, ()))
+        for node in nodes:
+            members = self._nodes[node]
+            members.discard(doc_id)
+            if not members:
+                del self._nodes[node]
+        if category is not None:
+            self._exact[category] -= 1
+            if not self._exact[category]:
+                del self._exact[category]
+
+    def commit(self):
+        """Kümeler yerinde güncellenir; toplu değişiklik sonunda yapılacak iş yoktur."""
+
+    def members(self, node):
+        """Düğümdeki (alt kategoriler dahil) uygulamaların doc id kümesi."""
+        return self._nodes.get(node, frozenset())
+
+    def existing(self):
+        """Uygulamalarda kullanılan kategori metinleri, sıralı."""
+        return sorted(self._exact)
+
+    def counts(self):
+        """Her düğüm için (alt kategoriler dahil) uygulama sayısı."""
+        return {node: len(members) for node, members in self._nodes.items()}
+
+
+class LookupIndex:
+    """Uygulamaları normalize edilmiş isim, sayısal id ve seoSlug ile O(1) bulur.
+
+    ``seoSlug`` alanı boş olan uygulamalar, admin panelinin URL'lerde
+    kullandığı gibi isimden üretilen kısaltmayla bulunur; açıkça verilmiş bir
+    ``seoSlug`` her zaman önceliklidir. Aynı anahtarı paylaşan birden fazla
+    uygulama varsa ilk eklenen döner.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._tables = {'name': {}, 'id': {}, 'slug': {}, 'generated_slug': {}}
+        self._doc_keys = {}  # doc id -> ((tablo, anahtar), ...)
+
+    @staticmethod
+    def _keys(app):
+        name = normalize_app_name(app.get('name') or '')
+        keys = [('name', name)]
+        app_id = app.get('id')
+        if isinstance(app_id, int) and not isinstance(app_id, bool):
+            keys.append(('id', app_id))
+        slug = app.get('seoSlug')
+        if slug:
+            keys.append(('slug', slug))
+        elif name:
+            keys.append(('generated_slug', slugify(name)))
+        return keys
+
+    def add(self, doc_id, app):
+        keys = self._keys(app)
+        for table, key in keys:
+            self._tables[table].setdefault(key, {})[doc_id] = app
+        self._doc_keys[doc_id] = keys
+
+    def remove(self, doc_id, app=None):
+        for table, key in self._doc_keys.pop(doc_id, ()):
+            bucket = self._tables[table][key]
+            del bucket[doc_id]
+            if not bucket:
+                del self._tables[table][key]
+
+    def commit(self):
+        """Tablolar yerinde güncellenir; toplu değişiklik sonunda yapılacak iş yoktur."""
+
+    def _first(self, table, key):
+        bucket = self._tables[table].get(key)
+        return next(iter(bucket.values())) if bucket else None
+
+    def by_name(self, name):
+        return self._first('name', normalize_app_name(name))
+
+    def name_doc_ids(self, name):
+        """Normalize edilmiş ismi ``name`` ile aynı olan tüm uygulamaların doc id'leri."""
+        return list(self._tables['name'].get(normalize_app_name(name), ()))
+
+    def by_id(self, app_id):
+        return self._first('id', app_id)
+
+    def by_slug(self, slug):
+        return self._first('slug', slug) or self._first('generated_slug', slug)
+
+
+def build_summary(app):
+    """Uygulamanın liste görünümü için kısa kaydını üretir.
+
+    ``slug`` uygulamanın seoSlug'ı (yoksa isimden üretilen kısaltma),
+    ``summary`` ise açıklamanın boşlukları sadeleştirilmiş ve kelime
+    sınırından kısaltılmış hâlidir.
+    """
+    summary = {field: app[field] for field in COMPACT_FIELDS if field in app}
+    summary['slug'] = app.get('seoSlug') or slugify(normalize_app_name(app.get('name') or ''))
+    description = ' '.join((app.get('description') or '').split())
+    if len(description) > SUMMARY_LENGTH:
+        description = description[:SUMMARY_LENGTH].rsplit(' ', 1)[0] + '…'
+    summary['summary'] = description
+    return summary
+
+
+def project_fields(app, fields, summary_func=build_summary):
+    """``fields`` alanlarını önce uygulamadan, yoksa kısa kaydından alır."""
+    summary = None
+    projected = {}
+    for field in fields:
+        if field in app:
+            projected[field] = app[field]
+        else:
+            if summary is None:
+                summary = summary_func(app)
+            if field in summary:
+                projected[field] = summary[field]
+    return projected
+
+
+class SummaryIndex:
+    """Her uygulamanın kısa kaydını (``build_summary``) eklenirken bir kez hazırlar.
+
+    Görüntüdeki sözlükler yerinde değiştirilmediği için kayıtlar nesne
+    kimliğiyle (``id(app)``) tutulur; sorgu sonuçlarındaki uygulamalar doğrudan
+    eşlenir. Artık görüntüde olmayan bir uygulama istenirse kayıt o an üretilir.
+
+    Tam ve kısa kayıtların JSON baytları (``fragment``) ilk istendiğinde bir
+    kez kodlanır ve uygulama katalogdan çıkana kadar saklanır.
+    """
+
+    def __init__(self):
+        self._fragment_lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self._summaries = {}  # id(uygulama) -> kısa kayıt
+        self._doc_objects = {}  # doc id -> id(uygulama)
+        with self._fragment_lock:
+            self._fragments = {}  # (id(uygulama), 'full' | 'compact') -> JSON baytları
+
+    def _drop_fragments(self, object_id):
+        with self._fragment_lock:
+            self._fragments.pop((object_id, 'full'), None)
+            self._fragments.pop((object_id, 'compact'), None)
+
+    def add(self, doc_id, app):
+        self._drop_fragments(id(app))  # Aynı kimliği daha önce kullanmış bir nesneden kalmış olabilir
+        self._summaries[id(app)] = build_summary(app)
+        self._doc_objects[doc_id] = id(app)
+
+    def remove(self, doc_id, app=None):
+        object_id = self._doc_objects.pop(doc_id, None)
+        if object_id is not None:
+            self._summaries.pop(object_id, None)
+            self._drop_fragments(object_id)
+
+    def commit(self):
+        """Kayıtlar yerinde güncellenir; toplu değişiklik sonunda yapılacak iş yoktur."""
+
+    def get(self, app):
+        summary = self._summaries.get(id(app))
+        return summary if summary is not None else build_summary(app)
+
+    def fragment(self, app, kind='full'):
+        """Uygulamanın tam (``'full'``) ya da kısa (``'compact'``) kaydının JSON baytları."""
+        key = (id(app), kind)
+        data = self._fragments.get(key)
+        if data is None:
+            data = encode(app if kind == 'full' else self.get(app))
+            with self._fragment_lock:
+                # Katalogdan çıkmış (eski görüntüdeki) uygulamalar saklanmaz
+                if id(app) in self._summaries:
+                    self._fragments[key] = data
+        return data
+
+    def project(self, app, fields):
+        """Uygulamanın yalnızca istenen alanlarını döndürür; kısa kayıttaki alanlar da seçilebilir."""
+        return project_fields(app, fields, self.get)
@@ -0,0 +1,488 @@
+"""apps.json yerine kullanılabilen SQLite/FTS5 katalog deposu.
+
+``CatalogStore`` ile aynı arayüzü sağlar ve ``CATALOG_BACKEND=sqlite`` ile
+seçilir. Uygulamanın tam kaydı (yorumlar hariç) JSON olarak ``app_data``
+tablosunda, filtre ve sıralamada kullanılan alanlar ``apps`` tablosunda
+tutulur; böylece filtre, sayım ve sıralama yalnızca dar satırları okur.
+Yorumlar ``reviews`` tablosunda, arama metni ``apps_fts`` FTS5 tablosunda,
+kategori ağacı düğümleri ``app_categories`` tablosundadır. Filtreleme,
+sıralama ve sayfalama indeksli sorgulara dönüşür; bir değişiklik kataloğun
+tamamını değil yalnızca etkilenen satırları yazar.
+
+Mevcut apps.json ``migrate_catalog.py`` ile aktarılır.
+"""
+import json
+from contextlib import contextmanager
+
+from catalog import apply_mutation
+from catalog_index import (build_summary, category_nodes, main_category_map, normalize_app_name,
+                           project_fields, recency_timestamp, slugify)
+from fast_json import encode
+from metrics import stage
+from search_index import FIELD_WEIGHTS, tokenize
+from tiered_cache import ConnectionPool
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS apps (
+    doc_id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    slug_explicit INTEGER NOT NULL,
+    app_id INTEGER,
+    category TEXT,
+    version TEXT,
+    file_size TEXT,
+    featured INTEGER NOT NULL,
+    last_modified TEXT,
+    recency_key REAL NOT NULL,
+    has_reviews INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS app_data (
+    doc_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL,
+    summary BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS apps_position ON apps (position);
+CREATE INDEX IF NOT EXISTS apps_name_key ON apps (name_key, position);
+CREATE INDEX IF NOT EXISTS apps_slug ON apps (slug, slug_explicit);
+CREATE INDEX IF NOT EXISTS apps_app_id ON apps (app_id);
+CREATE INDEX IF NOT EXISTS apps_recency ON apps (recency_key, name, doc_id);
+CREATE INDEX IF NOT EXISTS apps_name ON apps (name, doc_id);
+CREATE INDEX IF NOT EXISTS apps_featured ON apps (featured, last_modified);
+CREATE INDEX IF NOT EXISTS apps_category ON apps (category);
+CREATE TABLE IF NOT EXISTS reviews (
+    doc_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (doc_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS app_categories (
+    node TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    PRIMARY KEY (node, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS app_categories_doc ON app_categories (doc_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS apps_fts USING fts5(
+    name, seo_keywords, features, description,
+    tokenize = "unicode61 remove_diacritics 0 tokenchars '_'",
+    prefix = '2 3'
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0);
+'''
+
+# FTS5 sütunları ve search_index ile aynı alan ağırlıkları (bm25 sırasıyla)
+FTS_FIELDS = ('name', 'seoKeywords', 'features', 'description')
+BM25_WEIGHTS = ', '.join(str(FIELD_WEIGHTS[field]) for field in FTS_FIELDS)
+
+# Uygulama kaydını ve yorumlarını birlikte okuyan sütunlar (``apps a JOIN app_data d`` üzerinden);
+# json_group_array sıra garantisi vermez, yorumlar sıralı alt sorgudan toplanır
+APP_COLUMNS = ('a.doc_id, d.data, d.summary, a.has_reviews, '
+               'CASE WHEN a.has_reviews THEN '
+               '(SELECT json_group_array(json(r.data)) FROM '
+               '(SELECT data FROM reviews WHERE doc_id = a.doc_id ORDER BY position) r) END')
+APP_SOURCE = 'apps a JOIN app_data d ON d.doc_id = a.doc_id'
+
+
+# sort -> (ORDER BY, imleç anahtarı ifadeleri, azalan mı)
+SORT_ORDERS = {
+    'default': ('a.recency_key, a.name, a.doc_id', ('a.recency_key', 'a.name'), False),
+    'name-asc': ('a.name, a.doc_id', ('a.name', "''"), False),
+    'name-desc': ('a.name DESC, a.doc_id DESC', ('a.name', "''"), True),
+}
+
+ITER_BATCH_SIZE = 500
+
+
+def _search_text(value):
+    """Alanı search_index ile aynı şekilde katlanmış (casefold) terimlere çevirir."""
+    if isinstance(value, (list, tuple)):
+        value = ' '.join(str(item) for item in value)
+    return ' '.join(tokenize(str(value) if value else ''))
+
+
+def fts_query(search):
+    """Arama metnini, her parçası önek olarak eşleşen bir FTS5 sorgusuna çevirir."""
+    tokens = list(dict.fromkeys(tokenize(search)))
+    if not tokens:
+        return None
+    return ' AND '.join(f'"{token}"*' for token in tokens)
+
+
+class StoredApp(dict):
+    """Depodan okunan uygulama; kısa kaydın hazır JSON baytlarını da taşır."""
+
+    __slots__ = ('doc_id', 'summary_json')
+
+
+def _row_to_app(row):
+    doc_id, data, summary, has_reviews, reviews = row[:5]
+    app = StoredApp(json.loads(data))
+    if has_reviews:
+        app['reviews'] = json.loads(reviews) if reviews else []
+    app.doc_id = doc_id
+    app.summary_json = bytes(summary)
+    return app
+
+
+def _summary(app):
+    summary_json = getattr(app, 'summary_json', None)
+    return json.loads(summary_json) if summary_json is not None else build_summary(app)
+
+
+class QueryResult:
+    """Bir sorgunun tembel (lazy) sonucu: uzunluk, dilim ve tarama istendiğinde SQL'e dönüşür.
+
+    ``CatalogStore.query`` sonuçları gibi ``len()``, dilimleme ve döngüyle
+    kullanılır; bir sayfa almak ``LIMIT``/``OFFSET`` ile yalnızca o satırları
+    okur.
+    """
+
+    def __init__(self, store, from_clause, where, params, order_by):
+        self._store = store
+        self._from = from_clause
+        self._where = where
+        self._params = tuple(params)
+        self._order_by = order_by
+        self._length = None
+        # Sayım, filtre ve FTS eşleşmesinin asıl çalıştığı yer; süresi ona göre etiketlenir
+        self._count_stage = 'search' if any('apps_fts' in part for part in [from_clause] + list(where)) else 'filter'
+
+    def _sql(self, columns, condition=None):
+        where = list(self._where) + ([condition] if condition else [])
+        sql = f'SELECT {columns} FROM {self._from}'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        return sql
+
+    def __len__(self):
+        if self._length is None:
+            with stage(self._count_stage), self._store._connection() as conn:
+                self._length = conn.execute(self._sql('COUNT(*)'), self._params).fetchone()[0]
+        return self._length
+
+    def _columns(self):
+        return 'a.doc_id'
+
+    def _fetch(self, offset, limit, condition=None, condition_params=()):
+        """Sayfanın satırlarını iki adımda okur: önce sıralı doc id'ler, sonra yalnızca onların kayıtları.
+
+        Kayıt sütunları sıralamadan sonra okunur; aksi halde SQLite geçici
+        sıralama tablosu için eşleşen her satırın JSON'unu okurdu.
+        """
+        sql = self._sql(self._columns(), condition) + f' ORDER BY {self._order_by} LIMIT ? OFFSET ?'
+        with self._store._connection() as conn:
+            with stage('sort'):
+                keys = conn.execute(sql, self._params + tuple(condition_params) + (limit, offset)).fetchall()
+            if not keys:
+                return []
+            with stage('load'):
+                records = self._store._load_rows(conn, [key[0] for key in keys])
+        return [records[key[0]] + tuple(key[1:]) for key in keys]
+
+    def _page(self, start, stop):
+        return [_row_to_app(row) for row in self._fetch(start, stop - start)]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return self._page(start, stop) if stop > start else []
+        if index < 0:
+            index += len(self)
+        rows = self._fetch(index, 1)
+        if not rows:
+            raise IndexError(index)
+        return _row_to_app(rows[0])
+
+    def __iter__(self):
+        """Satırları ``ITER_BATCH_SIZE``'lık gruplar hâlinde okur (akıtılan yanıtlar için)."""
+        sql = self._sql('a.doc_id') + f' ORDER BY {self._order_by}'
+        with self._store._connection() as conn:
+            cursor = conn.execute(sql, self._params)
+            try:
+                while True:
+                    doc_ids = [row[0] for row in cursor.fetchmany(ITER_BATCH_SIZE)]
+                    if not doc_ids:
+                        break
+                    records = self._store._load_rows(conn, doc_ids)
+                    for doc_id in doc_ids:
+                        yield _row_to_app(records[doc_id])
+            finally:
+                cursor.close()  # Yarıda bırakılan okuma işlemi (transaction) açık kalmasın
+
+
+class KeyedQueryResult(QueryResult):
+    """İmleçli sayfalama için ``SortedView`` ile aynı anahtar yöntemlerini sağlayan sonuç.
+
+    Anahtar, ``SORT_ORDERS`` içindeki iki ifadedir. Konum hesapları sıralama
+    indeksinde satır-değeri (row value) karşılaştırmasıyla sayılır; imleçten
+    hemen sonraki sayfa ``OFFSET`` yerine doğrudan anahtardan itibaren okunur.
+    """
+
+    def __init__(self, store, from_clause, where, params, order_by, key_exprs, descending):
+        super().__init__(store, from_clause, where, params, order_by)
+        self._key = f'({key_exprs[0]}, {key_exprs[1]})'
+        self._descending = descending
+        self._keys = {}  # konum -> anahtar (son okunan sayfadan)
+        self._anchor = None  # (konum, koşul, parametreler): index_after ile bulunan başlangıç
+
+    def _columns(self):
+        return f'a.doc_id, {self._key[1:-1]}'
+
+    def _page(self, start, stop):
+        if self._anchor is not None and self._anchor[0] == start:
+            _, condition, condition_params = self._anchor
+            rows = self._fetch(0, stop - start, condition, condition_params)
+        else:
+            rows = self._fetch(start, stop - start)
+        for offset, row in enumerate(rows):
+            self._keys[start + offset] = list(row[5:7])
+        return [_row_to_app(row) for row in rows]
+
+    def _count(self, operator, key):
+        with self._store._connection() as conn:
+            sql = self._sql('COUNT(*)', f'{self._key} {operator} (?, ?)')
+            return conn.execute(sql, self._params + tuple(key)).fetchone()[0]
+
+    def key_at(self, index):
+        if index < 0:
+            index += len(self)
+        key = self._keys.get(index)
+        if key is None:
+            with self._store._connection() as conn:
+                sql = self._sql(self._key[1:-1]) + f' ORDER BY {self._order_by} LIMIT 1 OFFSET ?'
+                key = list(conn.execute(sql, self._params + (index,)).fetchone())
+        return key
+
+    def index_after(self, key):
+        # Görünüm sırasında anahtardan sonra gelenler: artan sırada büyükler, azalanda küçükler
+        index = self._count('>=' if self._descending else '<=', key)
+        condition = f'{self._key} {"<" if self._descending else ">"} (?, ?)'
+        self._anchor = (index, condition, tuple(key))
+        return index
+
+    def index_before(self, key):
+        return self._count('>' if self._descending else '<', key)
+
+
+class SQLiteCatalogStore:
+    """``CatalogStore`` arayüzünde, SQLite (WAL) dosyasında tutulan katalog.
+
+    Tüm gunicorn işçileri aynı dosyayı kullanır; değişiklikler tek bir
+    ``BEGIN IMMEDIATE`` işleminde yalnızca etkilenen satırlara yazılır ve
+    ``meta.version`` sayacını artırır. Yanıt önbelleği bu sayacı katalog
+    sürümü olarak kullanır.
+    """
+
+    def __init__(self, path='catalog.db', category_hierarchy=None, pool_size=8):
+        self.path = path
+        self._main_categories = main_category_map(category_hierarchy or {})
+        self._pool = ConnectionPool(path, pool_size, isolation_level=None)  # İşlemler (transaction) açıkça başlatılır
+        self._connection = self._pool.connection
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+    # --- yazma ---
+
+    def _delete_app(self, conn, doc_id):
+        conn.execute('DELETE FROM apps WHERE doc_id = ?', (doc_id,))
+        conn.execute('DELETE FROM app_data WHERE doc_id = ?', (doc_id,))
+        conn.execute('DELETE FROM reviews WHERE doc_id = ?', (doc_id,))
+        conn.execute('DELETE FROM app_categories WHERE doc_id = ?', (doc_id,))
+        conn.execute('DELETE FROM apps_fts WHERE rowid = ?', (doc_id,))
+
+    def _write_app(self, conn, app, position, doc_id=None):
+        """Uygulamayı ve bağlı satırlarını yazar; ``doc_id`` verilirse eski satırların yerine."""
+        if doc_id is not None:
+            self._delete_app(conn, doc_id)
+        name = app.get('name') or ''
+        name_key = normalize_app_name(name)
+        reviews = app.get('reviews')
+        has_reviews = isinstance(reviews, list)
+        data = {key: value for key, value in app.items() if not (key == 'reviews' and has_reviews)}
+        app_id = app.get('id')
+        if not isinstance(app_id, int) or isinstance(app_id, bool):
+            app_id = None
+        cursor = conn.execute(
+            'INSERT INTO apps (doc_id, position, name, name_key, slug, slug_explicit, app_id, category, version, '
+            'file_size, featured, last_modified, recency_key, has_reviews) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (doc_id, position, name, name_key, app.get('seoSlug') or slugify(name_key), bool(app.get('seoSlug')),
+             app_id, app.get('category'), app.get('version'), app.get('fileSize'), bool(app.get('featured', False)),
+             app.get('lastModified'), -recency_timestamp(app), has_reviews)
+        )
+        doc_id = cursor.lastrowid if doc_id is None else doc_id
+        conn.execute('INSERT INTO app_data (doc_id, data, summary) VALUES (?, ?, ?)',
+                     (doc_id, json.dumps(data, ensure_ascii=False), encode(build_summary(app))))
+        if has_reviews:
+            conn.executemany('INSERT INTO reviews (doc_id, position, data) VALUES (?, ?, ?)',
+                             [(doc_id, i, json.dumps(review, ensure_ascii=False)) for i, review in enumerate(reviews)])
+        category = app.get('category')
+        if category:
+            conn.executemany('INSERT OR IGNORE INTO app_categories (node, doc_id) VALUES (?, ?)',
+                             [(node, doc_id) for node in category_nodes(category, self._main_categories)])
+        conn.execute('INSERT INTO apps_fts (rowid, name, seo_keywords, features, description) VALUES (?, ?, ?, ?, ?)',
+                     (doc_id, *(_search_text(app.get(field)) for field in FTS_FIELDS)))
+        return doc_id
+
+    def _load_rows(self, conn, doc_ids):
+        """doc id -> kayıt satırı (``_row_to_app`` girdisi)."""
+        placeholders = ', '.join('?' * len(doc_ids))
+        rows = conn.execute(f'SELECT {APP_COLUMNS} FROM {APP_SOURCE} WHERE a.doc_id IN ({placeholders})', doc_ids)
+        return {row[0]: row for row in rows}
+
+    def _load_app(self, conn, doc_id):
+        row = self._load_rows(conn, [doc_id]).get(doc_id)
+        return _row_to_app(row) if row else None
+
+    def _rewrite(self, conn, rows, mutation):
+        """Seçilen satırlara ``apply_mutation`` uygular ve değişenleri yeniden yazar."""
+        for doc_id, position in rows:
+            app = self._load_app(conn, doc_id)
+            updated = apply_mutation([app], mutation)
+            if updated and updated[0] is not app:
+                self._write_app(conn, dict(updated[0]), position, doc_id)
+
+    def apply(self, mutation):
+        """Tek bir değişikliği yalnızca etkilenen satırlara uygular.
+
+        Değişiklik türleri ve anlamları ``catalog.apply_mutation`` ile aynıdır.
+        ``CatalogStore.apply``'dan farklı olarak yeni görüntüyü döndürmez.
+        """
+        op = mutation['op']
+        with self._transaction() as conn:
+            if op == 'add':
+                position = conn.execute('SELECT COALESCE(MIN(position), 0) - 1 FROM apps').fetchone()[0]
+                self._write_app(conn, mutation['app'], position)
+            elif op in ('update', 'featured'):
+                rows = conn.execute('SELECT doc_id, position FROM apps WHERE name_key = ? ORDER BY position LIMIT 1',
+                                    (normalize_app_name(mutation['name']),)).fetchall()
+                self._rewrite(conn, rows, mutation)
+            elif op == 'delete':
+                for (doc_id,) in conn.execute('SELECT doc_id FROM apps WHERE name_key = ?',
+                                              (normalize_app_name(mutation['name']),)).fetchall():
+                    self._delete_app(conn, doc_id)
+            elif op in ('rename_category', 'delete_category'):
+                old_name = mutation['old_name']
+                rows = conn.execute('SELECT doc_id, position FROM apps WHERE category = ? OR substr(category, 1, ?) = ?',
+                                    (old_name, len(old_name) + 3, old_name + ' > ')).fetchall()
+                self._rewrite(conn, rows, mutation)
+            else:
+                raise ValueError(f'Bilinmeyen değişiklik türü: {op}')
+
+    def save(self, apps):
+        """Kataloğun tamamını tek işlemde yeniden yazar (ilk aktarım ve toplu kayıt için)."""
+        with self._transaction() as conn:
+            for table in ('apps', 'app_data', 'reviews', 'app_categories', 'apps_fts'):
+                conn.execute(f'DELETE FROM {table}')
+            for position, app in enumerate(apps):
+                self._write_app(conn, app, position)
+
+    # --- okuma ---
+
+    def current_version(self):
+        with stage('load'), self._connection() as conn:
+            return conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+
+    def snapshot(self):
+        """Kataloğun tamamı, apps.json'daki sırayla (O(n); sorgular için ``query`` kullanın)."""
+        return list(QueryResult(self, 'apps a', [], (), 'a.position'))
+
+    def query(self, search=None, category=None, sort='default'):
+        """``CatalogStore.query`` ile aynı anlamda, SQL'e dönüşen tembel bir sonuç döndürür.
+
+        Arama FTS5 ile yapılır; varsayılan sıralama bm25 puanıdır (alan
+        ağırlıkları search_index ile aynı). ``name-asc``/``name-desc``
+        istenirse eşleşmeler isim sırasıyla döner.
+        """
+        where, params = [], []
+        if category:
+            where.append('a.doc_id IN (SELECT doc_id FROM app_categories WHERE node = ?)')
+            params.append(category)
+        match = None
+        if search:
+            match = fts_query(search)
+            if match is None:
+                return []
+            if sort not in ('name-asc', 'name-desc'):
+                return QueryResult(self, 'apps_fts JOIN apps a ON a.doc_id = apps_fts.rowid',
+                                   ['apps_fts MATCH ?'] + where, [match] + params,
+                                   f'bm25(apps_fts, {BM25_WEIGHTS}), a.doc_id')
+            where.append('a.doc_id IN (SELECT rowid FROM apps_fts WHERE apps_fts MATCH ?)')
+            params.append(match)
+        order_by, key_exprs, descending = SORT_ORDERS.get(sort, SORT_ORDERS['default'])
+        return KeyedQueryResult(self, 'apps a', where, params, order_by, key_exprs, descending)
+
+    def find(self, name=None, app_id=None, slug=None):
+        """Uygulamayı isim, id ya da seoSlug ile indeksten bulur; yoksa None döner."""
+        if name is not None:
+            condition, params, order = 'a.name_key = ?', (normalize_app_name(name),), 'a.position'
+        elif app_id is not None:
+            condition, params, order = 'a.app_id = ?', (app_id,), 'a.position'
+        else:
+            condition, params, order = 'a.slug = ?', (slug,), 'a.slug_explicit DESC, a.position'
+        with self._connection() as conn:
+            row = conn.execute(f'SELECT {APP_COLUMNS} FROM {APP_SOURCE} WHERE {condition} ORDER BY {order} LIMIT 1',
+                               params).fetchone()
+        return _row_to_app(row) if row else None
+
+    def has_name(self, name):
+        """Birebir ``name`` isimli uygulama var mı; normalize ismi aynı olan tüm uygulamalara bakılır."""
+        with self._connection() as conn:
+            row = conn.execute('SELECT 1 FROM apps WHERE name_key = ? AND name = ? LIMIT 1',
+                               (normalize_app_name(name), name)).fetchone()
+        return row is not None
+
+    def featured(self):
+        """Öne çıkarılan uygulamalar, en son değiştirilen önce."""
+        return list(QueryResult(self, 'apps a', ['a.featured = 1'], (), 'a.last_modified DESC, a.position'))
+
+    def count_in_category(self, name):
+        """Kategorisi ``name`` ya da onun bir alt kategorisi olan uygulama sayısı."""
+        with self._connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM apps WHERE category = ? OR substr(category, 1, ?) = ?',
+                                (name, len(name) + 3, name + ' > ')).fetchone()[0]
+
+    def category_summary(self):
+        """Kullanılan kategorileri ve ağaçtaki her düğümün uygulama sayısını döndürür."""
+        with self._connection() as conn:
+            existing = [row[0] for row in conn.execute(
+                "SELECT DISTINCT category FROM apps WHERE category IS NOT NULL AND category != '' ORDER BY category")]
+            counts = dict(conn.execute('SELECT node, COUNT(*) FROM app_categories GROUP BY node'))
+        return existing, counts
+
+    # --- yanıt parçaları ---
+
+    def project(self, apps, fields=None):
+        """Uygulamaları kısa kayıtlarına ya da ``fields`` ile seçilen alanlara indirger."""
+        if fields is None:
+            return (_summary(app) for app in apps)
+        return (project_fields(app, fields, _summary) for app in apps)
+
+    def iter_fragments(self, apps, kind='full'):
+        """Uygulamaların JSON baytları; kısa kayıtlar depoda hazır tutulur."""
+        for app in apps:
+            if kind == 'full':
+                yield encode(app)
+            else:
+                summary_json = getattr(app, 'summary_json', None)
+                yield summary_json if summary_json is not None else encode(build_summary(app))
+
+    def fragments(self, apps, kind='full'):
+        return list(self.iter_fragments(apps, kind))
@@ -0,0 +1,24 @@
+"""Sunucu ve çevrimdışı araçların paylaştığı kategori tanımları (Flask'e bağlı değildir)."""
+
+# Kategori hiyerarşisi - App Store kategorileri
+CATEGORY_HIERARCHY = {
+    "Oyunlar": {
+        "name": "Oyunlar",
+        "subcategories": [
+            "Aksiyon", "Macera", "Masa Oyunları", "Kart Oyunları", 
+            "Kumarhane Oyunları", "Basit Eğlence", "Aile", "Müzik Oyunları",
+            "Bulmaca", "Yarış", "Rol Yapma", "Simülasyon", "Spor Oyunları",
+            "Strateji", "Bilgi Yarışması", "Kelime Oyunları"
+        ]
+    },
+    "Programlar": {
+        "name": "Programlar",
+        "subcategories": [
+            "İş", "Geliştirici Araçları", "Eğitim", "Eğlence", "Finans",
+            "Grafik ve Tasarım", "Sağlık ve Fitness", "Yaşam Tarzı", "Tıp",
+            "Müzik", "Haberler", "Fotoğraf ve Video", "Verimlilik", "Referans",
+            "Alışveriş", "Sosyal Ağ", "Spor", "Seyahat", "Yardımcı Programlar",
+            "Hava Durumu"
+        ]
+    }
+}
@@ -0,0 +1,198 @@
+"""Precompressed static assets and JSON bodies for performance_server.py."""
+import gzip
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, g, make_response, request
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # Listed in requirements.txt; without it only gzip variants are built
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.html', '.json', '.svg', '.xml', '.txt', '.webmanifest')
+MIN_COMPRESS_SIZE = 1024
+STREAM_THRESHOLD = 256 * 1024  # Bodies above this are written in chunks
+STREAM_CHUNK_SIZE = 64 * 1024
+# The site's own pages and assets, compressed at startup; anything else the
+# static route serves is compressed on its first request. Data files such as
+# apps.json are left to the version-keyed EncodedBodyCache.
+WARM_ASSETS = (
+    'index.html', 'admin.html', 'style.css', 'script.js', 'admin.js', 'modal-system.js',
+    'performance-optimizer.js', 'sw.js', 'site.webmanifest', 'sitemap.xml', 'robots.txt', 'browserconfig.xml',
+)
+
+MIMETYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.html': 'text/html',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.xml': 'application/xml',
+    '.txt': 'text/plain',
+    '.webmanifest': 'application/manifest+json',
+}
+
+
+def supported_encodings():
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)  # mtime=0 keeps the output (and ETag) stable
+
+
+def negotiate_encoding():
+    """Pick the best encoding the client accepts, or None for identity."""
+    return request.accept_encodings.best_match(supported_encodings())
+
+
+def _chunks(body):
+    view = memoryview(body)
+    for start in range(0, len(view), STREAM_CHUNK_SIZE):
+        yield view[start:start + STREAM_CHUNK_SIZE]
+
+
+class EncodedBody:
+    """A response body plus its compressed variants, each built at most once."""
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self._variants = {}
+
+    def variant(self, encoding):
+        if encoding is None or len(self.body) < MIN_COMPRESS_SIZE:
+            return None, self.body
+        data = self._variants.get(encoding)
+        if data is None:
+            data = self._variants[encoding] = compress(self.body, encoding)
+        return encoding, data
+
+    def warm(self):
+        for encoding in supported_encodings():
+            self.variant(encoding)
+
+    def response(self):
+        """Build a response for the current request's Accept-Encoding."""
+        encoding, data = self.variant(negotiate_encoding())
+        if len(data) > STREAM_THRESHOLD:
+            response = Response(_chunks(data), mimetype=self.mimetype, direct_passthrough=True)
+            response.headers['Content-Length'] = str(len(data))
+        else:
+            response = Response(data, mimetype=self.mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.set_etag(f'{self.etag}-{encoding}' if encoding else self.etag)
+        return response.make_conditional(request)
+
+
+class StaticAssets:
+    """Compressed variants of the text assets under ``root``, keyed by file identity.
+
+    ``warm`` builds the variants of a fixed list of assets up front (at
+    startup); other files are built on their first request, and files that
+    change are rebuilt once on their next request.
+    """
+
+    def __init__(self, root='.'):
+        self.root = root
+        self._assets = {}  # path -> ((mtime_ns, size), EncodedBody)
+        self._lock = threading.Lock()
+
+    def _load(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        identity = (stat.st_mtime_ns, stat.st_size)
+        cached = self._assets.get(path)
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+        with open(path, 'rb') as f:
+            asset = EncodedBody(f.read(), MIMETYPES[os.path.splitext(path)[1]])
+        asset.warm()
+        with self._lock:
+            self._assets[path] = (identity, asset)
+        return asset
+
+    def warm(self, filenames=WARM_ASSETS):
+        for name in filenames:
+            self._load(os.path.join(self.root, name))
+
+    def response(self, filename):
+        """Response for a compressible asset, or None to fall back to send_file."""
+        if not filename.endswith(COMPRESSIBLE_EXTENSIONS):
+            return None
+        path = safe_join(self.root, filename)
+        if path is None or not os.path.isfile(path):
+            return None
+        asset = self._load(path)
+        return asset.response() if asset is not None else None
+
+
+class EncodedBodyCache:
+    """LRU of EncodedBody objects, emptied whenever the data version changes."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+                return None
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def set(self, key, version, body):
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[key] = body
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def precompressed_response(cache, version_func):
+    """Serve successful responses from compressed bodies cached per data version.
+
+    The view runs once per (endpoint, view args, query string, version);
+    repeated requests only pick the variant matching Accept-Encoding. Hits
+    are recorded in ``g.cache_status``; on a miss the view's own cache (if
+    any) sets it.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            version = version_func()
+            key = (request.endpoint, tuple(sorted(kwargs.items())), tuple(sorted(request.args.items(multi=True))))
+            lookup_start = time.perf_counter()
+            body = cache.get(key, version)
+            g.cache_lookup_ms = (time.perf_counter() - lookup_start) * 1000
+            if body is not None:
+                g.cache_status = 'HIT'
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                body = EncodedBody(response.get_data(), response.mimetype)
+                cache.set(key, version, body)
+            return body.response()
+        return decorated_function
+    return decorator
@@ -0,0 +1,741 @@
+"""Uygulama sayfalarından (App Store, Google Play, genel siteler) tek geçişte bilgi çıkaran motor."""
+import os
+import re
+from bisect import bisect_right
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from metrics import stage
+
+# 'html.parser' (varsayılan, ek bağımlılık yok) ya da 'lxml' (kuruluysa daha hızlı)
+SCRAPE_PARSER = os.environ.get('SCRAPE_PARSER', 'html.parser')
+
+INFO_DEFINITION_CLASS = 'information-list__item__definition'
+
+CATEGORY_MAPPING = {
+    'Üretkenlik': 'Verimlilik',
+    'Productivity': 'Verimlilik',
+    'Business': 'İş',
+    'Developer Tools': 'Geliştirici Araçları',
+    'Education': 'Eğitim',
+    'Entertainment': 'Eğlence',
+    'Finance': 'Finans',
+    'Graphics & Design': 'Grafik ve Tasarım',
+    'Health & Fitness': 'Sağlık ve Fitness',
+    'Lifestyle': 'Yaşam Tarzı',
+    'Medical': 'Tıp',
+    'Music': 'Müzik',
+    'News': 'Haberler',
+    'Photo & Video': 'Fotoğraf ve Video',
+    'Reference': 'Referans',
+    'Shopping': 'Alışveriş',
+    'Social Networking': 'Sosyal Ağ',
+    'Sports': 'Spor',
+    'Travel': 'Seyahat',
+    'Utilities': 'Yardımcı Programlar',
+    'Weather': 'Hava Durumu'
+}
+
+VERSION_KEYWORDS = ['version', 'sürüm', 'current version', 'v.', 'ver.']
+SIZE_KEYWORDS = ['size', 'boyut', 'file size', 'mb', 'gb', 'kb', 'megabyte', 'gigabyte']
+UPDATE_KEYWORDS = [
+    'what\'s new', 'güncelleme', 'yenilikler', 'changelog', 'release notes',
+    'update notes', 'version notes', 'patch notes', 'yeni özellikler'
+]
+REQUIREMENTS_KEYWORDS = [
+    'system requirements', 'sistem gereksinimleri', 'minimum requirements',
+    'gerekli sistem', 'platform', 'işletim sistemi', 'operating system',
+    'compatibility', 'uyumluluk', 'requirements', 'gereksinimler'
+]
+PLATFORM_TERMS = ['Mac', 'iPhone', 'iPad', 'iPod touch', 'Apple TV', 'Apple Watch']
+PLATFORM_KEYWORDS = ['iOS', 'Android', 'Windows', 'macOS', 'Linux', 'Chrome OS']
+SCREENSHOT_CONTAINER_CLASSES = ['screenshots', 'screenshot', 'app-screenshot', 'gallery', 'carousel', 'slider', None, 'preview']
+ICON_CONTAINER_CLASSES = ['app-icon', 'logo', 'icon']
+
+
+def resolve_parser(parser=None):
+    """İstenen ayrıştırıcıyı döndürür; lxml kurulu değilse html.parser'a düşer."""
+    parser = parser or SCRAPE_PARSER
+    if parser == 'lxml':
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return 'html.parser'
+    return parser
+
+
+def attr_matches(value, match):
+    """BeautifulSoup'un öznitelik eşleştirmesini uygular.
+
+    Çok değerli özniteliklerde (class, rel) her değer ayrı ayrı ve ardından
+    boşlukla birleştirilmiş hali denenir; eksik öznitelik ``None`` olarak
+    değerlendirilir.
+    """
+    if isinstance(value, (list, tuple)):
+        return any(attr_matches(item, match) for item in value) or attr_matches(' '.join(value), match)
+    if match is True:
+        return value is not None
+    if callable(match):
+        return match(value)
+    return value is not None and value == match
+
+
+def _joined(value):
+    return ' '.join(value) if isinstance(value, (list, tuple)) else value
+
+
+class PageIndex:
+    """Belgeyi bir kez gezip etiketleri ada göre, belge sırasıyla gruplar.
+
+    Her etikete önsıra (pre-order) numarası ve alt ağacının bittiği numara
+    verilir; "bu bölümün içindeki tüm p'ler" gibi sorgular ağacı yeniden
+    gezmek yerine ikili aramayla yanıtlanır. Metinler ilk istendiğinde
+    hesaplanıp saklanır.
+    """
+
+    def __init__(self, soup):
+        self.soup = soup
+        self.tags = []  # belge sırasında tüm etiketler
+        self.strings = []  # belge sırasında tüm metin düğümleri
+        self._by_name = {}
+        self._positions = {}
+        self._spans = {}
+        self._texts = {}
+        self._lower_texts = {}
+        self._full_text = None
+
+        stack = [iter(soup.contents)]
+        parents = []
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                if parents:
+                    tag, start = parents.pop()
+                    self._spans[id(tag)] = (start, len(self.tags) - 1)
+                continue
+            if isinstance(child, Tag):
+                position = len(self.tags)
+                self.tags.append(child)
+                self._by_name.setdefault(child.name, []).append(child)
+                self._positions.setdefault(child.name, []).append(position)
+                parents.append((child, position))
+                stack.append(iter(child.contents))
+            elif isinstance(child, NavigableString):
+                self.strings.append(child)
+
+    def find_all(self, name, within=None, attrs=None, **kwargs):
+        """``within`` altındaki (verilmezse tüm belgedeki) ``name`` etiketleri.
+
+        ``attrs`` ve anahtar kelime argümanları ``attr_matches`` kurallarıyla
+        karşılaştırılır; ``class_`` anahtarı ``class`` özniteliğine karşılık gelir.
+        """
+        attrs = dict(attrs or {}, **kwargs)
+        tags = self._by_name.get(name, [])
+        if within is not None and within is not self.soup:
+            start, end = self._spans[id(within)]
+            positions = self._positions.get(name, [])
+            tags = tags[bisect_right(positions, start):bisect_right(positions, end)]
+        if attrs:
+            conditions = [(key.rstrip('_'), match) for key, match in attrs.items()]
+            tags = [tag for tag in tags if all(attr_matches(tag.get(key), match) for key, match in conditions)]
+        return tags
+
+    def find(self, name, within=None, attrs=None, **kwargs):
+        tags = self.find_all(name, within, attrs, **kwargs)
+        return tags[0] if tags else None
+
+    def descendants(self, within, names):
+        """``within`` altındaki, adı ``names`` içinde olan etiketler (belge sırasıyla)."""
+        if within is self.soup:
+            return [tag for tag in self.tags if tag.name in names]
+        start, end = self._spans[id(within)]
+        return [tag for tag in self.tags[start + 1:end + 1] if tag.name in names]
+
+    def text(self, tag):
+        """``tag.get_text(strip=True)`` değeri (önbellekli)."""
+        key = id(tag)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = tag.get_text(strip=True)
+        return text
+
+    def lower_text(self, tag):
+        key = id(tag)
+        text = self._lower_texts.get(key)
+        if text is None:
+            text = self._lower_texts[key] = self.text(tag).lower()
+        return text
+
+    @property
+    def full_text(self):
+        if self._full_text is None:
+            self._full_text = self.soup.get_text()
+        return self._full_text
+
+
+def _has_ancestor(tag, predicate):
+    parent = tag.parent
+    while isinstance(parent, Tag) and not isinstance(parent, BeautifulSoup):
+        if predicate(parent):
+            return True
+        parent = parent.parent
+    return False
+
+
+def _has_class(class_name):
+    return lambda tag: class_name in (tag.get('class') or ())
+
+
+def _paragraph_texts(page, container, min_length):
+    texts = []
+    for p in page.find_all('p', container):
+        text = page.text(p)
+        if text and len(text) > min_length:
+            texts.append(text)
+    return texts
+
+
+def find_by_keyword(page, keywords, tag_name='div'):
+    """Belirli anahtar kelimeleri içeren metinleri arar."""
+    for keyword in keywords:
+        try:
+            element = next((tag for tag in page.find_all(tag_name) if keyword in page.lower_text(tag)), None)
+            if element:
+                parent_text = element.get_text(separator=' ', strip=True)
+                match = re.search(fr'{re.escape(keyword)}[\s:]*([\d.v\sA-Z]+[a-zA-Z]?)?', parent_text, re.IGNORECASE)
+                if match and match.group(1):
+                    return match.group(1).strip()
+        except Exception:
+            continue
+    return None
+
+
+def get_highest_res_from_srcset(srcset):
+    """srcset içindeki en yüksek çözünürlüklü görseli bulur."""
+    if not srcset:
+        return None
+
+    highest_res = 0
+    best_url = ''
+
+    candidates = srcset.split(',')
+    for candidate in candidates:
+        parts = candidate.strip().split()
+        if len(parts) != 2:
+            continue
+
+        url = parts[0]
+        descriptor = parts[1]
+
+        if descriptor.endswith('w'):
+            res = int(descriptor[:-1])
+            if res > highest_res:
+                highest_res = res
+                best_url = url
+
+    # Eğer hiç 'w' tanımlayıcı bulunamazsa, ilk URL'yi al
+    if not best_url and candidates:
+        best_url = candidates[0].strip().split()[0]
+
+    return best_url
+
+
+def _extract_description(page, url, og_description, description_meta):
+    app_description = None
+
+    # App Store için özel açıklama çekme
+    if 'itunes.apple.com' in url:
+        # 1. Önce section elementini ara (en detaylı açıklama)
+        description_section = page.find('section', attrs={'data-test': 'product-description'})
+        if description_section:
+            description_texts = _paragraph_texts(page, description_section, 10)
+            if description_texts:
+                app_description = '\n\n'.join(description_texts)
+
+        # 1.5. div class="l-column" (App Store yeni yapısı)
+        if not app_description:
+            for column in page.find_all('div', class_='l-column'):
+                description_texts = _paragraph_texts(page, column, 20)
+                if description_texts and len('\n\n'.join(description_texts)) > 100:
+                    app_description = '\n\n'.join(description_texts)
+                    break
+
+        # 2. div class="we-truncate"
+        if not app_description:
+            truncate_div = page.find('div', class_='we-truncate')
+            if truncate_div:
+                description_texts = _paragraph_texts(page, truncate_div, 10)
+                if description_texts:
+                    app_description = '\n\n'.join(description_texts)
+
+        # 3. Genel paragraf arama - en uzun paragraf
+        if not app_description:
+            long_paragraphs = _paragraph_texts(page, None, 50)
+            if long_paragraphs:
+                app_description = max(long_paragraphs, key=len)
+
+        # 4. Meta description
+        if not app_description:
+            if description_meta and description_meta.get('content'):
+                app_description = description_meta['content']
+
+    # Diğer siteler için açıklama çekme
+    if not app_description:
+        long_paragraphs = _paragraph_texts(page, None, 100)
+        if long_paragraphs:
+            app_description = max(long_paragraphs, key=len)
+
+        if not app_description:
+            description_class = lambda x: x and any(keyword in x.lower() for keyword in ['description', 'content', 'about', 'summary'])
+            for div in page.find_all('div', class_=description_class):
+                text = page.text(div)
+                if text and len(text) > 50:
+                    app_description = text
+                    break
+
+        if not app_description:
+            app_description = (og_description['content'] if og_description and og_description.get('content')
+                               else description_meta['content'] if description_meta and description_meta.get('content') else None)
+
+    # Açıklamayı temizle - fazla boşlukları tek boşluğa indir
+    if app_description:
+        app_description = re.sub(r'\s+', ' ', app_description).strip()
+        if len(app_description) < 20:
+            app_description = None  # Çok kısa açıklamaları filtrele
+        elif len(app_description) > 10000:
+            app_description = app_description[:10000] + "..."
+    return app_description
+
+
+def _extract_version(page):
+    version_element = page.find('p', class_='l-column small-6 medium-12 whats-new__latest__version')
+    if version_element:
+        app_version = page.text(version_element)
+    else:
+        app_version = find_by_keyword(page, VERSION_KEYWORDS, 'div') or find_by_keyword(page, VERSION_KEYWORDS, 'span')
+
+    # Sürüm formatını düzelt - sadece versiyon numarası
+    if not app_version:
+        return '1.0'  # Varsayılan sürüm (sadece numara)
+    app_version = re.sub(r'^sürüm\s*', '', app_version, flags=re.IGNORECASE).strip()
+    version_match = re.search(r'(\d+(?:\.\d+)*)', app_version)
+    return version_match.group(1) if version_match else app_version
+
+
+def _extract_file_size(page):
+    size_element = page.find('dd', class_=INFO_DEFINITION_CLASS, attrs={'aria-label': True})
+    if size_element:
+        aria_label = size_element.get('aria-label', '').lower()
+        if 'megabyte' in aria_label or 'gigabyte' in aria_label:
+            return page.text(size_element)
+    return find_by_keyword(page, SIZE_KEYWORDS, 'div') or find_by_keyword(page, SIZE_KEYWORDS, 'span')
+
+
+def _find_simple_category(page, keyword):
+    """Sayfa metninde anahtar kelimeden sonraki iki satıra bakar."""
+    lines = page.full_text.split('\n')
+    for i, line in enumerate(lines):
+        if keyword.lower() in line.lower():
+            for j in range(i + 1, min(i + 3, len(lines))):
+                next_line = lines[j].strip()
+                if next_line and next_line.lower() != keyword.lower():
+                    return next_line
+    return None
+
+
+# Anahtar kelimeyi içeren etiket ve hemen ardından gelen, yalnızca metin içeren kardeşi
+CATEGORY_LABEL_PAIRS = [('div', 'div'), ('span', 'span'), ('label', 'div'), ('strong', 'span'), ('b', 'div')]
+
+
+def _next_element(tag):
+    """Aradaki boşluklar dışında ``tag``'den hemen sonra gelen kardeş etiket."""
+    sibling = tag.next_sibling
+    while isinstance(sibling, NavigableString) and not sibling.strip():
+        sibling = sibling.next_sibling
+    return sibling if isinstance(sibling, Tag) else None
+
+
+def _find_category_after_keyword(page, keyword):
+    """Anahtar kelimeyi içeren etiketin ardından gelen metni bulur.
+
+    Etiket/değer çiftleri ve ``Kategori: Değer`` biçimindeki metinler
+    ``PageIndex`` üzerinden aranır; ham HTML taranmaz, bu yüzden öznitelik
+    değerlerindeki (ör. ``/store/apps/category/`` linkleri) geçişler eşleşmez.
+    """
+    keyword_lower = keyword.lower()
+    if keyword_lower not in page.full_text.lower():
+        return None
+
+    for label_name, value_name in CATEGORY_LABEL_PAIRS:
+        for element in page.find_all(label_name):
+            if keyword_lower not in page.lower_text(element):
+                continue
+            value = _next_element(element)
+            if (value is not None and value.name == value_name and value.contents
+                    and all(isinstance(child, NavigableString) for child in value.contents)):
+                text = value.get_text().strip()
+                if text and text.lower() != keyword_lower:
+                    return text
+
+    # Aynı metin düğümünde anahtar kelimeden sonra gelen değer
+    for string in page.strings:
+        position = string.lower().find(keyword_lower)
+        if position < 0:
+            continue
+        text = string[position + len(keyword):].lstrip(': \t\r\n').split('\n', 1)[0].strip()
+        if text and text.lower() != keyword_lower:
+            return text
+
+    for element in page.descendants(page.soup, {'div', 'span', 'label', 'strong', 'b', 'p', 'td', 'th'}):
+        if keyword_lower not in page.text(element).lower():
+            continue
+        # Kardeş elementleri kontrol et
+        for sibling in element.find_next_siblings():
+            sibling_text = page.text(sibling)
+            if sibling_text and sibling_text.lower() != keyword_lower:
+                return sibling_text
+        parent = element.parent
+        if parent:
+            # Parent'ın kardeş elementlerini kontrol et
+            for sibling in parent.find_next_siblings():
+                sibling_text = page.text(sibling)
+                if sibling_text and sibling_text.lower() != keyword_lower:
+                    return sibling_text
+            # Aynı parent içindeki diğer elementleri kontrol et
+            for child in page.descendants(parent, {'div', 'span', 'a', 'p', 'td', 'th'}):
+                if child != element:
+                    child_text = page.text(child)
+                    if child_text and child_text.lower() != keyword_lower:
+                        return child_text
+    return None
+
+
+def _extract_category(page):
+    app_category = 'Kategorisiz'
+    genre_href = lambda x: x and 'itunes.apple.com/tr/genre/' in x
+
+    # 1. Kategori linki
+    category_link = page.find('a', class_='link', href=genre_href)
+    if category_link:
+        app_category = page.text(category_link)
+    else:
+        # 2. dd elementleri - link ya da düz metin
+        for category_element in page.find_all('dd', class_=INFO_DEFINITION_CLASS):
+            category_link = page.find('a', category_element, class_='link')
+            if category_link and 'itunes.apple.com/tr/genre/' in category_link.get('href', ''):
+                app_category = page.text(category_link)
+                break
+            text = page.text(category_element)
+            if text and len(text) > 3 and text != 'Kategorisiz':
+                app_category = text
+                break
+
+    # 3. App Store kategorilerini bizim kategorilerimize çevir
+    app_category = CATEGORY_MAPPING.get(app_category, app_category)
+
+    # 4. Genel arama
+    if app_category == 'Kategorisiz':
+        category_text = (_find_simple_category(page, 'Kategori')
+                         or _find_simple_category(page, 'Category')
+                         or _find_category_after_keyword(page, 'Kategori')
+                         or _find_category_after_keyword(page, 'Category'))
+        if category_text:
+            app_category = category_text
+        else:
+            category_element = (page.find('a', attrs={'data-testid': 'category-link'})
+                                or page.find('a', class_='category-link'))
+            if category_element:
+                app_category = page.text(category_element)
+            else:
+                # Google Play kategorileri
+                category_element = page.find('a', href=lambda x: x and '/store/apps/category/' in x)
+                if category_element:
+                    app_category = page.text(category_element)
+    return app_category
+
+
+def _is_valid_screenshot(url):
+    """Sadece gerçek uygulama ekran görüntülerini kabul eder."""
+    if any(keyword in url for keyword in ['AppIcon', 'icon', 'Icon', 'logo', 'Logo']):
+        return False
+    size_patterns = ['1286x0w', '1280x0w', '1200x0w', '1000x0w', '800x0w', '600x0w']
+    if not any(pattern in url for pattern in size_patterns):
+        return False
+    valid_patterns = [
+        'Hero', 'Screenshot', 'screenshot', 'App_Store_Image',
+        'PurpleSource', 'Mac_', 'iPhone_', 'iPad_'
+    ]
+    return any(pattern in url for pattern in valid_patterns)
+
+
+def _is_screenshot_url(url):
+    if any(keyword in url for keyword in ['AppIcon', 'icon', 'Icon']):
+        return False
+    if any(keyword in url for keyword in ['App_Store_Image', 'screenshot', 'Screenshot', 'PurpleSource']):
+        return True
+    return 'mzstatic.com' in url and any(ext in url for ext in ['.jpg', '.jpeg', '.png', '.webp'])
+
+
+def _extract_mzstatic_images(page):
+    """Sayfadaki tüm link, source ve img etiketlerinden ekran görüntüsü adaylarını toplar."""
+    images = []
+    for link in page.find_all('a', href=True):
+        if _is_screenshot_url(link['href']):
+            images.append(link['href'])
+    for source in page.find_all('source', srcset=True):
+        srcset = source['srcset']
+        if 'mzstatic.com' in srcset:
+            best_url = get_highest_res_from_srcset(srcset)
+            if best_url and _is_screenshot_url(best_url):
+                images.append(best_url)
+    for img in page.find_all('img', src=True):
+        if _is_screenshot_url(img['src']):
+            images.append(img['src'])
+    return list(dict.fromkeys(images))  # Duplikatları kaldır
+
+
+def _extract_screenshots(page, url):
+    internal_images = []
+    seen_bases = set()
+
+    # App Store picture elementleri
+    for picture in page.find_all('picture', class_=lambda x: x and 'we-artwork' in x):
+        for source in page.find_all('source', picture, srcset=True):
+            srcset = source['srcset']
+            if 'mzstatic.com' not in srcset:
+                continue
+            best_url = get_highest_res_from_srcset(srcset)
+            if best_url and 'mzstatic.com' in best_url and _is_valid_screenshot(best_url):
+                # Aynı görselin farklı formatlarını atla
+                base_url = re.sub(r'\.(webp|png|jpg|jpeg)$', '', best_url)
+                if base_url not in seen_bases:
+                    seen_bases.add(base_url)
+                    internal_images.append(best_url)
+
+    # Picture elementlerinden görsel bulunamadıysa genel mzstatic araması
+    if not internal_images:
+        internal_images = _extract_mzstatic_images(page)
+
+    # Google Play için özel seçiciler
+    if not internal_images:
+        in_screenshot = lambda tag: attr_matches(tag.get('class'), 'screenshot') or attr_matches(tag.get('class'), 'screenshot-image')
+        for img in page.find_all('img'):
+            if _has_ancestor(img, in_screenshot):
+                src = img.get('src') or img.get('data-src')
+                if src and src not in internal_images:
+                    internal_images.append(urljoin(url, src))
+
+    # Genel fallback - galeri/slider içindeki görseller
+    if not internal_images:
+        for class_name in SCREENSHOT_CONTAINER_CLASSES:
+            if class_name is None:
+                predicate = lambda tag: tag.get('data-screenshot') is not None
+            else:
+                predicate = _has_class(class_name)
+            for img in page.find_all('img'):
+                if not _has_ancestor(img, predicate):
+                    continue
+                src = img.get('src') or img.get('data-src') or img.get('data-lazy')
+                if src and src not in internal_images and not src.startswith('data:'):
+                    # Sadece gerçek URL'leri al
+                    if src.startswith('http') or src.startswith('//') or src.startswith('/'):
+                        internal_images.append(urljoin(url, src))
+            if internal_images:
+                break
+    return internal_images
+
+
+def _extract_icon(page, url):
+    """og:image bulunamadığında ikon bağlantılarına ve ikon görsellerine bakar."""
+    candidates = [
+        # CSS seçicileri gibi rel değerinin tamamı karşılaştırılır
+        lambda: next((link for link in page.find_all('link') if _joined(link.get('rel')) == 'apple-touch-icon'), None),
+        lambda: next((link for link in page.find_all('link') if _joined(link.get('rel')) == 'icon'), None),
+        lambda: next((link for link in page.find_all('link') if _joined(link.get('rel')) == 'shortcut icon'), None),
+        lambda: page.find('meta', property='og:image'),
+        lambda: page.find('meta', attrs={'name': 'twitter:image'}),
+    ]
+    for class_name in ICON_CONTAINER_CLASSES:
+        predicate = _has_class(class_name)
+        candidates.append(lambda predicate=predicate: next(
+            (img for img in page.find_all('img') if _has_ancestor(img, predicate)), None))
+
+    for candidate in candidates:
+        element = candidate()
+        if not element:
+            continue
+        if element.name == 'link':
+            icon_url = element.get('href')
+        elif element.name == 'meta':
+            icon_url = element.get('content')
+        else:
+            icon_url = element.get('src') or element.get('data-src')
+        if icon_url and not icon_url.startswith('data:'):
+            return urljoin(url, icon_url)
+    return None
+
+
+def _string_matches(tag, keyword):
+    text = tag.string
+    return bool(text) and keyword.lower() in text.lower()
+
+
+def _first_with_string(page, names, keyword):
+    if len(names) == 1:
+        tags = page.find_all(names[0])
+    else:
+        tags = page.descendants(page.soup, set(names))
+    return next((tag for tag in tags if _string_matches(tag, keyword)), None)
+
+
+def _extract_update_notes(page):
+    update_notes = []
+
+    # App Store güncelleme notları - whats-new bölümleri
+    for whats_new_div in page.find_all('div', class_=lambda x: x and 'whats-new' in x):
+        time_element = page.find('time', whats_new_div, attrs={'data-test-we-datetime': True})
+        version_element = page.find('p', whats_new_div, class_=lambda x: x and 'version' in x)
+        date_text = page.text(time_element) if time_element else ''
+        version_text = page.text(version_element) if version_element else ''
+
+        for content_div in page.find_all('div', whats_new_div, class_=lambda x: x and 'we-truncate' in x):
+            for p in page.find_all('p', content_div):
+                text = page.text(p)
+                if text and text not in ['', 'PATCH HIGHTLIGHTS']:
+                    # Başlık olmayan metinleri al
+                    if not text.isupper() or len(text) < 20:
+                        update_notes.append(text)
+
+            if update_notes:
+                # Tarih ve sürüm varsa başa ekle
+                if date_text and version_text:
+                    update_notes.insert(0, f"📅 {date_text} - {version_text}")
+                elif version_text:
+                    update_notes.insert(0, f"📱 {version_text}")
+                break
+
+        if update_notes:
+            break
+
+    if update_notes:
+        return update_notes
+
+    # Madde işaretli paragraflar
+    for p in page.find_all('p'):
+        text = page.text(p)
+        if text and (text.startswith('•') or text.startswith('-') or text.startswith('*')):
+            if len(text) > 10:
+                update_notes.append(text)
+
+    # "What's new" benzeri başlıklardan sonraki metin
+    if not update_notes:
+        for keyword in UPDATE_KEYWORDS:
+            update_element = _first_with_string(page, ['div'], keyword) or _first_with_string(page, ['h2', 'h3'], keyword)
+            if update_element:
+                for sibling in update_element.find_next_siblings():
+                    sibling_text = page.text(sibling)
+                    if sibling_text and len(sibling_text) > 10:
+                        update_notes.append(sibling_text)
+                        break
+                break
+    return update_notes
+
+
+def _extract_system_requirements(page):
+    system_requirements = []
+
+    # App Store bilgi listesi: <dd> içindeki <dl><dt>platform</dt><dd>gereksinim</dd></dl>
+    for info_def in page.find_all('dd', class_=INFO_DEFINITION_CLASS):
+        for dl in page.find_all('dl', info_def, class_='information-list__item__definition__item'):
+            dt = page.find('dt', dl, class_='information-list__item__definition__item__term')
+            dd = page.find('dd', dl, class_='information-list__item__definition__item__definition')
+            if dt and dd:
+                term_text = page.text(dt)
+                definition_text = page.text(dd)
+                if any(platform in term_text for platform in PLATFORM_TERMS):
+                    clean_requirement = definition_text.replace('&nbsp;', ' ').strip()
+                    if clean_requirement and len(clean_requirement) > 5:
+                        system_requirements.append(f"{term_text}: {clean_requirement}")
+
+    if system_requirements:
+        return system_requirements
+
+    for keyword in REQUIREMENTS_KEYWORDS:
+        req_element = _first_with_string(page, ['div'], keyword) or _first_with_string(page, ['span'], keyword)
+        if req_element:
+            for sibling in req_element.find_next_siblings():
+                sibling_text = page.text(sibling)
+                if sibling_text and len(sibling_text) > 10:
+                    system_requirements.append(sibling_text)
+                    break
+            break
+
+        req_element = _first_with_string(page, ['p'], keyword)
+        if req_element:
+            req_text = page.text(req_element)
+            if req_text and len(req_text) > 10:
+                system_requirements.append(req_text)
+                break
+
+    # Genel platform bilgileri
+    if not system_requirements:
+        for keyword in PLATFORM_KEYWORDS:
+            for element in page.strings:
+                if keyword not in element:
+                    continue
+                parent_text = page.text(element.parent) if element.parent else ''
+                if len(parent_text) > 5 and len(parent_text) < 200:
+                    system_requirements.append(parent_text)
+                    break
+            if system_requirements:
+                break
+    return system_requirements
+
+
+def extract_app_data(content, url, parser=None):
+    """Sayfa içeriğinden uygulama bilgilerini çıkarır.
+
+    Belge bir kez ayrıştırılıp ``PageIndex`` ile tek geçişte dizinlenir; tüm
+    alanlar bu dizin üzerinden doldurulur.
+    """
+    with stage('parse'):
+        page = PageIndex(BeautifulSoup(content, resolve_parser(parser)))
+    with stage('extract'):
+        return _extract_fields(page, url)
+
+
+def _extract_fields(page, url):
+    # --- Temel Bilgiler ---
+    title_tag = page.find('title')
+    title = page.text(title_tag) if title_tag else None
+    description_meta = page.find('meta', attrs={'name': 'description'})
+    og_description = page.find('meta', property='og:description')
+    og_title = page.find('meta', property='og:title')
+    og_image = page.find('meta', property='og:image')
+    icon_link = page.find('link', rel='icon') or page.find('link', rel='shortcut icon')
+
+    app_name = og_title['content'] if og_title and og_title.get('content') else title
+    app_description = _extract_description(page, url, og_description, description_meta)
+
+    image_url = og_image['content'] if og_image and og_image.get('content') else None
+    if not image_url and icon_link and icon_link.get('href'):
+        image_url = urljoin(url, icon_link['href'])
+
+    internal_images = _extract_screenshots(page, url)
+    if not image_url:
+        image_url = _extract_icon(page, url)
+
+    return {
+        'name': app_name,
+        'description': app_description,
+        'website': url,
+        'image': image_url,
+        'version': _extract_version(page),
+        'fileSize': _extract_file_size(page),
+        'category': _extract_category(page),
+        'internalImages': internal_images[:10],
+        'systemRequirements': _extract_system_requirements(page)[:5],  # En fazla 5 sistem gereksinimi
+        'features': _extract_update_notes(page)[:10]  # En fazla 10 güncelleme notu
+    }
@@ -0,0 +1,99 @@
+"""Hazır kodlanmış JSON parçalarından yanıt gövdesi oluşturma yardımcıları.
+
+Büyük listeler (ör. ``limit=0``) tek bir gövdede birleştirilmek yerine
+parça parça akıtılabilir; böylece isteğin bellek kullanımı katalog
+büyüklüğünden bağımsız kalır.
+"""
+import json
+import zlib
+
+from flask import current_app, request
+
+try:
+    import orjson
+except ImportError:  # İsteğe bağlı: yoksa standart json modülü kullanılır
+    orjson = None
+
+# Akışta parçalar bu büyüklüğe ulaşınca birlikte gönderilir
+STREAM_BATCH_BYTES = 64 * 1024
+
+
+def encode(value):
+    """Değeri UTF-8 JSON baytlarına çevirir (anahtarlar sıralı, boşluksuz)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def join_array(fragments):
+    """Kodlanmış parçaları bir JSON dizisinde birleştirir."""
+    return b'[' + b','.join(fragments) + b']'
+
+
+def envelope(key, fragments, **fields):
+    """``{key: [parçalar], **fields}`` nesnesini parçaları yeniden kodlamadan oluşturur."""
+    rest = encode(fields)
+    head = b'{' + encode(key) + b':' + join_array(fragments)
+    return head + (b',' + rest[1:] if len(rest) > 2 else b'}')
+
+
+def json_response(body, status=200, mimetype='application/json'):
+    """Hazır JSON gövdesinden Flask yanıtı oluşturur."""
+    return current_app.response_class(body, status=status, mimetype=mimetype)
+
+
+def _batched(chunks):
+    batch = []
+    size = 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_BATCH_BYTES:
+            yield b''.join(batch)
+            batch = []
+            size = 0
+    if batch:
+        yield b''.join(batch)
+
+
+def _gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip başlığı ve sonu
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_envelope(key, fragments, **fields):
+    """``envelope`` ile aynı gövdeyi, parçaları tek tek üreterek akıtır."""
+    rest = encode(fields)
+    yield b'{' + encode(key) + b':['
+    first = True
+    for fragment in fragments:
+        yield fragment if first else b',' + fragment
+        first = False
+    yield b']' + (b',' + rest[1:] if len(rest) > 2 else b'}')
+
+
+def stream_lines(fragments):
+    """Parçaları satır başına bir JSON kaydı (NDJSON) olarak akıtır."""
+    for fragment in fragments:
+        yield fragment + b'\n'
+
+
+def streaming_response(chunks, mimetype='application/json'):
+    """Üreteçten akan yanıt; istemci kabul ediyorsa gzip ile sıkıştırılır.
+
+    ``direct_passthrough`` sayesinde yanıt önbelleği gövdeyi okuyup
+    saklamaya çalışmaz.
+    """
+    chunks = _batched(chunks)
+    gzip_accepted = request.accept_encodings['gzip'] > 0
+    if gzip_accepted:
+        chunks = _gzip_stream(chunks)
+    response = current_app.response_class(chunks, mimetype=mimetype, direct_passthrough=True)
+    if gzip_accepted:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
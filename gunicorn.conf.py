@@ -0,0 +1,9 @@
+"""gunicorn ayarları; ``gunicorn server:app`` bu dosyayı çalışma dizininden kendiliğinden yükler."""
+import sys
+
+
+def worker_exit(server, worker):
+    """İşçi kapanırken toplu scrape kuyruğunu durdurur (bkz. ``ScrapeJobQueue.shutdown``)."""
+    app_module = sys.modules.get('server')
+    if app_module is not None:
+        app_module.scrape_jobs.shutdown()
@@ -0,0 +1,280 @@
+"""İstek aşamalarının süre ölçümü: ``Server-Timing`` başlığı ve Prometheus ``/metrics`` çıktısı.
+
+Bir istek sırasında ``with stage('filter'):`` bloklarında geçen süre o
+aşamaya yazılır; aşamalar iç içe girerse süre en içteki aşamaya sayılır
+(dıştaki o sırada durur), böylece aşamaların toplamı isteğin süresini
+aşmaz. Etkin bir istek yoksa (ör. arka plan işçileri) ``stage`` hiçbir şey
+yapmaz; bu yüzden katalog ve çıkarıcı modülleri Flask'e bağlı kalmadan
+aşama işaretleyebilir.
+
+İstek bitince aşamalar ``Server-Timing`` başlığına eklenir ve uç nokta ile
+aşama başına HDR tarzı histogramlara işlenir. Histogramlar işçi sürecine
+özeldir: gunicorn'da ``/metrics`` isteği karşılayan işçinin değerlerini
+döndürür.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, request
+
+# Her ikinin kuvveti aralığı 2**(SUB_BUCKET_BITS - 1) kovaya bölünür (göreli hata < %1,6)
+SUB_BUCKET_BITS = 7
+# Bu süreden (mikrosaniye, ~1 saat) uzun ölçümler en üst kovaya yazılır
+MAX_TRACKABLE_US = 2 ** 32
+
+# Prometheus histogramı için sabit kova sınırları (saniye)
+PROMETHEUS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+METRIC_PREFIX = 'macfreeapps_request_stage_seconds'
+
+_current_timer = contextvars.ContextVar('request_timer', default=None)
+
+
+def _bucket_index(value):
+    if value < 1 << SUB_BUCKET_BITS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def _bucket_bounds(index):
+    """Kovanın ``[alt, üst)`` sınırları (mikrosaniye)."""
+    if index < 1 << SUB_BUCKET_BITS:
+        return index, index + 1
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    sub_bucket = index - (shift << (SUB_BUCKET_BITS - 1))
+    return sub_bucket << shift, (sub_bucket + 1) << shift
+
+
+class Histogram:
+    """Log-doğrusal kovalı (HDR tarzı) süre histogramı.
+
+    Süreler mikrosaniyeye yuvarlanıp sabit boyutlu bir sayaç dizisine
+    yazılır; kayıt O(1)'dir ve bellek ölçüm sayısından bağımsızdır.
+    Yüzdelikler kova çözünürlüğü kadar (en fazla %1,6) yaklaşıktır.
+    """
+
+    def __init__(self):
+        self._counts = [0] * (_bucket_index(MAX_TRACKABLE_US) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        index = _bucket_index(min(max(int(seconds * 1_000_000), 0), MAX_TRACKABLE_US))
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+
+    def snapshot(self):
+        """``(dolu kovalar, sayı, toplam)``; dışa aktarım tek tutarlı görüntü üzerinden yapılır."""
+        with self._lock:
+            return [(index, count) for index, count in enumerate(self._counts) if count], self.count, self.total
+
+    def quantiles(self, quantiles=QUANTILES, state=None):
+        """``{yüzdelik: saniye}``; değer, yüzdeliğin düştüğü kovanın üst sınırıdır."""
+        buckets, count, _ = state or self.snapshot()
+        result = {}
+        if not count:
+            return result
+        seen = 0
+        position = iter(sorted(quantiles))
+        quantile = next(position, None)
+        for index, bucket_count in buckets:
+            seen += bucket_count
+            while quantile is not None and seen >= quantile * count:
+                result[quantile] = _bucket_bounds(index)[1] / 1_000_000
+                quantile = next(position, None)
+            if quantile is None:
+                break
+        return result
+
+    def cumulative(self, bounds=PROMETHEUS_BUCKETS, state=None):
+        """Her sınıra kadar (sınır dahil) düşen ölçüm sayısı.
+
+        Kova, üst sınırı da ``le`` sınırını aşmıyorsa sayılır; sınırı ortadan
+        bölen kova bir sonraki sınıra kalır, böylece ``le`` sayısı hiçbir
+        zaman sınırdan uzun bir ölçümü içermez.
+        """
+        buckets, _, _ = state or self.snapshot()
+        result = []
+        seen = 0
+        remaining = iter(buckets)
+        pending = next(remaining, None)
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while pending is not None and _bucket_bounds(pending[0])[1] <= limit:
+                seen += pending[1]
+                pending = next(remaining, None)
+            result.append(seen)
+        return result
+
+
+class RequestTimer:
+    """Tek bir isteğin aşama süreleri (yalnızca isteği işleyen iş parçacığı kullanır)."""
+
+    def __init__(self):
+        self.started = self._mark = time.perf_counter()
+        self.stages = {}
+        self._stack = []
+
+    def _charge(self, now):
+        if self._stack:
+            name = self._stack[-1]
+            self.stages[name] = self.stages.get(name, 0.0) + (now - self._mark)
+        self._mark = now
+
+    def enter(self, name):
+        self._charge(time.perf_counter())
+        self._stack.append(name)
+
+    def exit(self):
+        self._charge(time.perf_counter())
+        self._stack.pop()
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+@contextmanager
+def stage(name):
+    """Bloğun süresini etkin isteğin ``name`` aşamasına ekler; etkin istek yoksa etkisizdir."""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    timer.enter(name)
+    try:
+        yield
+    finally:
+        timer.exit()
+
+
+@contextmanager
+def collect_stages():
+    """İstek dışında (ör. ölçüm betiklerinde) ``stage`` sürelerini toplayan bir zamanlayıcı etkinleştirir."""
+    timer = RequestTimer()
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+    """Uç nokta ve aşama başına histogramlar; Flask uygulamasına istek kancalarıyla bağlanır.
+
+    Her istek ``total`` aşamasıyla ölçülür. Akıtılan yanıtların gövdesi
+    istek kancaları çalıştıktan sonra üretildiği için ``timed_stream`` ile
+    sarılan üretecin süresi (ör. ``serialize``) akış bitince yalnızca
+    histograma yazılır, ``Server-Timing`` başlığında yer almaz.
+    """
+
+    def __init__(self, app=None):
+        self._histograms = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._end_request)
+
+    def histogram(self, endpoint, stage_name):
+        key = (endpoint, stage_name)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def record(self, endpoint, stage_name, seconds):
+        self.histogram(endpoint, stage_name).record(seconds)
+
+    def _start_request(self):
+        _current_timer.set(RequestTimer())
+
+    def _finish_request(self, response):
+        timer = _current_timer.get()
+        if timer is None:
+            return response
+        total = timer.elapsed()
+        endpoint = request.endpoint
+        if endpoint:
+            for name, seconds in timer.stages.items():
+                self.record(endpoint, name, seconds)
+            self.record(endpoint, 'total', total)
+
+        timings = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in timer.stages.items()]
+        timings.append(f'total;dur={total * 1000:.2f}')
+        response.headers['Server-Timing'] = ', '.join(timings)
+        return response
+
+    def _end_request(self, exc=None):
+        _current_timer.set(None)
+
+    def timed_stream(self, chunks, stage_name):
+        """Üretecin her adımında geçen süreyi toplar; akış bitince etkin uç noktanın histogramına yazar.
+
+        Uç nokta hemen okunur; gövde istek bağlamı kapandıktan sonra akar.
+        """
+        return self._timed_chunks(chunks, request.endpoint, stage_name)
+
+    def _timed_chunks(self, chunks, endpoint, stage_name):
+        elapsed = 0.0
+        try:
+            iterator = iter(chunks)
+            while True:
+                started = time.perf_counter()
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - started
+                    break
+                elapsed += time.perf_counter() - started
+                yield chunk
+        finally:
+            if endpoint:
+                self.record(endpoint, stage_name, elapsed)
+
+    def render(self):
+        """Histogramları Prometheus metin biçiminde (``text/plain; version=0.0.4``) döndürür."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+
+        lines = [
+            f'# HELP {METRIC_PREFIX} İstek aşamalarının süresi (uç nokta ve aşama başına)',
+            f'# TYPE {METRIC_PREFIX} histogram',
+        ]
+        quantile_lines = [
+            f'# HELP {METRIC_PREFIX}_quantile HDR histogramından hesaplanan yüzdelikler (bu işçi)',
+            f'# TYPE {METRIC_PREFIX}_quantile gauge',
+        ]
+        for (endpoint, stage_name), histogram in histograms:
+            state = histogram.snapshot()
+            _, count, total = state
+            labels = f'endpoint="{_escape_label(endpoint)}",stage="{_escape_label(stage_name)}"'
+            for bound, seen in zip(PROMETHEUS_BUCKETS, histogram.cumulative(state=state)):
+                lines.append(f'{METRIC_PREFIX}_bucket{{{labels},le="{bound}"}} {seen}')
+            lines.append(f'{METRIC_PREFIX}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{METRIC_PREFIX}_sum{{{labels}}} {_format_number(total)}')
+            lines.append(f'{METRIC_PREFIX}_count{{{labels}}} {count}')
+            for quantile, value in histogram.quantiles(state=state).items():
+                quantile_lines.append(f'{METRIC_PREFIX}_quantile{{{labels},quantile="{quantile}"}} {_format_number(value)}')
+        return '\n'.join(lines + quantile_lines) + '\n'
+
+    def response(self):
+        return current_app.response_class(self.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
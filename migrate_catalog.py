@@ -0,0 +1,61 @@
+"""apps.json kataloğunu SQLite/FTS5 deposuna aktarır ya da depodan geri yazar.
+
+Kullanım::
+
+    python migrate_catalog.py                              # apps.json -> catalog.db
+    python migrate_catalog.py --source apps.json --target catalog.db
+    python migrate_catalog.py --export apps.export.json    # catalog.db -> JSON
+
+Kaynak dosya ``CatalogStore`` ile okunur, yani apps.json.journal günlüğünde
+bekleyen değişiklikler de aktarılır. Aktarımdan sonra her uygulama
+depodan geri okunup kaynakla karşılaştırılır. Sunucuyu yeni depoyla
+çalıştırmak için ``CATALOG_BACKEND=sqlite`` (ve gerekirse ``CATALOG_DB``)
+ayarlanır.
+"""
+import argparse
+import sys
+import time
+
+from catalog import CatalogStore
+from catalog_sqlite import SQLiteCatalogStore
+from categories import CATEGORY_HIERARCHY
+from storage import atomic_write_json
+
+
+def migrate(source, target):
+    apps = list(CatalogStore(source).snapshot())
+    store = SQLiteCatalogStore(target, category_hierarchy=CATEGORY_HIERARCHY)
+    started = time.perf_counter()
+    store.save(apps)
+    elapsed = time.perf_counter() - started
+
+    stored = store.snapshot()
+    mismatches = [app.get('name') for app, copy in zip(apps, stored) if dict(copy) != app]
+    print(f'{len(apps)} uygulama {target} dosyasına aktarıldı ({elapsed:.2f} sn)')
+    if len(stored) != len(apps) or mismatches:
+        print(f'HATA: depoda {len(stored)} uygulama var, {len(mismatches)} uygulama farklı: {mismatches[:5]}')
+        return 1
+    print('Doğrulama: tüm uygulamalar kaynakla aynı')
+    return 0
+
+
+def export(target, destination):
+    apps = [dict(app) for app in SQLiteCatalogStore(target, category_hierarchy=CATEGORY_HIERARCHY).snapshot()]
+    atomic_write_json(destination, apps)
+    print(f'{len(apps)} uygulama {destination} dosyasına yazıldı')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--source', default='apps.json', help='Aktarılacak JSON katalog')
+    parser.add_argument('--target', default='catalog.db', help='SQLite katalog dosyası')
+    parser.add_argument('--export', metavar='JSON', help='Depoyu bu JSON dosyasına geri yaz')
+    args = parser.parse_args()
+    if args.export:
+        return export(args.target, args.export)
+    return migrate(args.source, args.target)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""/api/apps için imleçli (keyset) sayfalama.
+
+İmleç, sayfanın ilk ya da son uygulamasının sıralama anahtarını taşıyan
+opak bir metindir (base64 ile kodlanmış JSON). Sonraki sayfa bu anahtardan
+sonra gelenlerle başladığı için başa eklenen yeni uygulamalar sayfaları
+kaydırmaz ve sayfanın yeri hazır sıralı görünümde ikili aramayla (SQLite
+deposunda indeksli sorguyla) bulunur. Alaka düzeyine göre sıralı arama
+sonuçlarının hazır anahtarı olmadığından onlar için imleç bir konum
+(offset) taşır.
+
+Anahtarlı sonuçlar ``key_at``, ``index_after`` ve ``index_before``
+yöntemlerini sağlar (``catalog_index.SortedView`` gibi).
+"""
+import base64
+import binascii
+import json
+
+
+class InvalidCursor(ValueError):
+    """İmleç çözülemedi ya da bu sorgunun sıralamasına ait değil."""
+
+
+def encode_cursor(direction, sort, position):
+    payload = json.dumps([direction, sort, position], ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort, keyed):
+    """İmleci ``(yön, konum)`` olarak çözer; konum anahtar listesi ya da offset'tir."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, cursor_sort, position = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidCursor('Geçersiz imleç')
+    if direction not in ('next', 'prev') or cursor_sort != sort:
+        raise InvalidCursor('İmleç bu sıralamaya ait değil')
+    if keyed:
+        valid = (isinstance(position, list) and len(position) == 2
+                 and isinstance(position[0], str if sort in ('name-asc', 'name-desc') else (int, float))
+                 and not isinstance(position[0], bool) and isinstance(position[1], str))
+    else:
+        valid = isinstance(position, int) and not isinstance(position, bool) and position >= 0
+    if not valid:
+        raise InvalidCursor('Geçersiz imleç')
+    return direction, position
+
+
+def keyset_page(results, sort, limit, cursor=None, start=0):
+    """İmleçten itibaren ``limit`` uygulamalık sayfayı döndürür.
+
+    Dönen değer ``(uygulamalar, başlangıç konumu, sonraki imleç, önceki imleç)``
+    dörtlüsüdür; sonraki/önceki sayfa yoksa imleç None olur. ``cursor``
+    verilmezse sayfa ``start`` konumundan (sayfa numarasıyla gelen
+    isteklerde) başlar.
+    """
+    keyed = hasattr(results, 'index_after')
+    total = len(results)
+    if cursor:
+        direction, position = decode_cursor(cursor, sort, keyed)
+        if keyed:
+            if direction == 'next':
+                start = results.index_after(position)
+            else:
+                start = max(results.index_before(position) - limit, 0)
+        else:
+            start = position if direction == 'next' else max(position - limit, 0)
+    start = min(max(start, 0), total)
+    end = min(max(start + limit, start), total)
+    page = results[start:end]
+
+    def cursor_at(direction, index):
+        return encode_cursor(direction, sort, results.key_at(index) if keyed else index)
+
+    next_cursor = cursor_at('next', end - 1 if keyed else end) if start < end < total else None
+    # Sonuçların ötesindeki bir sayfada imleç alınacak uygulama yoktur
+    prev_cursor = cursor_at('prev', start) if 0 < start < total else None
+    return page, start, next_cursor, prev_cursor
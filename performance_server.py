@@ -1,5 +1,5 @@
 # MacFreeApps Performance Enhanced Server
-from flask import Flask, jsonify, request, send_from_directory, send_file
+from flask import Flask, g, jsonify, request, send_from_directory, send_file
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -11,40 +11,37 @@ import gzip
 from functools import wraps
 from datetime import datetime, timedelta
 import threading
-import sqlite3
 from werkzeug.middleware.proxy_fix import ProxyFix
 
+from compression import MIN_COMPRESS_SIZE, EncodedBodyCache, StaticAssets, precompressed_response, supported_encodings
+from storage import atomic_write_json, file_identity
+from shared_state import SharedGeneration  # Also registers the sqlite:// limiter storage
+from tiered_cache import HitCounters, TieredCache
+
 app = Flask(__name__)
+app.start_time = time.time()  # Set at import so /health reports uptime under gunicorn too
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_port=1, x_prefix=1)
 CORS(app)
 
 # Rate Limiting Configuration
+# Counters live in a WAL-mode SQLite file so every gunicorn worker enforces the same limits
 limiter = Limiter(
     app,
     key_func=get_remote_address,
     default_limits=["1000 per hour", "100 per minute"],
-    storage_uri="memory://"
+    storage_uri=os.environ.get('RATELIMIT_STORAGE_URI', 'sqlite://limits.db')
 )
 
 # Cache Configuration
 CACHE_DURATION = 300  # 5 minutes
-MEMORY_CACHE = {}
-CACHE_LOCK = threading.Lock()
-
-# Database for persistent caching
-def init_cache_db():
-    conn = sqlite3.connect('cache.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS cache (
-            key TEXT PRIMARY KEY,
-            value TEXT,
-            expires_at REAL,
-            created_at REAL
-        )
-    ''')
-    conn.commit()
-    conn.close()
+CACHE_MEMORY_BYTES = int(os.environ.get('CACHE_MEMORY_BYTES', 32 * 1024 * 1024))
+
+# Memory tier (LRU/TTL, byte budget) in front of the persistent cache.db tier, which all
+# workers share; the mmap'd generation counter tells them when to drop their memory tier
+cache = TieredCache('cache.db', max_bytes=CACHE_MEMORY_BYTES, default_ttl=CACHE_DURATION,
+                    generation=SharedGeneration('cache.generation'))
+# Response cache hits/misses per endpoint (either caching decorator), counted in after_request
+endpoint_cache_stats = HitCounters()
 
 # Cache functions
 def get_cache_key(*args, **kwargs):
@@ -54,63 +51,40 @@ def get_cache_key(*args, **kwargs):
 
 def get_from_cache(key):
     """Get value from cache"""
-    with CACHE_LOCK:
-        # Check memory cache first
-        if key in MEMORY_CACHE:
-            data, expires_at = MEMORY_CACHE[key]
-            if time.time() < expires_at:
-                return data
-            else:
-                del MEMORY_CACHE[key]
-        
-        # Check database cache
-        conn = sqlite3.connect('cache.db')
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT value FROM cache WHERE key = ? AND expires_at > ?',
-            (key, time.time())
-        )
-        result = cursor.fetchone()
-        conn.close()
-        
-        if result:
-            data = json.loads(result[0])
-            # Store in memory cache for faster access
-            with CACHE_LOCK:
-                MEMORY_CACHE[key] = (data, time.time() + CACHE_DURATION)
-            return data
-    
-    return None
+    return cache.get(key)
 
 def set_cache(key, value, duration=CACHE_DURATION):
     """Set value in cache"""
-    expires_at = time.time() + duration
-    
-    with CACHE_LOCK:
-        # Store in memory cache
-        MEMORY_CACHE[key] = (value, expires_at)
-    
-    # Store in database cache
-    conn = sqlite3.connect('cache.db')
-    cursor = conn.cursor()
-    cursor.execute(
-        'INSERT OR REPLACE INTO cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)',
-        (key, json.dumps(value), expires_at, time.time())
-    )
-    conn.commit()
-    conn.close()
+    cache.set(key, value, duration)
+
+def catalog_version():
+    """apps.json identity (inode, size, mtime); changes on every save"""
+    return file_identity('apps.json')
+
+# Compressed variants of static assets are built once at startup; JSON bodies
+# are compressed once per catalog version
+static_assets = StaticAssets('.')
+static_assets.warm()
+json_bodies = EncodedBodyCache()
+precompressed_catalog = precompressed_response(json_bodies, catalog_version)
 
 def cache_response(duration=CACHE_DURATION):
     """Decorator for caching API responses"""
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            cache_key = get_cache_key(f.__name__, args, kwargs)
+            # Keyed by catalog version so a save never serves the old response again
+            cache_key = get_cache_key(f.__name__, args, kwargs, catalog_version())
+            lookup_start = time.perf_counter()
             cached_result = get_from_cache(cache_key)
+            # Read by after_request for the X-Cache and Server-Timing headers
+            g.cache_lookup_ms = (time.perf_counter() - lookup_start) * 1000
             
             if cached_result is not None:
+                g.cache_status = 'HIT'
                 return jsonify(cached_result)
             
+            g.cache_status = 'MISS'
             result = f(*args, **kwargs)
             if hasattr(result, 'get_json'):
                 result_data = result.get_json()
@@ -126,11 +100,15 @@ def cache_response(duration=CACHE_DURATION):
 @app.after_request
 def after_request(response):
     """Add compression and caching headers"""
-    # Add compression
-    if response.content_length and response.content_length > 1024:
+    # Compress dynamic responses that were not served from a precompressed body
+    if (response.content_length and response.content_length > MIN_COMPRESS_SIZE
+            and not response.direct_passthrough
+            and 'Content-Encoding' not in response.headers
+            and request.accept_encodings['gzip']):
         response.data = gzip.compress(response.data)
         response.headers['Content-Encoding'] = 'gzip'
         response.headers['Content-Length'] = len(response.data)
+        response.vary.add('Accept-Encoding')
     
     # Add caching headers
     if request.endpoint in ['static', 'get_apps', 'get_categories']:
@@ -148,20 +126,27 @@ def after_request(response):
     
     # Add performance headers
     response.headers['X-Powered-By'] = 'MacFreeApps'
-    response.headers['X-Cache'] = 'HIT' if get_from_cache(get_cache_key(request.endpoint, request.args)) else 'MISS'
+    # Set by the caching decorators; endpoints without a cache get no X-Cache header
+    if 'cache_status' in g:
+        response.headers['X-Cache'] = g.cache_status
+        endpoint_cache_stats.record(request.endpoint, g.cache_status == 'HIT')
     
     return response
 
 # Performance monitoring
 @app.before_request
 def before_request():
-    request.start_time = time.time()
+    request.start_time = time.perf_counter()
 
 @app.after_request
 def after_request_performance(response):
     if hasattr(request, 'start_time'):
-        duration = time.time() - request.start_time
+        duration = time.perf_counter() - request.start_time
         response.headers['X-Response-Time'] = f"{duration:.3f}s"
+        timings = [f"total;dur={duration * 1000:.2f}"]
+        if 'cache_status' in g:
+            timings.insert(0, f'cache;desc="{g.cache_status}";dur={g.cache_lookup_ms:.2f}')
+        response.headers['Server-Timing'] = ', '.join(timings)
         
         # Log slow requests
         if duration > 1.0:  # Slower than 1 second
@@ -171,7 +156,8 @@ def after_request_performance(response):
 
 # Load apps data with caching
 def load_apps_cached():
-    cache_key = 'apps_data'
+    # Keyed by apps.json identity: a save in any worker switches every worker to a new key
+    cache_key = f"apps_data_{catalog_version()}"
     cached_data = get_from_cache(cache_key)
     
     if cached_data:
@@ -185,20 +171,31 @@ def load_apps_cached():
     except FileNotFoundError:
         return {"apps": [], "categories": []}
 
+# id -> app, rebuilt once per catalog version instead of scanning the list on every request
+_app_id_index = {"version": None, "apps": {}}
+_app_id_index_lock = threading.Lock()
+
+def find_app_by_id(app_id):
+    version = catalog_version()
+    with _app_id_index_lock:
+        if _app_id_index["version"] != version:
+            apps_by_id = {}
+            for app in load_apps_cached().get('apps', []):
+                apps_by_id.setdefault(app.get('id'), app)  # First match wins, as with the old scan
+            _app_id_index["apps"] = apps_by_id
+            _app_id_index["version"] = version
+        return _app_id_index["apps"].get(app_id)
+
 # Save apps data
 def save_apps(data):
-    with open('apps.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    # Invalidate cache
-    cache_key = 'apps_data'
-    with CACHE_LOCK:
-        if cache_key in MEMORY_CACHE:
-            del MEMORY_CACHE[cache_key]
+    # Write to a temp file, fsync and rename so readers never see a truncated file
+    atomic_write_json('apps.json', data, indent=2)
+    # No explicit invalidation: the new file identity changes every catalog cache key
 
 # API Routes with caching and rate limiting
 @app.route('/api/apps')
 @limiter.limit("100 per minute")
+@precompressed_catalog
 @cache_response(300)  # Cache for 5 minutes
 def get_apps():
     """Get all apps with caching"""
@@ -210,12 +207,12 @@ def get_apps():
 
 @app.route('/api/apps/<int:app_id>')
 @limiter.limit("200 per minute")
+@precompressed_catalog
 @cache_response(60)  # Cache for 1 minute
 def get_app(app_id):
     """Get specific app by ID"""
     try:
-        data = load_apps_cached()
-        app = next((app for app in data.get('apps', []) if app.get('id') == app_id), None)
+        app = find_app_by_id(app_id)
         
         if app:
             return jsonify(app)
@@ -226,6 +223,7 @@ def get_app(app_id):
 
 @app.route('/api/categories')
 @limiter.limit("50 per minute")
+@precompressed_catalog
 @cache_response(600)  # Cache for 10 minutes
 def get_categories():
     """Get all categories"""
@@ -329,16 +327,19 @@ def scrape_url():
 @app.route('/')
 def index():
     """Serve index.html with caching"""
-    return send_file('index.html')
+    return static_assets.response('index.html') or send_file('index.html')
 
 @app.route('/admin.html')
 def admin():
     """Serve admin.html"""
-    return send_file('admin.html')
+    return static_assets.response('admin.html') or send_file('admin.html')
 
 @app.route('/<path:filename>')
 def static_files(filename):
     """Serve static files with appropriate caching"""
+    precompressed = static_assets.response(filename)
+    if precompressed is not None:
+        return precompressed
     if filename.endswith(('.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')):
         return send_from_directory('.', filename)
     return send_file(filename)
@@ -346,12 +347,12 @@ def static_files(filename):
 # Health check endpoint
 @app.route('/health')
 def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (constant time: no cache or database scan)"""
     return jsonify({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "cache_size": len(MEMORY_CACHE),
-        "uptime": time.time() - app.start_time if hasattr(app, 'start_time') else 0
+        "cache_size": len(cache),
+        "uptime": time.time() - app.start_time
     })
 
 # Cache management endpoints
@@ -360,15 +361,7 @@ def health_check():
 def clear_cache():
     """Clear all caches"""
     try:
-        with CACHE_LOCK:
-            MEMORY_CACHE.clear()
-        
-        # Clear database cache
-        conn = sqlite3.connect('cache.db')
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM cache')
-        conn.commit()
-        conn.close()
+        cache.clear()
         
         return jsonify({"message": "Cache cleared"})
     except Exception as e:
@@ -377,18 +370,17 @@ def clear_cache():
 @app.route('/api/cache/stats')
 @limiter.limit("20 per minute")
 def cache_stats():
-    """Get cache statistics"""
+    """Get cache statistics from running counters (memory and endpoint counts are per worker)"""
     try:
-        conn = sqlite3.connect('cache.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM cache')
-        db_cache_count = cursor.fetchone()[0]
-        conn.close()
-        
+        stats = cache.stats()
+        database_entries, database_bytes = cache.db_totals()
         return jsonify({
-            "memory_cache_size": len(MEMORY_CACHE),
-            "database_cache_size": db_cache_count,
-            "total_memory_usage": sum(len(str(v)) for v in MEMORY_CACHE.values())
+            "memory_cache_size": stats["memory_entries"],
+            "database_cache_size": database_entries,
+            "database_bytes": database_bytes,
+            "total_memory_usage": stats["memory_bytes"],
+            "endpoints": endpoint_cache_stats.snapshot(),
+            **stats
         })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -408,18 +400,11 @@ def internal_error_handler(e):
 
 # Initialize
 if __name__ == '__main__':
-    app.start_time = time.time()
-    init_cache_db()
-    
     # Start cache cleanup thread
     def cleanup_cache():
         while True:
             time.sleep(3600)  # Run every hour
-            conn = sqlite3.connect('cache.db')
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM cache WHERE expires_at < ?', (time.time(),))
-            conn.commit()
-            conn.close()
+            cache.purge_expired()
     
     cleanup_thread = threading.Thread(target=cleanup_cache, daemon=True)
     cleanup_thread.start()
@@ -428,7 +413,7 @@ if __name__ == '__main__':
     print("📊 Features enabled:")
     print("  ✅ Rate Limiting")
     print("  ✅ Memory + Database Caching")
-    print("  ✅ Gzip Compression")
+    print(f"  ✅ Precompressed Assets ({'/'.join(supported_encodings())})")
     print("  ✅ Security Headers")
     print("  ✅ Performance Monitoring")
     print("  ✅ Cache Management")
@@ -0,0 +1,73 @@
+"""Katalog uç noktaları için sürüme bağlı yanıt önbelleği ve ETag/304 desteği."""
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import make_response, request
+
+
+class ResponseCache:
+    """Hazır yanıt gövdelerini katalog sürümüyle birlikte saklar.
+
+    Katalog sürümü değiştiğinde (her kayıt ya da başka bir işçinin yazması
+    sonrası yeniden yükleme) önbellek bütünüyle boşaltılır. Girdi sayısı
+    ``max_entries`` ile sınırlıdır; en az kullanılan girdi atılır.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, version, entry):
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def cached_response(cache, version_func):
+    """GET yanıtlarını uç nokta, sorgu parametreleri ve katalog sürümüne göre önbelleğe alır.
+
+    Yanıtlar gövdenin SHA-1 özetinden üretilen güçlü bir ETag taşır; aynı
+    veri her işçide aynı ETag'i verir. ``If-None-Match`` eşleşirse gövde
+    gönderilmeden 304 döner.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            version = version_func()
+            key = (request.endpoint, tuple(sorted(kwargs.items())), tuple(sorted(request.args.items(multi=True))))
+            entry = cache.get(key, version)
+            if entry is None:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                body = response.get_data()
+                entry = (body, response.mimetype, hashlib.sha1(body).hexdigest())
+                cache.set(key, version, entry)
+
+            body, mimetype, etag = entry
+            response = make_response(body)
+            response.mimetype = mimetype
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'  # Her kullanımda ETag ile doğrula
+            return response.make_conditional(request)
+        return decorated_function
+    return decorator
@@ -0,0 +1,135 @@
+"""Scrape sonuçları için URL anahtarlı, koşullu istekle doğrulanan kalıcı önbellek."""
+import json
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+SCRAPE_CACHE_PATH = os.environ.get('SCRAPE_CACHE_PATH', 'scrape_cache.db')
+# Bu süre içinde sonuç ağa hiç gidilmeden kullanılır (0: her seferinde doğrula)
+SCRAPE_CACHE_FRESH_TTL = int(os.environ.get('SCRAPE_CACHE_FRESH_TTL', 600))
+# Son doğrulamadan bu kadar süre geçen kayıt kullanılmaz, sayfa baştan indirilir
+SCRAPE_CACHE_MAX_AGE = int(os.environ.get('SCRAPE_CACHE_MAX_AGE', 7 * 24 * 3600))
+# Saklanan sonuçların toplam boyutu; aşılırsa en uzun süredir kullanılmayanlar silinir
+SCRAPE_CACHE_MAX_BYTES = int(os.environ.get('SCRAPE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+
+CachedScrape = namedtuple('CachedScrape', ['data', 'etag', 'last_modified', 'validated_at'])
+
+
+class ScrapeCache:
+    """Çıkarılmış uygulama bilgilerini sayfanın ETag/Last-Modified değerleriyle saklar.
+
+    Kayıt ``fresh_ttl`` içindeyse doğrudan kullanılır. Daha eskiyse sayfa
+    ``If-None-Match``/``If-Modified-Since`` ile istenir; sunucu 304 dönerse
+    sayfa indirilmez ve ayrıştırılmaz, kayıt yeniden doğrulanmış sayılır.
+    SQLite dosyası gunicorn işçileri arasında paylaşılır ve yeniden
+    başlatmalarda korunur. Veritabanı hataları scrape işlemini durdurmaz;
+    önbellek yokmuş gibi davranılır.
+    """
+
+    def __init__(self, path=SCRAPE_CACHE_PATH, fresh_ttl=SCRAPE_CACHE_FRESH_TTL,
+                 max_age=SCRAPE_CACHE_MAX_AGE, max_bytes=SCRAPE_CACHE_MAX_BYTES):
+        self.path = path
+        self.fresh_ttl = fresh_ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._initialized = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scrape_cache (
+                    url TEXT PRIMARY KEY,
+                    data TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER,
+                    validated_at REAL,
+                    accessed_at REAL
+                )
+            ''')
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, url):
+        """URL için kullanılabilir kaydı döndürür; yoksa ya da çok eskiyse None."""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    'SELECT data, etag, last_modified, validated_at FROM scrape_cache WHERE url = ? AND validated_at > ?',
+                    (url, now - self.max_age)
+                ).fetchone()
+                if row:
+                    conn.execute('UPDATE scrape_cache SET accessed_at = ? WHERE url = ?', (now, url))
+                    conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Scrape önbelleği okunamadı: {e}")
+            return None
+        if not row:
+            return None
+        return CachedScrape(json.loads(row[0]), row[1], row[2], row[3])
+
+    def is_fresh(self, entry):
+        return time.time() - entry.validated_at < self.fresh_ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Kaydın doğrulayıcılarından koşullu istek başlıklarını üretir."""
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def revalidated(self, url):
+        """Sunucu 304 döndüğünde kaydın doğrulama zamanını yeniler."""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                conn.execute('UPDATE scrape_cache SET validated_at = ?, accessed_at = ? WHERE url = ?', (now, now, url))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Scrape önbelleği güncellenemedi: {e}")
+
+    def set(self, url, data, etag=None, last_modified=None):
+        """Yeni çıkarılan sonucu saklar ve boyut sınırını uygular."""
+        now = time.time()
+        value = json.dumps(data, ensure_ascii=False)
+        size = len(value.encode('utf-8'))
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO scrape_cache (url, data, etag, last_modified, size, validated_at, accessed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (url, value, etag, last_modified, size, now, now)
+                )
+                self._evict(conn, now)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"Scrape önbelleğine yazılamadı: {e}")
+
+    def _evict(self, conn, now):
+        conn.execute('DELETE FROM scrape_cache WHERE validated_at <= ?', (now - self.max_age,))
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM scrape_cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute('SELECT url, size FROM scrape_cache ORDER BY accessed_at').fetchall()
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM scrape_cache WHERE url = ?', (url,))
+            total -= size
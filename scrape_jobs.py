@@ -0,0 +1,253 @@
+"""Toplu scrape işleri için sınırlı iş parçacığı havuzu ve dosya tabanlı iş durumu."""
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+SCRAPE_JOBS_DIR = os.environ.get('SCRAPE_JOBS_DIR', 'scrape_jobs')
+SCRAPE_BATCH_WORKERS = int(os.environ.get('SCRAPE_BATCH_WORKERS', 4))
+SCRAPE_BATCH_MAX_URLS = 500  # Tek bir işte en fazla URL
+SCRAPE_MAX_PENDING = 2000  # Kuyrukta bekleyebilecek toplam URL
+SCRAPE_JOB_TTL = 24 * 3600  # Tamamlanan iş kayıtları bu süreden sonra silinir
+
+
+ORPHANED_ERROR = 'İşi yürüten sunucu işçisi durdu, URL işlenmedi'
+SHUTDOWN_ERROR = 'Sunucu işçisi kapandı, URL işlenmedi'
+
+
+class QueueFullError(Exception):
+    """Kuyrukta yeni iş için yer kalmadığında yükseltilir."""
+
+
+def _process_token(pid):
+    """Sürecin başlangıç kimliği: açılış kimliği ve başlangıç zamanı; /proc yoksa None.
+
+    Pid'ler yeniden kullanılır; aynı pid'i alan yeni bir süreç farklı bir
+    kimlik taşır.
+    """
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read()
+        with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+            boot_id = f.read().strip()
+    except OSError:
+        return None
+    # Süreç adı boşluk ve parantez içerebilir; alanlar son ')' sonrasından sayılır (22. alan: starttime)
+    start_time = stat[stat.rindex(b')') + 2:].split()[19]
+    return f'{boot_id}:{int(start_time)}'
+
+
+_OWNER_TOKEN = _process_token(os.getpid()) or uuid.uuid4().hex
+
+
+def _owner_alive(pid, token):
+    if pid == os.getpid():
+        return token is None or token == _OWNER_TOKEN
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Başka kullanıcının süreci: yaşıyor
+    if token is None:
+        return True
+    current = _process_token(pid)
+    return current is None or current == token
+
+
+class ScrapeJobQueue:
+    """URL listelerini arka planda, sınırlı sayıda iş parçacığıyla işler.
+
+    Her işin durumu ``<dizin>/<iş id>.jsonl`` dosyasında tutulur: ilk satır
+    iş başlığı, sonraki satırlar URL başına durum kayıtlarıdır. Kayıtlar
+    tek satırlık eklemelerle yazıldığı için gunicorn altında hangi işçiye
+    gelirse gelsin ``get`` aynı durumu okur.
+
+    Kuyruk ve iş parçacıkları işi alan işçi sürecindedir; başlık bu sürecin
+    pid'ini ve başlangıç kimliğini taşır. Süreç ölürse bitmemiş URL'ler
+    başka bir işçiye geçmez: her kuyruk açılışta (ve ``recover_orphaned``
+    ile) sahibi artık çalışmayan işlerin bekleyen URL'lerini başarısız
+    olarak işaretler, böylece iş sonsuza dek ``running`` kalmaz. Düzenli
+    kapanışta ``shutdown`` kuyruktakileri iptal edip aynısını hemen yapar.
+    """
+
+    def __init__(self, scrape_func, error_func=str, directory=SCRAPE_JOBS_DIR,
+                 max_workers=SCRAPE_BATCH_WORKERS, max_pending=SCRAPE_MAX_PENDING, job_ttl=SCRAPE_JOB_TTL):
+        self.scrape_func = scrape_func
+        self.error_func = error_func
+        self.directory = directory
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.job_ttl = job_ttl
+        self._executor = None
+        self._pending = 0
+        self._unfinished = {}  # Bu süreçte çalışan iş id -> bitmemiş URL sayısı
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Uzun satırlar birden çok write() ile yazılabilir
+        self.recover_orphaned()
+
+    def _path(self, job_id):
+        return os.path.join(self.directory, f'{job_id}.jsonl')
+
+    def _append(self, job_id, record):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._write_lock, open(self._path(job_id), 'a', encoding='utf-8') as f:
+            f.write(line)
+
+    def _remove_expired(self):
+        cutoff = time.time() - self.job_ttl
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if name.endswith('.jsonl') and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except FileNotFoundError:
+                continue
+
+    def submit(self, urls):
+        """İşi kuyruğa alır ve iş id'sini döndürür."""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            if self._pending + len(urls) > self.max_pending:
+                raise QueueFullError(f'Kuyrukta {self._pending} URL bekliyor, yeni iş alınamıyor')
+            self._pending += len(urls)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scrape-job')
+            executor = self._executor
+            job_id = uuid.uuid4().hex
+            self._unfinished[job_id] = len(urls)
+        self._remove_expired()
+
+        self._append(job_id, {
+            'id': job_id,
+            'urls': urls,
+            'owner': os.getpid(),
+            'ownerToken': _OWNER_TOKEN,
+            'createdAt': datetime.now(timezone.utc).isoformat()
+        })
+        for index, url in enumerate(urls):
+            executor.submit(self._run, job_id, index, url)
+        return job_id
+
+    def _run(self, job_id, index, url):
+        self._append(job_id, {'index': index, 'status': 'running'})
+        try:
+            record = {'index': index, 'status': 'done', 'result': self.scrape_func(url)}
+        except Exception as e:
+            record = {'index': index, 'status': 'failed', 'error': self.error_func(e)}
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._unfinished[job_id] -= 1
+                if not self._unfinished[job_id]:
+                    del self._unfinished[job_id]
+        self._append(job_id, record)
+
+    def shutdown(self):
+        """Kuyrukta bekleyen URL'leri iptal eder ve bu süreçteki işlerin bitmemiş URL'lerini başarısız yapar.
+
+        İş parçacıkları daemon değildir; yorumlayıcı kapanırken kuyruktaki
+        bütün URL'ler işlenene kadar beklenir ve ``atexit`` buna göre geç
+        kalır. Bu yüzden gunicorn işçisi ``worker_exit`` kancasından
+        (``gunicorn.conf.py``) çağırır. O an çalışan URL'ler bitince sonuçları
+        başarısız kaydının yerine geçer.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            job_ids = list(self._unfinished)
+        if executor is None:
+            return
+        executor.shutdown(wait=False, cancel_futures=True)
+        for job_id in job_ids:
+            self._fail_unfinished(job_id, SHUTDOWN_ERROR)
+
+    def _fail_unfinished(self, job_id, error):
+        state = self._read(job_id)
+        if state is None:
+            return 0
+        failed = 0
+        for index, item in enumerate(state[1]):
+            if item['status'] in ('queued', 'running'):
+                self._append(job_id, {'index': index, 'status': 'failed', 'error': error})
+                failed += 1
+        return failed
+
+    def recover_orphaned(self):
+        """Sahibi olan süreç artık çalışmayan işlerin bitmemiş URL'lerini başarısız yapar.
+
+        İşaretlenen URL sayısını döndürür.
+        """
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return 0
+        recovered = 0
+        for name in names:
+            if not name.endswith('.jsonl'):
+                continue
+            job_id = name[:-len('.jsonl')]
+            state = self._read(job_id)
+            if state is None:
+                continue
+            header = state[0]
+            owner = header.get('owner')
+            if owner is None or _owner_alive(owner, header.get('ownerToken')):
+                continue
+            recovered += self._fail_unfinished(job_id, ORPHANED_ERROR)
+        return recovered
+
+    def _read(self, job_id):
+        """``(başlık, URL başına durumlar)``; iş bulunamazsa None."""
+        try:
+            with open(self._path(job_id), 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return None
+        if not lines or not lines[0].endswith('\n'):
+            return None
+
+        header = json.loads(lines[0])
+        items = [{'url': url, 'status': 'queued'} for url in header['urls']]
+        for line in lines[1:]:
+            if not line.endswith('\n'):
+                break  # Yazılmakta olan satır
+            record = json.loads(line)
+            item = items[record['index']]
+            item['status'] = record['status']
+            if 'result' in record:
+                item['result'] = record['result']
+            if 'error' in record:
+                item['error'] = record['error']
+        return header, items
+
+    def get(self, job_id):
+        """İşin URL başına durumunu döndürür; iş bulunamazsa None."""
+        if not job_id.isalnum():
+            return None
+        state = self._read(job_id)
+        if state is None:
+            return None
+        header, items = state
+
+        counts = {}
+        for item in items:
+            counts[item['status']] = counts.get(item['status'], 0) + 1
+        finished = counts.get('done', 0) + counts.get('failed', 0)
+        if finished == len(items):
+            status = 'done'
+        elif finished or counts.get('running'):
+            status = 'running'
+        else:
+            status = 'queued'
+        return {
+            'id': header['id'],
+            'status': status,
+            'createdAt': header['createdAt'],
+            'total': len(items),
+            'completed': counts.get('done', 0),
+            'failed': counts.get('failed', 0),
+            'items': items
+        }
@@ -0,0 +1,102 @@
+"""Uygulama sayfaları için bağlantı havuzlu, host başına eşzamanlılık sınırlı indirme motoru."""
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en;q=0.8',
+    # requests yalnızca çözebildiği kodlamaları ister (brotli kuruluysa br dahil)
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Aynı host'a aynı anda en fazla bu kadar istek gider
+SCRAPE_MAX_PER_HOST = int(os.environ.get('SCRAPE_MAX_PER_HOST', 4))
+SCRAPE_TIMEOUT = 30
+
+
+def make_request_with_retry(url, max_retries=3, base_delay=2, session=None, timeout=SCRAPE_TIMEOUT, headers=None):
+    """Rate limiting ile karşılaştığında retry yapan request fonksiyonu
+
+    ``headers`` varsayılan başlıklara eklenir (ör. koşullu istek başlıkları).
+    """
+    http = session or requests
+    if session is None:
+        headers = dict(DEFAULT_HEADERS, **(headers or {}))  # Session kendi başlıklarını taşır
+
+    for attempt in range(max_retries):
+        try:
+            # Random delay ekle (1-3 saniye arası)
+            if attempt > 0:
+                delay = base_delay * (2 ** attempt) + random.uniform(0, 2)
+                print(f"Retry {attempt + 1}/{max_retries} - {delay:.1f} saniye bekleniyor...")
+                time.sleep(delay)
+
+            response = http.get(url, headers=headers, timeout=timeout)
+
+            # 429 hatası için özel kontrol
+            if response.status_code == 429:
+                if attempt < max_retries - 1:
+                    print(f"Rate limit (429) - {base_delay * (2 ** (attempt + 1))} saniye bekleniyor...")
+                    continue
+                else:
+                    raise requests.exceptions.HTTPError(f"429 Client Error: Too Many Requests - {max_retries} deneme sonrası başarısız")
+
+            # Diğer HTTP hataları
+            response.raise_for_status()
+            return response
+
+        except requests.exceptions.RequestException as e:
+            if attempt == max_retries - 1:
+                raise e
+            print(f"Request hatası (deneme {attempt + 1}/{max_retries}): {e}")
+            continue
+
+    raise requests.exceptions.RequestException(f"Tüm denemeler başarısız oldu")
+
+
+class ScrapeEngine:
+    """Paylaşılan keep-alive bağlantı havuzu ile sayfa indirir.
+
+    Her host için açık bağlantılar yeniden kullanılır (DNS, TCP ve TLS el
+    sıkışması bir kez ödenir). Host başına bir semafor aynı anda giden istek
+    sayısını ``max_per_host`` ile sınırlar; böylece apps.apple.com ve
+    mzstatic.com istekleri paralel çalışırken tek bir host'a yüklenilmez.
+    Yeniden deneme ve 429 davranışı ``make_request_with_retry`` ile aynıdır.
+    """
+
+    def __init__(self, max_per_host=SCRAPE_MAX_PER_HOST, timeout=SCRAPE_TIMEOUT, max_retries=3):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(max_per_host, 10))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url):
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            semaphore = self._host_limits.get(host)
+            if semaphore is None:
+                semaphore = self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return semaphore
+
+    def fetch(self, url, headers=None):
+        """URL'yi havuzdaki bir bağlantıyla, host sınırına uyarak indirir."""
+        with self._host_limit(url):
+            return make_request_with_retry(url, max_retries=self.max_retries, session=self.session,
+                                           timeout=self.timeout, headers=headers)
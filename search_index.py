@@ -0,0 +1,140 @@
+"""Katalog araması için Türkçe uyumlu ters indeks (inverted index) ve BM25 sıralaması."""
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+# Alan ağırlıkları: isimde geçen terim açıklamada geçenden daha değerlidir
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'seoKeywords': 1.5,
+    'features': 1.0,
+    'description': 1.0,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r'\w+')
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+_DOTLESS_I = str.maketrans({'ı': 'i'})
+
+
+def casefold_tr(text):
+    """Metni Türkçe kurallarına göre küçültür ve aksanları kaldırır.
+
+    'İ' -> 'i', 'I' -> 'ı' dönüşümünden sonra harfler aksansız hale getirilir
+    (ş -> s, ğ -> g, ç -> c, ö -> o, ü -> u, ı -> i). Böylece 'İŞLEM',
+    'işlem' ve 'islem' aynı terime düşer.
+    """
+    text = text.translate(_TURKISH_UPPER).lower()
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return text.translate(_DOTLESS_I)
+
+
+def tokenize(text):
+    """Metni katlanmış (casefold) terimlere ayırır."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(casefold_tr(text))
+
+
+def _field_text(value):
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(item) for item in value)
+    return str(value) if value else ''
+
+
+class SearchIndex:
+    """Uygulama adı, açıklaması, özellikleri ve SEO anahtar kelimeleri üzerinde ters indeks.
+
+    Uygulamalar ``add``/``remove`` ile tek tek eklenip çıkarılır; sorgu
+    maliyeti katalog boyutuna değil, eşleşen terimlerin posting listelerine
+    bağlıdır.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._postings = {}  # terim -> {doc_id: ağırlıklı frekans}
+        self._doc_terms = {}  # doc_id -> terimler (silme için)
+        self._doc_lengths = {}
+        self._total_length = 0.0
+        self._vocabulary = []  # önek araması için sıralı terim listesi
+
+    def __len__(self):
+        return len(self._doc_lengths)
+
+    def add(self, doc_id, app):
+        frequencies = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(_field_text(app.get(field))):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+                length += weight
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._vocabulary, term)
+            postings[doc_id] = frequency
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id, app=None):
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+        self._total_length -= self._doc_lengths.pop(doc_id, 0.0)
+
+    def commit(self):
+        """İndeks yerinde güncellenir; toplu değişiklik sonunda yapılacak iş yoktur."""
+
+    def _expand(self, token):
+        """Sorgu parçasıyla başlayan tüm terimleri döndürür (yazarken arama için)."""
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, token)
+        terms = []
+        while i < len(vocabulary) and vocabulary[i].startswith(token):
+            terms.append(vocabulary[i])
+            i += 1
+        return terms
+
+    def search(self, query):
+        """Sorgudaki tüm parçaları içeren belgeleri BM25 puanına göre sıralar.
+
+        ``[(doc_id, puan), ...]`` döndürür. Her sorgu parçası önek olarak
+        eşleşir; aynı parçaya uyan birden çok terimden en yüksek puanlısı
+        sayılır.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self._doc_lengths:
+            return []
+
+        doc_count = len(self._doc_lengths)
+        average_length = self._total_length / doc_count or 1.0
+        scores = None
+        for token in tokens:
+            token_scores = {}
+            for term in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / average_length)
+                    score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: scores[doc_id] + score for doc_id, score in token_scores.items() if doc_id in scores}
+            if not scores:
+                return []
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
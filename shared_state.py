@@ -0,0 +1,123 @@
+"""Cross-worker state for performance_server.py: rate-limit counters and cache generation.
+
+Both live in local files so that every gunicorn worker on the host sees the
+same values without an external service such as Redis or memcached.
+"""
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+
+from limits.storage import Storage
+
+from storage import FileLock
+from tiered_cache import ConnectionPool
+
+_COUNTER = struct.Struct('<Q')
+
+
+class SharedGeneration:
+    """A 64-bit counter in a memory-mapped file, shared by every process on the host.
+
+    Reading is a single 8-byte load from the mapping (no syscall); ``bump``
+    serializes writers with an fcntl lock. Caches compare the value with the
+    one they last saw and drop their in-process tier when it has moved.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < _COUNTER.size:
+                os.ftruncate(fd, _COUNTER.size)
+            self._map = mmap.mmap(fd, _COUNTER.size)
+        finally:
+            os.close(fd)
+        self._lock_path = path + '.lock'
+
+    def value(self):
+        return _COUNTER.unpack_from(self._map, 0)[0]
+
+    def bump(self):
+        with FileLock(self._lock_path):
+            value = _COUNTER.unpack_from(self._map, 0)[0] + 1
+            _COUNTER.pack_into(self._map, 0, value)
+        return value
+
+
+class SQLiteLimiterStorage(Storage):
+    """Fixed-window rate-limit counters in a WAL-mode SQLite file.
+
+    Registered for the ``sqlite://`` scheme, e.g.
+    ``storage_uri="sqlite://limits.db"`` (relative) or
+    ``"sqlite:////var/lib/macfreeapps/limits.db"`` (absolute). Each hit is
+    one ``BEGIN IMMEDIATE`` upsert, so concurrent workers never lose
+    increments.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+    CLEANUP_EVERY = 1000  # Expired rows are deleted every N increments
+
+    def __init__(self, uri, wrap_exceptions=False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = uri[len('sqlite://'):] or 'limits.db'
+        self._pool = ConnectionPool(self.path, isolation_level=None)  # Transactions are explicit
+        self._increments = 0
+        self._counter_lock = threading.Lock()
+        with self._pool.connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS limits (key TEXT PRIMARY KEY, count INTEGER, expires_at REAL)')
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def incr(self, key, expiry, amount=1):
+        now = time.time()
+        with self._pool.connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute(
+                    'INSERT INTO limits (key, count, expires_at) VALUES (?, ?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET '
+                    'count = CASE WHEN expires_at <= ? THEN excluded.count ELSE count + excluded.count END, '
+                    'expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END',
+                    (key, amount, now + expiry, now, now)
+                )
+                count = conn.execute('SELECT count FROM limits WHERE key = ?', (key,)).fetchone()[0]
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+
+        with self._counter_lock:
+            self._increments += 1
+            cleanup = self._increments % self.CLEANUP_EVERY == 0
+        if cleanup:
+            with self._pool.connection() as conn:
+                conn.execute('DELETE FROM limits WHERE expires_at <= ?', (now,))
+        return count
+
+    def get(self, key):
+        with self._pool.connection() as conn:
+            row = conn.execute('SELECT count FROM limits WHERE key = ? AND expires_at > ?', (key, time.time())).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key):
+        with self._pool.connection() as conn:
+            row = conn.execute('SELECT expires_at FROM limits WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else time.time()
+
+    def check(self):
+        with self._pool.connection() as conn:
+            conn.execute('SELECT 1').fetchone()
+        return True
+
+    def reset(self):
+        with self._pool.connection() as conn:
+            return conn.execute('DELETE FROM limits').rowcount
+
+    def clear(self, key):
+        with self._pool.connection() as conn:
+            conn.execute('DELETE FROM limits WHERE key = ?', (key,))
@@ -0,0 +1,157 @@
+"""Katalog dosyaları için çökmeye dayanıklı yazma ve değişiklik günlüğü (journal)."""
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows: dosya kilidi yok, tek işçi varsayılır
+    fcntl = None
+
+
+def file_identity(path):
+    """Dosyanın (inode, boyut, mtime) kimliğini döndürür; yoksa None."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _fsync_directory(directory):
+    """Yeniden adlandırmanın diske işlenmesi için dizini fsync eder."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path, text):
+    """Metni geçici dosyaya yazar, fsync eder ve tek adımda yerine taşır.
+
+    Okuyucular ya eski dosyayı ya da yenisini görür; yarım yazılmış bir dosya
+    hiçbir zaman ``path`` altında görünmez.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def atomic_write_json(path, data, indent=4):
+    """JSON verisini ``atomic_write_text`` ile yazar."""
+    atomic_write_text(path, json.dumps(data, indent=indent, ensure_ascii=False))
+
+
+class FileLock:
+    """İşçiler (process) arası yazma kilidi; ``fcntl.flock`` üzerine kuruludur."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class Journal:
+    """Bir JSON dosyasına uygulanan değişikliklerin yalnızca eklemeli günlüğü.
+
+    İlk satır, günlüğün hangi ana dosya sürümüne ait olduğunu kaydeder
+    (``{"base": [inode, boyut, mtime]}``). Ana dosya yeniden yazıldığında ya da
+    elle değiştirildiğinde bu kimlik tutmaz ve eski günlük yok sayılır; böylece
+    sıkıştırma (compaction) sırasında bir çökme değişikliklerin iki kez
+    uygulanmasına yol açmaz.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def identity(self):
+        """Günlüğün (inode, boyut) bilgisini döndürür; yoksa None."""
+        identity = file_identity(self.path)
+        return identity[:2] if identity else None
+
+    def read(self, base_identity, offset=0):
+        """``offset``ten itibaren tamamlanmış kayıtları okur.
+
+        ``(kayıtlar, yeni_offset, geçerli)`` döndürür. Günlük yoksa ``offset``
+        None olur; başlığı yoksa ya da başka bir ana dosyaya aitse ``geçerli``
+        False olur ve kayıtlar yok sayılır. Yazılmakta olan ya da bir çökmeden
+        kalan yarım son satır okunmaz.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], None, False
+
+        records = []
+        position = offset
+        valid = offset > 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            if position == 0:
+                valid = json.loads(line).get('base') == list(base_identity or ())
+                if not valid:
+                    return [], offset + len(data), False
+            else:
+                records.append(json.loads(line))
+            position += len(line)
+        return (records, position, True) if valid else ([], position, False)
+
+    def reset(self, base_identity):
+        """Günlüğü ``base_identity`` için boş bir günlükle atomik olarak değiştirir."""
+        header = json.dumps({'base': list(base_identity)}) + '\n'
+        atomic_write_text(self.path, header)
+        return len(header.encode('utf-8'))
+
+    def append(self, record, offset):
+        """Kaydı ``offset`` konumuna yazar, fsync eder ve yeni boyutu döndürür.
+
+        ``offset`` son tam kaydın sonudur; bir çökmeden kalmış yarım satır
+        varsa üzerine yazılır.
+        """
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with open(self.path, 'r+b') as f:
+            f.seek(offset)
+            f.truncate()
+            f.write(line.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
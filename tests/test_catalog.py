@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+from catalog import CatalogStore
+from catalog_sqlite import SQLiteCatalogStore
+
+# Normalize edilmiş ismi aynı, birebir ismi farklı iki uygulama
+APPS = [{'name': '‎Çizim Stüdyosu '}, {'name': 'Çizim Stüdyosu'}, {'name': 'Not Defteri'}]
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        store = SQLiteCatalogStore(str(tmp_path / 'catalog.db'))
+        store.save(APPS)
+        return store
+    path = tmp_path / 'apps.json'
+    path.write_text(json.dumps(APPS, ensure_ascii=False), encoding='utf-8')
+    return CatalogStore(str(path))
+
+
+def test_has_name_checks_every_app_sharing_the_normalized_name(store):
+    assert store.has_name('Çizim Stüdyosu')
+    assert store.has_name('‎Çizim Stüdyosu ')
+    assert not store.has_name('Çizim Stüdyosu  ')
+    assert not store.has_name('Hesap Makinesi')
@@ -0,0 +1,21 @@
+import random
+
+from metrics import PROMETHEUS_BUCKETS, Histogram
+
+
+def test_cumulative_never_counts_a_sample_above_its_bound():
+    histogram = Histogram()
+    histogram.record(0.000499)
+    histogram.record(0.0005)
+    histogram.record(0.00051)
+    assert histogram.cumulative()[:2] == [1, 3]
+
+
+def test_cumulative_is_a_lower_bound_of_the_exact_counts():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(-6, 2) for _ in range(5000)]
+    histogram = Histogram()
+    for seconds in samples:
+        histogram.record(seconds)
+    for bound, seen in zip(PROMETHEUS_BUCKETS, histogram.cumulative()):
+        assert seen <= sum(seconds <= bound for seconds in samples)
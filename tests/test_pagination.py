@@ -0,0 +1,39 @@
+import json
+
+from catalog import CatalogStore
+from pagination import keyset_page
+
+
+def _store(tmp_path, count):
+    apps = [
+        {'name': f'Uygulama {i}', 'creationDate': f'2024-01-{i + 1:02d}T00:00:00+00:00'}
+        for i in range(count)
+    ]
+    path = tmp_path / 'apps.json'
+    path.write_text(json.dumps(apps, ensure_ascii=False), encoding='utf-8')
+    return CatalogStore(str(path))
+
+
+def test_page_past_the_end_is_empty(tmp_path):
+    store = _store(tmp_path, 5)
+    for sort in ('default', 'name-asc', 'name-desc'):
+        page, start, next_cursor, prev_cursor = keyset_page(store.query(sort=sort), sort, 2, start=10)
+        assert (page, start, next_cursor, prev_cursor) == ([], 5, None, None)
+
+
+def test_offset_page_past_the_end_is_empty():
+    page, start, next_cursor, prev_cursor = keyset_page(['a', 'b', 'c'], 'default', 2, start=4)
+    assert (page, start, next_cursor, prev_cursor) == ([], 3, None, None)
+
+
+def test_cursors_walk_every_page(tmp_path):
+    results = _store(tmp_path, 7).query(sort='name-asc')
+    seen = []
+    page, _, next_cursor, prev_cursor = keyset_page(results, 'name-asc', 3)
+    assert prev_cursor is None
+    seen += page
+    while next_cursor:
+        page, _, next_cursor, prev_cursor = keyset_page(results, 'name-asc', 3, cursor=next_cursor)
+        assert prev_cursor is not None
+        seen += page
+    assert seen == list(results)
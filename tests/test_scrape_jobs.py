@@ -0,0 +1,49 @@
+import json
+import os
+import threading
+
+import scrape_jobs
+from scrape_jobs import ORPHANED_ERROR, SHUTDOWN_ERROR, ScrapeJobQueue
+
+
+def test_shutdown_fails_queued_urls_and_keeps_running_results(tmp_path):
+    started, release = threading.Event(), threading.Event()
+
+    def scrape(url):
+        started.set()
+        release.wait()
+        return {'url': url}
+
+    queue = ScrapeJobQueue(scrape, directory=str(tmp_path), max_workers=1)
+    job_id = queue.submit(['a', 'b', 'c'])
+    assert started.wait(5)
+
+    queue.shutdown()
+    statuses = [item['status'] for item in queue.get(job_id)['items']]
+    assert statuses == ['failed', 'failed', 'failed']
+    assert queue.get(job_id)['items'][2]['error'] == SHUTDOWN_ERROR
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name.startswith('scrape-job'):
+            thread.join(5)
+    job = queue.get(job_id)
+    assert [item['status'] for item in job['items']] == ['done', 'failed', 'failed']
+
+
+def test_job_of_a_reused_pid_is_recovered(tmp_path):
+    header = {'id': 'eski', 'urls': ['a'], 'owner': os.getpid(),
+              'ownerToken': 'baska-surec', 'createdAt': '2026-01-01T00:00:00+00:00'}
+    (tmp_path / 'eski.jsonl').write_text(json.dumps(header) + '\n', encoding='utf-8')
+
+    queue = ScrapeJobQueue(str, directory=str(tmp_path))
+    item = queue.get('eski')['items'][0]
+    assert item == {'url': 'a', 'status': 'failed', 'error': ORPHANED_ERROR}
+
+
+def test_job_of_the_live_owner_is_left_running(tmp_path):
+    header = {'id': 'canli', 'urls': ['a'], 'owner': os.getpid(),
+              'ownerToken': scrape_jobs._OWNER_TOKEN, 'createdAt': '2026-01-01T00:00:00+00:00'}
+    (tmp_path / 'canli.jsonl').write_text(json.dumps(header) + '\n', encoding='utf-8')
+
+    assert ScrapeJobQueue(str, directory=str(tmp_path)).recover_orphaned() == 0
@@ -0,0 +1,119 @@
+import json
+import random
+import sqlite3
+import threading
+import time
+
+from tiered_cache import SQLiteStore, TieredCache
+
+THREADS = 16
+OPERATIONS = 200
+JOIN_TIMEOUT = 60  # saniye; kilitlenen bir iş parçacığı bu sürede bitmez
+
+
+def test_concurrent_get_set_delete_does_not_hang(tmp_path):
+    # Bütçe tek bir değerden bile küçük olabilir; okumaların çoğu SQLite'a
+    # düşüp belleğe geri taşınır (eskiden kilidi iki kez alan yol)
+    cache = TieredCache(str(tmp_path / 'cache.db'), max_bytes=512, default_ttl=60)
+    keys = [f'anahtar-{i}' for i in range(24)]
+    errors = []
+
+    def worker(seed):
+        rng = random.Random(seed)
+        try:
+            for i in range(OPERATIONS):
+                key = rng.choice(keys)
+                roll = rng.random()
+                if roll < 0.4:
+                    cache.set(key, {'i': i, 'veri': 'x' * rng.randrange(600)}, ttl=rng.choice((0.05, 60)))
+                elif roll < 0.9:
+                    cache.get(key)
+                else:
+                    cache.delete(key)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(seed,), daemon=True) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + JOIN_TIMEOUT
+    for thread in threads:
+        thread.join(max(deadline - time.monotonic(), 0))
+
+    assert not [thread.name for thread in threads if thread.is_alive()]
+    assert errors == []
+    stats = cache.stats()
+    assert stats['memory_bytes'] <= stats['memory_max_bytes']
+    assert stats['hits'] + stats['db_hits'] + stats['misses'] > 0
+
+
+class RacingStore(SQLiteStore):
+    """SQLite okuması ile belleğe taşıma arasında başka bir yazmayı araya sokar."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.during_read = None
+
+    def get(self, key, now):
+        row = super().get(key, now)
+        if self.during_read is not None:
+            callback, self.during_read = self.during_read, None
+            callback()
+        return row
+
+
+def _racing_cache(tmp_path):
+    store = RacingStore(str(tmp_path / 'cache.db'))
+    store.set('anahtar', json.dumps('eski'), time.time() + 60, time.time())  # Yalnızca SQLite katmanında
+    return TieredCache(store=store, default_ttl=60), store
+
+
+def test_delete_during_sqlite_read_is_not_undone(tmp_path):
+    cache, store = _racing_cache(tmp_path)
+    store.during_read = lambda: cache.delete('anahtar')
+    assert cache.get('anahtar') == 'eski'  # Okuma silmeden önce başladı
+    assert cache.get('anahtar') is None
+
+
+def test_set_during_sqlite_read_is_not_overwritten(tmp_path):
+    cache, store = _racing_cache(tmp_path)
+    store.during_read = lambda: cache.set('anahtar', 'yeni')
+    cache.get('anahtar')
+    assert cache.get('anahtar') == 'yeni'
+
+
+def test_clear_during_sqlite_read_is_not_undone(tmp_path):
+    cache, store = _racing_cache(tmp_path)
+    store.during_read = cache.clear
+    cache.get('anahtar')
+    assert cache.get('anahtar') is None
+
+
+def test_failed_connection_raises_in_every_batched_writer(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'cache.db'), pool_size=0)  # Havuz boş: her yazma bağlantı açar
+
+    def locked():
+        time.sleep(0.05)  # Diğer yazmalar bu sırada aynı gruba birikir
+        raise sqlite3.OperationalError('database is locked')
+
+    store._pool._open = locked
+    barrier = threading.Barrier(THREADS)
+    outcomes = []
+
+    def writer(i):
+        barrier.wait()
+        try:
+            store.set(f'anahtar-{i}', '"deger"', time.time() + 60, time.time())
+            outcomes.append(None)
+        except sqlite3.OperationalError as e:
+            outcomes.append(e)
+
+    threads = [threading.Thread(target=writer, args=(i,), daemon=True) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(JOIN_TIMEOUT)
+
+    assert len(outcomes) == THREADS
+    assert all(isinstance(outcome, sqlite3.OperationalError) for outcome in outcomes)
+    assert store.commits == 0
@@ -0,0 +1,444 @@
+"""Two-tier (memory + SQLite) cache used by performance_server.py."""
+import heapq
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class ConnectionPool:
+    """Small LIFO pool of WAL-mode SQLite connections.
+
+    A connection is handed to one thread at a time, so werkzeug's
+    thread-per-request server and gunicorn's thread workers both reuse open
+    connections (and their prepared-statement caches) instead of
+    reconnecting on every call.
+    """
+
+    def __init__(self, path, size=8, **connect_options):
+        self.path = path
+        self.size = size
+        self.connect_options = connect_options
+        self._idle = queue.LifoQueue()
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, cached_statements=64,
+                               **self.connect_options)
+        conn.execute('PRAGMA journal_mode=WAL')  # Readers never wait for the writer
+        conn.execute('PRAGMA synchronous=NORMAL')  # WAL stays consistent; a power loss can drop recent commits
+        return conn
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        broken = False
+        try:
+            yield conn
+        except BaseException:
+            broken = conn.in_transaction  # A failed rollback; never hand out a half-open transaction
+            raise
+        finally:
+            if not broken and self._idle.qsize() < self.size:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+
+class _PendingWrite:
+    __slots__ = ('sql', 'params', 'error')
+
+    def __init__(self, sql, params):
+        self.sql = sql
+        self.params = params
+        self.error = None
+
+
+class SQLiteStore:
+    """SQLite tier with pooled connections and group-committed writes.
+
+    Writes are queued; whichever thread finds no commit in progress takes
+    everything queued so far and commits it in a single transaction while
+    the others wait for it. Under concurrent ``set`` calls, many rows share
+    one transaction instead of paying one each. If that transaction fails,
+    every writer in the batch gets the ``sqlite3.Error``.
+
+    A write returns once its transaction has committed. With WAL and
+    ``synchronous=NORMAL`` that survives a process crash, but commits since
+    the last checkpoint can be lost on power failure; this is a cache, so
+    that is an accepted trade for not fsyncing every commit.
+
+    Row and byte totals are kept in ``cache_totals`` by triggers, in the
+    same transaction as the write, so ``totals`` is a single-row read that
+    is correct across every worker sharing the file.
+    """
+
+    def __init__(self, path='cache.db', pool_size=8):
+        self.path = path
+        self._pool = ConnectionPool(path, pool_size)
+        self._connection = self._pool.connection
+        self._write_cond = threading.Condition()
+        self._pending = []
+        self._enqueued = 0
+        self._committed = 0
+        self._flushing = False
+        self.commits = 0
+        with self._connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')  # Workers starting together must not both seed the totals
+            try:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS cache (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        expires_at REAL,
+                        created_at REAL
+                    )
+                ''')
+                conn.execute('CREATE TABLE IF NOT EXISTS cache_totals '
+                             '(id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, bytes INTEGER NOT NULL)')
+                conn.execute('CREATE TRIGGER IF NOT EXISTS cache_totals_insert AFTER INSERT ON cache BEGIN '
+                             'UPDATE cache_totals SET entries = entries + 1, bytes = bytes + length(new.value) WHERE id = 0; END')
+                conn.execute('CREATE TRIGGER IF NOT EXISTS cache_totals_update AFTER UPDATE OF value ON cache BEGIN '
+                             'UPDATE cache_totals SET bytes = bytes - length(old.value) + length(new.value) WHERE id = 0; END')
+                conn.execute('CREATE TRIGGER IF NOT EXISTS cache_totals_delete AFTER DELETE ON cache BEGIN '
+                             'UPDATE cache_totals SET entries = entries - 1, bytes = bytes - length(old.value) WHERE id = 0; END')
+                if conn.execute('SELECT 1 FROM cache_totals WHERE id = 0').fetchone() is None:
+                    # One full scan when the table is new or predates the triggers
+                    conn.execute('INSERT INTO cache_totals (id, entries, bytes) '
+                                 'SELECT 0, COUNT(*), COALESCE(SUM(length(value)), 0) FROM cache')
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def _write(self, sql, params=()):
+        with self._write_cond:
+            write = _PendingWrite(sql, params)
+            self._pending.append(write)
+            self._enqueued += 1
+            ticket = self._enqueued
+            while self._committed < ticket:
+                if self._flushing:
+                    self._write_cond.wait()
+                    continue
+                # Become the committer for everything queued so far
+                self._flushing = True
+                batch, self._pending = self._pending, []
+                upto = self._enqueued
+                self._write_cond.release()
+                try:
+                    self._commit(batch)
+                finally:
+                    self._write_cond.acquire()
+                    self._flushing = False
+                    self._committed = upto
+                    self._write_cond.notify_all()
+        if write.error is not None:
+            raise write.error
+
+    def _commit(self, batch):
+        # Any failure, including opening the connection or rolling back, belongs
+        # to every write in the batch: _write wakes them all once this returns
+        try:
+            with self._connection() as conn:
+                try:
+                    for write in batch:
+                        conn.execute(write.sql, write.params)
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+            self.commits += 1
+        except Exception as e:
+            for write in batch:
+                write.error = e
+
+    def get(self, key, now):
+        with self._connection() as conn:
+            return conn.execute('SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?', (key, now)).fetchone()
+
+    def set(self, key, text, expires_at, created_at):
+        # An upsert rather than INSERT OR REPLACE: REPLACE deletes without firing the delete trigger
+        self._write('INSERT INTO cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT(key) DO UPDATE SET value = excluded.value, '
+                    'expires_at = excluded.expires_at, created_at = excluded.created_at',
+                    (key, text, expires_at, created_at))
+
+    def delete(self, key):
+        self._write('DELETE FROM cache WHERE key = ?', (key,))
+
+    def clear(self):
+        self._write('DELETE FROM cache')
+
+    def purge(self, now):
+        self._write('DELETE FROM cache WHERE expires_at < ?', (now,))
+
+    def totals(self):
+        """``(entries, bytes)`` of the table, expired rows included until they are purged."""
+        with self._connection() as conn:
+            return conn.execute('SELECT entries, bytes FROM cache_totals WHERE id = 0').fetchone()
+
+    def count(self):
+        return self.totals()[0]
+
+
+class HitCounters:
+    """Per-endpoint cache hit/miss counts for this process.
+
+    ``record`` is a dict update under a lock and ``snapshot`` is linear in
+    the number of endpoints, never in the number of cached entries.
+    """
+
+    def __init__(self):
+        self._counts = {}  # name -> [hits, misses]
+        self._lock = threading.Lock()
+
+    def record(self, name, hit):
+        with self._lock:
+            counts = self._counts.get(name)
+            if counts is None:
+                counts = self._counts[name] = [0, 0]
+            counts[0 if hit else 1] += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = {name: tuple(value) for name, value in self._counts.items()}
+        return {
+            name: {"hits": hits, "misses": misses, "hit_ratio": _ratio(hits, hits + misses)}
+            for name, (hits, misses) in counts.items()
+        }
+
+
+def _ratio(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+# get() compares per-key write stamps before promoting a SQLite row; keys
+# share slots, so a collision only skips a promotion
+WRITE_STAMP_SLOTS = 256
+
+
+class TieredCache:
+    """LRU/TTL memory tier with a byte budget in front of a SQLite tier.
+
+    Values are stored as JSON; the size of the JSON text is what counts
+    against ``max_bytes``. The lock only guards the in-memory structures:
+    SQLite reads and writes always happen after it has been released, so a
+    slow disk never blocks other threads and no code path acquires the lock
+    twice. Expired entries are purged proactively on every write (via an
+    expiry heap) rather than only when they are read again.
+
+    With several worker processes, pass a shared ``generation`` counter
+    (e.g. ``shared_state.SharedGeneration``): ``delete`` and ``clear`` bump
+    it, and every worker drops its memory tier on its next call once it
+    sees the new value, so all workers keep serving the SQLite tier's view.
+
+    A SQLite row read by ``get`` is promoted into memory only if no
+    ``set``/``delete`` of that key or ``clear`` was in flight or started, and
+    the generation did not change, while the lock was released; otherwise a
+    stale row could undo the newer write in the memory tier until its TTL ran
+    out.
+    """
+
+    def __init__(self, db_path='cache.db', max_bytes=32 * 1024 * 1024, default_ttl=300, store=None,
+                 generation=None):
+        self.store = store or SQLiteStore(db_path)
+        self.generation = generation
+        self._seen_generation = generation.value() if generation is not None else None
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (value, expires_at, size)
+        self._expiry_heap = []  # (expires_at, key)
+        self._bytes = 0
+        self._epoch = 0  # Bumped whenever the memory tier is dropped
+        self._write_stamps = [0] * WRITE_STAMP_SLOTS
+        self._writes_in_flight = [0] * WRITE_STAMP_SLOTS
+        self._clears_in_flight = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- memory tier (caller holds the lock) ---
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _purge_expired(self, now):
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+                self.expirations += 1
+        # The heap keeps stale items for overwritten keys; rebuild when it drifts
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [(entry[1], key) for key, entry in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _write_stamp(self, key):
+        """Stamp to compare after a SQLite read; None while a write could still change the row."""
+        slot = hash(key) % WRITE_STAMP_SLOTS
+        if self._writes_in_flight[slot] or self._clears_in_flight:
+            return None
+        return self._epoch, self._write_stamps[slot]
+
+    def _begin_write(self, key):
+        slot = hash(key) % WRITE_STAMP_SLOTS
+        self._write_stamps[slot] += 1
+        self._writes_in_flight[slot] += 1
+
+    def _end_write(self, key):
+        slot = hash(key) % WRITE_STAMP_SLOTS
+        self._writes_in_flight[slot] -= 1
+        self._write_stamps[slot] += 1
+
+    def _drop_memory_tier(self):
+        self._epoch += 1
+        self._entries.clear()
+        self._expiry_heap = []
+        self._bytes = 0
+
+    def _sync_generation(self):
+        if self.generation is None:
+            return
+        current = self.generation.value()
+        if current != self._seen_generation:
+            self._drop_memory_tier()
+            self._seen_generation = current
+
+    def _store(self, key, value, expires_at, size, now):
+        if key in self._entries:
+            self._remove(key)
+        self._purge_expired(now)
+        if size > self.max_bytes:
+            return  # Too large for the memory tier; SQLite still has it
+        self._entries[key] = (value, expires_at, size)
+        self._bytes += size
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    # --- public API ---
+
+    def get(self, key):
+        """Return the cached value or None."""
+        now = time.time()
+        with self._lock:
+            self._sync_generation()
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._remove(key)
+                self.expirations += 1
+            stamp = self._write_stamp(key)
+
+        row = self.store.get(key, now)
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        text, expires_at = row
+        value = json.loads(text)
+        with self._lock:
+            self.db_hits += 1
+            self._sync_generation()
+            if stamp is not None and self._write_stamp(key) == stamp:
+                self._store(key, value, expires_at, len(text), now)
+        return value
+
+    def set(self, key, value, ttl=None):
+        """Store ``value`` in both tiers for ``ttl`` seconds."""
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        text = json.dumps(value)
+        with self._lock:
+            self._sync_generation()
+            self._begin_write(key)
+            self._store(key, value, expires_at, len(text), now)
+        try:
+            self.store.set(key, text, expires_at, now)
+        finally:
+            with self._lock:
+                self._end_write(key)
+
+    def delete(self, key):
+        with self._lock:
+            self._begin_write(key)
+            if key in self._entries:
+                self._remove(key)
+        try:
+            self.store.delete(key)
+        finally:
+            with self._lock:
+                self._end_write(key)
+        self._bump_generation()
+
+    def clear(self):
+        with self._lock:
+            self._drop_memory_tier()
+            self._clears_in_flight += 1
+        try:
+            self.store.clear()
+        finally:
+            with self._lock:
+                self._clears_in_flight -= 1
+                self._epoch += 1
+        self._bump_generation()
+
+    def _bump_generation(self):
+        # Other workers drop their memory tier once they see the new value
+        if self.generation is not None:
+            value = self.generation.bump()
+            with self._lock:
+                if self._seen_generation != value - 1:
+                    self._drop_memory_tier()  # Another worker bumped it first
+                self._seen_generation = value
+
+    def purge_expired(self):
+        """Drop expired entries from both tiers (used by the cleanup thread)."""
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+        self.store.purge(now)
+
+    def db_size(self):
+        return self.store.count()
+
+    def db_totals(self):
+        """``(entries, bytes)`` of the SQLite tier, shared by all workers."""
+        return self.store.totals()
+
+    def stats(self):
+        """Running counters of this process's memory tier; no entry is visited."""
+        with self._lock:
+            lookups = self.hits + self.db_hits + self.misses
+            return {
+                "memory_entries": len(self._entries),
+                "memory_bytes": self._bytes,
+                "memory_max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_ratio": _ratio(self.hits + self.db_hits, lookups),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }